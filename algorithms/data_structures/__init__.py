@@ -0,0 +1,11 @@
+"""
+Data structures built on the sorting toolkit.
+
+``sorted_list`` holds ``SortedList``, an order-statistic sorted container
+for data that changes continuously, like leaderboards: each insert or
+delete keeps it ordered in O(log n) instead of a full re-sort.
+"""
+
+from .sorted_list import DEFAULT_LOAD, SortedList
+
+__all__ = ["DEFAULT_LOAD", "SortedList"]
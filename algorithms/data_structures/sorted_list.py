@@ -0,0 +1,386 @@
+"""
+Order-statistic sorted container.
+
+``SortedList`` keeps its values in a list of sorted blocks of at most
+``2 * load`` values, plus the largest value of every block and a Fenwick
+tree (binary indexed tree) over the block lengths:
+
+- ``add`` and ``remove`` find the block by bisecting the block maxima,
+  bisect inside the block and shift at most ``2 * load`` references, then
+  update the Fenwick tree: O(log n) comparisons and tree updates.
+- ``rank`` adds the lengths of the blocks before the value's block, and
+  ``select`` (indexing) walks down the Fenwick tree to the block holding a
+  position: both O(log n).
+- A block that outgrows ``2 * load`` is split in half and one that shrinks
+  below ``load // 2`` is merged into its neighbor. Both rebuild the tree in
+  O(n / load), amortized over the ``load`` updates in between.
+
+Keeping a continuously updated list ordered this way costs one logarithmic
+update per change, instead of re-sorting the whole list on every refresh.
+Sorted output from any engine loads in O(n) with ``SortedList.from_sorted``.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable, Iterator
+from itertools import chain, islice
+from typing import Any, Generic, Protocol, TypeVar, cast, overload
+
+DEFAULT_LOAD = 512
+
+
+class Comparable(Protocol):
+    """Values that order themselves with ``<``."""
+
+    def __lt__(self, other: Any, /) -> bool: ...
+
+
+T = TypeVar("T", bound=Comparable)
+
+
+class SortedList(Generic[T]):
+    """
+    Sorted sequence with O(log n) updates, rank and select.
+
+    Equal values are kept in insertion order. Values must keep their order
+    while stored: mutating a stored value's sort key corrupts the list.
+
+    Args:
+        values: Initial values, in any order
+        load: Target block size; blocks hold ``load // 2`` to ``2 * load``
+            values
+    """
+
+    def __init__(self, values: Iterable[T] = (), *, load: int = DEFAULT_LOAD) -> None:
+        if load < 4:
+            raise ValueError(f"load must be at least 4, got {load}")
+        self._load = load
+        self._blocks: list[list[T]] = []
+        self._maxes: list[T] = []
+        self._tree: list[int] = [0]
+        self._len = 0
+        self._load_sorted(sorted(values))
+
+    @classmethod
+    def from_sorted(
+        cls, values: Iterable[T], *, load: int = DEFAULT_LOAD
+    ) -> "SortedList[T]":
+        """
+        Bulk-load values that are already in ascending order, in O(n).
+
+        Use it on the output of any sorting engine to skip re-sorting.
+
+        Args:
+            values: Values in non-decreasing order
+            load: Target block size
+
+        Returns:
+            New sorted list holding ``values``
+
+        Raises:
+            ValueError: If ``values`` is not in non-decreasing order
+        """
+        items = list(values)
+        for i in range(1, len(items)):
+            if items[i] < items[i - 1]:
+                raise ValueError(f"values are not sorted at index {i}")
+        container: SortedList[T] = cls(load=load)
+        container._load_sorted(items)
+        return container
+
+    def _load_sorted(self, items: list[T]) -> None:
+        """Replace the contents with the sorted ``items``."""
+        load = self._load
+        self._blocks = [items[i : i + load] for i in range(0, len(items), load)]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._len = len(items)
+        self._build_tree()
+
+    # -- Positional index -------------------------------------------------
+
+    def _build_tree(self) -> None:
+        """Rebuild the Fenwick tree over the block lengths in O(blocks)."""
+        tree = [0] + [len(block) for block in self._blocks]
+        size = len(tree)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _grow(self, block: int, delta: int) -> None:
+        """Add ``delta`` to the length recorded for ``block``."""
+        tree = self._tree
+        i = block + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _offset(self, block: int) -> int:
+        """Number of values stored in the blocks before ``block``."""
+        tree = self._tree
+        total = 0
+        i = block
+        while i:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        """Block and position within it of the value at ``index`` (0-based)."""
+        tree = self._tree
+        block = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            nxt = block + step
+            if nxt < len(tree) and tree[nxt] <= index:
+                block = nxt
+                index -= tree[nxt]
+            step >>= 1
+        return block, index
+
+    def _normalize(self, index: int) -> int:
+        """Resolve a negative index; raise IndexError when out of range."""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedList index out of range")
+        return index
+
+    # -- Updates ----------------------------------------------------------
+
+    def add(self, value: T) -> None:
+        """Insert ``value`` after any equal values, in O(log n)."""
+        maxes = self._maxes
+        if not maxes:
+            self._blocks.append([value])
+            maxes.append(value)
+            self._len = 1
+            self._build_tree()
+            return
+
+        block = bisect_right(maxes, value)
+        if block == len(maxes):
+            # Larger than everything: append to the last block
+            block -= 1
+            self._blocks[block].append(value)
+            maxes[block] = value
+        else:
+            insort(self._blocks[block], value)
+        self._len += 1
+
+        if len(self._blocks[block]) > 2 * self._load:
+            values = self._blocks[block]
+            half = len(values) // 2
+            self._blocks[block : block + 1] = [values[:half], values[half:]]
+            maxes[block : block + 1] = [values[half - 1], values[-1]]
+            self._build_tree()
+        else:
+            self._grow(block, 1)
+
+    def update(self, values: Iterable[T]) -> None:
+        """
+        Insert many values.
+
+        Adds them one at a time when they are few compared to the list, and
+        otherwise merges them in with one sort and a rebuild in O(n log n).
+        """
+        items = list(values)
+        if len(items) * 8 > self._len:
+            merged = list(chain.from_iterable(self._blocks))
+            merged.extend(sorted(items))
+            merged.sort()  # Timsort merges the two sorted runs
+            self._load_sorted(merged)
+        else:
+            for value in items:
+                self.add(value)
+
+    def _delete(self, block: int, pos: int) -> None:
+        """Delete the value at ``pos`` of ``block``, rebalancing blocks."""
+        blocks, maxes = self._blocks, self._maxes
+        values = blocks[block]
+        del values[pos]
+        self._len -= 1
+
+        if len(values) >= self._load // 2:
+            if pos == len(values):
+                maxes[block] = values[-1]
+            self._grow(block, -1)
+            return
+
+        if len(blocks) == 1:
+            if values:
+                maxes[0] = values[-1]
+            else:
+                del blocks[0], maxes[0]
+            self._build_tree()
+            return
+
+        # Merge the small block into a neighbor, splitting again if too large
+        if block == 0:
+            block = 1
+        merged = blocks[block - 1] + blocks[block]
+        if len(merged) > 2 * self._load:
+            half = len(merged) // 2
+            blocks[block - 1 : block + 1] = [merged[:half], merged[half:]]
+            maxes[block - 1 : block + 1] = [merged[half - 1], merged[-1]]
+        else:
+            blocks[block - 1 : block + 1] = [merged]
+            maxes[block - 1 : block + 1] = [merged[-1]]
+        self._build_tree()
+
+    def remove(self, value: T) -> None:
+        """
+        Remove the first occurrence of ``value``, in O(log n).
+
+        Raises:
+            ValueError: If ``value`` is not in the list
+        """
+        if not self.discard(value):
+            raise ValueError(f"{value!r} not in SortedList")
+
+    def discard(self, value: T) -> bool:
+        """Remove the first occurrence of ``value``; return whether one was."""
+        maxes = self._maxes
+        block = bisect_left(maxes, value)
+        if block == len(maxes):
+            return False
+        values = self._blocks[block]
+        pos = bisect_left(values, value)
+        if values[pos] < value or value < values[pos]:
+            return False
+        self._delete(block, pos)
+        return True
+
+    def pop(self, index: int = -1) -> T:
+        """
+        Remove and return the value at ``index`` (the largest by default).
+
+        Raises:
+            IndexError: If the list is empty or ``index`` is out of range
+        """
+        block, pos = self._locate(self._normalize(index))
+        value = self._blocks[block][pos]
+        self._delete(block, pos)
+        return value
+
+    def __delitem__(self, index: int) -> None:
+        self.pop(index)
+
+    def clear(self) -> None:
+        """Remove every value."""
+        self._load_sorted([])
+
+    # -- Queries ----------------------------------------------------------
+
+    def rank(self, value: T) -> int:
+        """Number of stored values less than ``value``, in O(log n)."""
+        maxes = self._maxes
+        block = bisect_left(maxes, value)
+        if block == len(maxes):
+            return self._len
+        return self._offset(block) + bisect_left(self._blocks[block], value)
+
+    def bisect_right(self, value: T) -> int:
+        """Number of stored values less than or equal to ``value``."""
+        maxes = self._maxes
+        block = bisect_right(maxes, value)
+        if block == len(maxes):
+            return self._len
+        return self._offset(block) + bisect_right(self._blocks[block], value)
+
+    def count(self, value: T) -> int:
+        """Number of stored values equal to ``value``."""
+        return self.bisect_right(value) - self.rank(value)
+
+    def select(self, index: int) -> T:
+        """
+        Value at sorted position ``index`` (negative counts from the end).
+
+        Raises:
+            IndexError: If ``index`` is out of range
+        """
+        block, pos = self._locate(self._normalize(index))
+        return self._blocks[block][pos]
+
+    def islice(self, start: int = 0, stop: int | None = None) -> Iterator[T]:
+        """Iterate over sorted positions ``start`` to ``stop`` (exclusive)."""
+        start, stop, _ = slice(start, stop).indices(self._len)
+        if start >= stop:
+            return iter(())
+        block, pos = self._locate(start)
+        values = chain(
+            islice(self._blocks[block], pos, None),
+            chain.from_iterable(self._blocks[block + 1 :]),
+        )
+        return islice(values, stop - start)
+
+    def irange(
+        self,
+        low: T | None = None,
+        high: T | None = None,
+        inclusive: tuple[bool, bool] = (True, True),
+    ) -> Iterator[T]:
+        """
+        Iterate over the stored values between ``low`` and ``high``.
+
+        Args:
+            low: Smallest value to yield; ``None`` starts at the smallest
+            high: Largest value to yield; ``None`` runs to the largest
+            inclusive: Whether ``low`` and ``high`` themselves are yielded
+
+        Returns:
+            Iterator over the values in ascending order
+        """
+        if low is None:
+            start = 0
+        else:
+            start = self.rank(low) if inclusive[0] else self.bisect_right(low)
+        if high is None:
+            stop = self._len
+        else:
+            stop = self.bisect_right(high) if inclusive[1] else self.rank(high)
+        return self.islice(start, stop)
+
+    # -- Sequence protocol ------------------------------------------------
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step == 1:
+                return list(self.islice(start, stop))
+            return list(chain.from_iterable(self._blocks))[index]
+        return self.select(index)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[T]:
+        return chain.from_iterable(self._blocks)
+
+    def __reversed__(self) -> Iterator[T]:
+        return chain.from_iterable(map(reversed, reversed(self._blocks)))
+
+    def __contains__(self, value: object) -> bool:
+        key = cast(T, value)
+        maxes = self._maxes
+        block = bisect_left(maxes, key)
+        if block == len(maxes):
+            return False
+        values = self._blocks[block]
+        return bool(values[bisect_left(values, key)] == key)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SortedList):
+            return self._len == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
@@ -0,0 +1,64 @@
+"""
+Input datasets for exercising the sorting algorithms.
+
+``generators`` holds the seeded, vectorized distributions; ``adversarial``
+holds inputs built to expose worst-case behavior. ``make_dataset`` serves
+both by display name. ``metrics`` measures how sorted any input actually is.
+``strings`` builds prefix-heavy string keys for the string sorting engines.
+"""
+
+from .adversarial import (
+    ADVERSARIAL_DATASETS,
+    all_equal_except_one,
+    antiqsort,
+    organ_pipe,
+    sawtooth,
+)
+from .generators import DISTRIBUTIONS, generate, generate_to_file
+from .metrics import (
+    Presortedness,
+    count_inversions,
+    longest_sorted_subsequence,
+    measure_presortedness,
+)
+from .strings import STRING_DATASETS, make_string_dataset
+
+DATASET_NAMES = [*DISTRIBUTIONS, *ADVERSARIAL_DATASETS]
+
+
+def make_dataset(name: str, size: int, seed: int | None = None) -> list[int]:
+    """
+    Build any named dataset as a list of Python ints.
+
+    Args:
+        name: Entry of ``DATASET_NAMES``
+        size: Number of elements
+        seed: Seed for random distributions (adversarial ones are deterministic)
+
+    Returns:
+        List of integers
+    """
+    if name in ADVERSARIAL_DATASETS:
+        return ADVERSARIAL_DATASETS[name](size)
+    values: list[int] = generate(name, size, seed).tolist()
+    return values
+
+
+__all__ = [
+    "ADVERSARIAL_DATASETS",
+    "DATASET_NAMES",
+    "DISTRIBUTIONS",
+    "Presortedness",
+    "STRING_DATASETS",
+    "all_equal_except_one",
+    "antiqsort",
+    "count_inversions",
+    "generate",
+    "generate_to_file",
+    "longest_sorted_subsequence",
+    "make_dataset",
+    "make_string_dataset",
+    "measure_presortedness",
+    "organ_pipe",
+    "sawtooth",
+]
@@ -0,0 +1,23 @@
+"""Command-line entry point: ``python -m algorithms.datasets``."""
+
+from pathlib import Path
+
+import typer
+
+from .generators import generate_to_file
+
+
+def main(
+    output: Path = typer.Argument(..., help="Raw int64 file to write"),
+    distribution: str = typer.Option("Random", help="Distribution name"),
+    size: int = typer.Option(1_000_000, help="Number of elements"),
+    seed: int | None = typer.Option(None, help="Seed for reproducible output"),
+    low: int = typer.Option(1, help="Smallest sampled value"),
+    high: int = typer.Option(100, help="Exclusive upper bound for sampled values"),
+) -> None:
+    """Write a reproducible benchmark input to a raw int64 file."""
+    generate_to_file(output, distribution, size, seed, low, high)
+    typer.echo(f"Wrote {size:,} x int64 {distribution} values to {output}")
+
+
+typer.run(main)
@@ -0,0 +1,127 @@
+"""
+Adversarial input generators that expose quadratic blowups.
+
+- ``antiqsort``: McIlroy's adaptive adversary ("A Killer Adversary for
+  Quicksort", 1999). It runs a sort on placeholder items and decides their
+  values lazily, always making the current pivot candidate as small as
+  possible, then returns the input that reproduces that behavior.
+- ``organ_pipe``, ``sawtooth``, ``all_equal_except_one``: fixed patterns that
+  hit pivot choices and run-detection heuristics.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from algorithms.sorting import ALGORITHMS
+
+
+class _Adversary:
+    """Comparison oracle assigning values to items only when forced to."""
+
+    def __init__(self, size: int) -> None:
+        self.gas = size  # Larger than every frozen ("solid") value
+        self.values = [self.gas] * size
+        self.solid = 0
+        self.candidate = 0
+        self.comparisons = 0
+
+    def freeze(self, index: int) -> None:
+        self.values[index] = self.solid
+        self.solid += 1
+
+    def compare(self, x: int, y: int) -> int:
+        self.comparisons += 1
+        values = self.values
+        if values[x] == self.gas and values[y] == self.gas:
+            self.freeze(x if x == self.candidate else y)
+        if values[x] == self.gas:
+            self.candidate = x
+        elif values[y] == self.gas:
+            self.candidate = y
+        return values[x] - values[y]
+
+
+class _Item:
+    """Placeholder whose ordering is decided by the adversary."""
+
+    __slots__ = ("adversary", "index")
+
+    def __init__(self, adversary: _Adversary, index: int) -> None:
+        self.adversary = adversary
+        self.index = index
+
+    def _cmp(self, other: "_Item") -> int:
+        return self.adversary.compare(self.index, other.index)
+
+    def __lt__(self, other: "_Item") -> bool:
+        return self._cmp(other) < 0
+
+    def __le__(self, other: "_Item") -> bool:
+        return self._cmp(other) <= 0
+
+    def __gt__(self, other: "_Item") -> bool:
+        return self._cmp(other) > 0
+
+    def __ge__(self, other: "_Item") -> bool:
+        return self._cmp(other) >= 0
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Item) and self._cmp(other) == 0
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def antiqsort(sort_func: Callable[[list[Any]], Any], size: int) -> list[int]:
+    """
+    Build a killer input for ``sort_func`` with McIlroy's adversary.
+
+    The sort must only compare elements (no arithmetic on them) and choose
+    its pivot from O(1) candidates, which holds for every quicksort here.
+
+    Args:
+        sort_func: Sort to attack, called once on placeholder items
+        size: Number of elements
+
+    Returns:
+        Permutation of 1..size that drives ``sort_func`` into its worst case
+    """
+    adversary = _Adversary(size)
+    sort_func([_Item(adversary, i) for i in range(size)])
+    # Leftover gas was never compared with other gas, only found larger than
+    # every solid value, so freezing it now in any order stays consistent
+    for index, value in enumerate(adversary.values):
+        if value == adversary.gas:
+            adversary.freeze(index)
+    return [value + 1 for value in adversary.values]
+
+
+def organ_pipe(size: int) -> list[int]:
+    """Ascending then descending: 1, 2, ..., k, ..., 2, 1."""
+    half = (size + 1) // 2
+    return list(range(1, half + 1)) + list(range(size - half, 0, -1))
+
+
+def sawtooth(size: int, teeth: int = 8) -> list[int]:
+    """``teeth`` ascending runs of (near) equal length, e.g. 1..k, 1..k, ..."""
+    teeth = max(1, min(teeth, size))
+    data = []
+    for i in range(size):
+        tooth = i * teeth // size
+        start = -(-tooth * size // teeth)  # first index of this tooth
+        data.append(i - start + 1)
+    return data
+
+
+def all_equal_except_one(size: int) -> list[int]:
+    """Every element equal except a single smaller one at the end."""
+    return [2] * (size - 1) + [1] if size else []
+
+
+ADVERSARIAL_DATASETS: dict[str, Callable[[int], list[int]]] = {
+    "Organ Pipe": organ_pipe,
+    "Sawtooth": sawtooth,
+    "All Equal Except One": all_equal_except_one,
+    "Antiqsort (Quick Sort Killer)": lambda size: antiqsort(
+        ALGORITHMS["quick_sort"].sort_func, size
+    ),
+}
@@ -0,0 +1,158 @@
+"""
+Presortedness and distribution metrics.
+
+Labels such as "Nearly Sorted" say how an input was generated; these
+measures say how sorted it actually is:
+
+- inversions: pairs ``i < j`` with ``a[i] > a[j]`` (0 when sorted, n(n-1)/2
+  when reversed), counted by a bottom-up merge sort
+- runs: maximal non-decreasing runs (1 when sorted)
+- LIS: length of the longest non-decreasing subsequence (n when sorted)
+- max displacement: how far any element is from its sorted position
+- distinct ratio: distinct values over size
+
+Runs, displacement and distinct values are computed exactly with NumPy at
+any size. Inversions and the LIS are Python-level O(n log n) passes; above
+``exact_limit`` inversions are estimated from random pairs and the LIS is
+replaced by a lower bound (the LIS of a random subsequence, or the longest
+run if that is longer). The LIS does not scale with the sample size, so no
+unbiased estimate is attempted.
+"""
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from algorithms.sorting._merge_sort import merge_inversions
+
+EXACT_LIMIT = 200_000
+SAMPLE_SIZE = 20_000
+
+
+@dataclass(frozen=True)
+class Presortedness:
+    """
+    How sorted an array is.
+
+    ``sampled`` marks estimated fields: ``inversions`` is then an estimate
+    and ``lis`` a lower bound.
+    """
+
+    size: int
+    inversions: int
+    runs: int
+    lis: int
+    max_displacement: int
+    distinct: int
+    sampled: bool = False
+
+    @property
+    def inversion_ratio(self) -> float:
+        """Inversions over the maximum possible, n(n-1)/2."""
+        pairs = self.size * (self.size - 1) // 2
+        return self.inversions / pairs if pairs else 0.0
+
+    @property
+    def distinct_ratio(self) -> float:
+        return self.distinct / self.size if self.size else 0.0
+
+    def as_row(self) -> dict[str, Any]:
+        return {
+            "Inversions": self.inversions,
+            "Inversion %": 100 * self.inversion_ratio,
+            "Runs": self.runs,
+            "LIS": self.lis,
+            "Max Displacement": self.max_displacement,
+            "Distinct %": 100 * self.distinct_ratio,
+            "Sampled": self.sampled,
+        }
+
+
+def count_inversions(values: Sequence[int]) -> int:
+    """
+    Exact inversion count in O(n log n).
+
+    Runs a bottom-up merge sort with the ``merge_inversions`` helper from
+    merge sort, summing the inversions each merge resolves.
+    """
+    arr = list(values)
+    n = len(arr)
+    total = 0
+    width = 1
+    while width < n:
+        merged: list[int] = []
+        for lo in range(0, n, 2 * width):
+            part, inversions = merge_inversions(
+                arr[lo : lo + width], arr[lo + width : lo + 2 * width]
+            )
+            merged.extend(part)
+            total += inversions
+        arr = merged
+        width *= 2
+    return total
+
+
+def longest_sorted_subsequence(values: Sequence[int]) -> int:
+    """Length of the longest non-decreasing subsequence (patience sorting)."""
+    # tails[k]: smallest possible last value of a subsequence of length k + 1
+    tails: list[int] = []
+    for value in values:
+        k = bisect_right(tails, value)
+        if k == len(tails):
+            tails.append(value)
+        else:
+            tails[k] = value
+    return len(tails)
+
+
+def measure_presortedness(
+    values: Sequence[int] | np.ndarray,
+    exact_limit: int = EXACT_LIMIT,
+    sample_size: int = SAMPLE_SIZE,
+    seed: int = 0,
+) -> Presortedness:
+    """
+    Compute every presortedness measure of ``values``.
+
+    Args:
+        values: Integers to measure
+        exact_limit: Largest size whose inversions and LIS are exact
+        sample_size: Pairs (inversions) and elements (LIS) sampled above it
+        seed: Seed for the sample
+
+    Returns:
+        The measures; estimates and bounds are flagged with ``sampled=True``
+    """
+    a = np.asarray(values, dtype=np.int64)
+    n = len(a)
+    if n == 0:
+        return Presortedness(0, 0, 0, 0, 0, 0)
+
+    breaks = np.flatnonzero(a[1:] < a[:-1]) + 1
+    runs = 1 + len(breaks)
+    order = np.argsort(a, kind="stable")
+    max_displacement = int(np.abs(order - np.arange(n)).max())
+    distinct = len(np.unique(a))
+
+    sampled = n > exact_limit
+    if not sampled:
+        inversions = count_inversions(a.tolist())
+        lis = longest_sorted_subsequence(a.tolist())
+    else:
+        rng = np.random.default_rng(seed)
+        # Inversions: share of random pairs that are out of order
+        i, j = rng.integers(0, n, (2, sample_size))
+        distinct_pairs = i != j
+        lo = np.minimum(i, j)[distinct_pairs]
+        hi = np.maximum(i, j)[distinct_pairs]
+        out_of_order = float(np.mean(a[lo] > a[hi])) if len(lo) else 0.0
+        inversions = round(out_of_order * n * (n - 1) / 2)
+        # LIS: any subsequence's LIS, and any run, is a lower bound for it
+        positions = np.sort(rng.choice(n, min(sample_size, n), replace=False))
+        longest_run = int(np.diff(breaks, prepend=0, append=n).max())
+        lis = max(longest_sorted_subsequence(a[positions].tolist()), longest_run)
+
+    return Presortedness(n, inversions, runs, lis, max_displacement, distinct, sampled)
@@ -0,0 +1,86 @@
+"""
+String-key datasets for the string sorting engines.
+
+Keys with long shared prefixes (URLs, file paths) are where comparison sorts
+waste the most work: every comparison rescans the prefix both keys share.
+
+- ``URLs``: a handful of hosts and sections, numbered items, query strings
+- ``File Paths``: a project tree several directories deep
+- ``Shared Prefix``: one 64-character prefix and a random 8-letter suffix
+- ``Random Words``: 3-12 random lowercase letters, little prefix sharing
+- ``Unicode Words``: words over accented, Greek and CJK letters
+"""
+
+import random
+import string
+from collections.abc import Callable
+
+SHARED_PREFIX_LENGTH = 64
+_HOSTS = ["www.example.com", "docs.example.com", "shop.example.org"]
+_SECTIONS = ["products", "articles", "users", "search", "static/assets"]
+_DIRS = ["algorithms", "sorting", "datasets", "profiling", "service", "tests"]
+_EXTENSIONS = [".py", ".pyc", ".json", ".md"]
+_UNICODE_LETTERS = "aeéèêßøåπλωΣ日本語한글"
+
+
+def _word(rng: random.Random, letters: str, low: int = 3, high: int = 12) -> str:
+    return "".join(rng.choices(letters, k=rng.randint(low, high)))
+
+
+def _urls(size: int, rng: random.Random) -> list[str]:
+    return [
+        f"https://{rng.choice(_HOSTS)}/{rng.choice(_SECTIONS)}/"
+        f"{rng.randrange(10_000):08d}?ref={_word(rng, string.ascii_lowercase)}"
+        for _ in range(size)
+    ]
+
+
+def _file_paths(size: int, rng: random.Random) -> list[str]:
+    return [
+        "/home/dev/projects/swe-mastery/"
+        + "/".join(rng.choices(_DIRS, k=rng.randint(1, 4)))
+        + f"/{_word(rng, string.ascii_lowercase)}{rng.choice(_EXTENSIONS)}"
+        for _ in range(size)
+    ]
+
+
+def _shared_prefix(size: int, rng: random.Random) -> list[str]:
+    prefix = "x" * SHARED_PREFIX_LENGTH
+    return [prefix + _word(rng, string.ascii_lowercase, 8, 8) for _ in range(size)]
+
+
+def _random_words(size: int, rng: random.Random) -> list[str]:
+    return [_word(rng, string.ascii_lowercase) for _ in range(size)]
+
+
+def _unicode_words(size: int, rng: random.Random) -> list[str]:
+    return [_word(rng, _UNICODE_LETTERS) for _ in range(size)]
+
+
+STRING_DATASETS: dict[str, Callable[[int, random.Random], list[str]]] = {
+    "URLs": _urls,
+    "File Paths": _file_paths,
+    "Shared Prefix": _shared_prefix,
+    "Random Words": _random_words,
+    "Unicode Words": _unicode_words,
+}
+
+
+def make_string_dataset(name: str, size: int, seed: int | None = None) -> list[str]:
+    """
+    Build a named string-key dataset.
+
+    Args:
+        name: Entry of ``STRING_DATASETS``
+        size: Number of keys
+        seed: Seed for the generator
+
+    Returns:
+        List of keys; encode them for a ``bytes`` dataset
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    if name not in STRING_DATASETS:
+        raise ValueError(f"Unknown string dataset: {name!r}")
+    return STRING_DATASETS[name](size, random.Random(seed))
@@ -0,0 +1,32 @@
+"""
+Distributed sample sort over TCP.
+
+A coordinator (``algorithms.distributed.coordinator``) picks splitters
+from worker samples; workers (``algorithms.distributed.worker``) exchange
+buckets directly and sort them locally, leaving output shards that are
+globally ordered by rank. ``algorithms.distributed.harness`` runs a whole
+cluster as local processes.
+"""
+
+from .coordinator import (
+    Coordinator,
+    DistributedSortReport,
+    WorkerReport,
+    pick_splitters,
+)
+from .harness import read_output, run_local, write_input_shards
+from .protocol import DistributedSortError
+from .worker import partition, run_worker
+
+__all__ = [
+    "Coordinator",
+    "DistributedSortError",
+    "DistributedSortReport",
+    "WorkerReport",
+    "partition",
+    "pick_splitters",
+    "read_output",
+    "run_local",
+    "run_worker",
+    "write_input_shards",
+]
@@ -0,0 +1,58 @@
+"""Command-line entry point: ``python -m algorithms.distributed``."""
+
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import typer
+
+from algorithms.datasets import make_dataset
+from algorithms.profiling.benchmark import format_table
+from algorithms.sorting import bulk_io
+from algorithms.sorting.cli import ENGINES
+
+from .coordinator import DEFAULT_SAMPLES
+from .harness import read_output, run_local, write_input_shards
+from .protocol import DistributedSortError
+
+
+def main(
+    source: Path | None = typer.Argument(None, help="Raw int64 file to sort"),
+    workers: int = typer.Option(4, help="Number of local worker processes"),
+    output_dir: Path | None = typer.Option(None, help="Keep shards here"),
+    algorithm: str = typer.Option("numpy", help=f"One of: {', '.join(ENGINES)}"),
+    distribution: str = typer.Option("Random", help="Input without a source"),
+    size: int = typer.Option(1_000_000, help="Input size without a source"),
+    samples: int = typer.Option(DEFAULT_SAMPLES, help="Samples per worker"),
+    seed: int = typer.Option(0, help="Seed for input and samplers"),
+    verify: bool = typer.Option(True, help="Check the output is sorted"),
+) -> None:
+    """Run a distributed sample sort with local worker processes."""
+    if workers < 1:
+        raise typer.BadParameter("workers must be at least 1")
+    if algorithm not in ENGINES:
+        raise typer.BadParameter(f"Unknown algorithm: {algorithm}")
+    if source is None:
+        values = np.asarray(make_dataset(distribution, size, seed), dtype="<i8")
+    else:
+        values = bulk_io.read_binary(source)
+
+    with tempfile.TemporaryDirectory() as scratch:
+        directory = output_dir or Path(scratch)
+        inputs = write_input_shards(values, workers, directory / "input")
+        try:
+            report = run_local(inputs, directory, algorithm, samples, seed)
+        except (OSError, DistributedSortError) as e:
+            typer.echo(f"Error: {e}", err=True)
+            raise typer.Exit(1) from None
+        if verify:
+            output = read_output(report)
+            if len(output) != len(values) or np.any(output[1:] < output[:-1]):
+                typer.echo("Error: output shards are not globally sorted", err=True)
+                raise typer.Exit(1)
+
+    typer.echo(format_table(report.workers))
+    typer.echo(report.summary())
+
+
+typer.run(main)
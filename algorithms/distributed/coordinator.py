@@ -0,0 +1,299 @@
+"""
+Sample sort coordinator.
+
+The coordinator never touches the bulk of the data: it hands out ranks and
+peer addresses, merges the workers' samples into ``p - 1`` splitters and
+collects the per-worker reports. Keys move only between workers.
+
+Usage:
+    python -m algorithms.distributed.coordinator --workers 4 --port 7000
+"""
+
+import select
+import socket
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import typer
+
+from algorithms.sorting.bulk_io import DTYPE
+from algorithms.sorting.cli import ENGINES
+
+from .protocol import DEFAULT_TIMEOUT, DistributedSortError, expect, send_message
+
+DEFAULT_SAMPLES = 256
+PHASES = ("load", "sample", "partition", "exchange", "sort", "write")
+
+
+def pick_splitters(samples: np.ndarray, parts: int) -> np.ndarray:
+    """
+    Evenly spaced order statistics of the pooled samples.
+
+    Args:
+        samples: Samples from every worker
+        parts: Number of buckets wanted
+
+    Returns:
+        ``parts - 1`` non-decreasing splitters (all zero without samples)
+    """
+    if parts < 1:
+        raise ValueError("parts must be at least 1")
+    ordered = np.sort(samples)
+    if not len(ordered):
+        return np.zeros(parts - 1, dtype=DTYPE)
+    positions = np.arange(1, parts) * len(ordered) // parts
+    return np.asarray(ordered[positions], dtype=DTYPE)
+
+
+@dataclass
+class WorkerReport:
+    """What one worker did, as it reported it."""
+
+    rank: int
+    input_count: int
+    output_count: int
+    bytes_sent: int
+    bytes_received: int
+    phases: dict[str, float]
+    path: str
+
+    def as_row(self) -> dict[str, Any]:
+        row: dict[str, Any] = {
+            "Rank": self.rank,
+            "Input": self.input_count,
+            "Output": self.output_count,
+            "Sent (B)": self.bytes_sent,
+            "Received (B)": self.bytes_received,
+        }
+        for phase in PHASES:
+            row[f"Time {phase} (s)"] = self.phases.get(phase, 0.0)
+        return row
+
+
+@dataclass
+class DistributedSortReport:
+    """Outcome of one distributed sort, across all workers."""
+
+    algorithm: str
+    splitters: list[int]
+    workers: list[WorkerReport] = field(default_factory=list)
+    wall: float = 0.0
+
+    @property
+    def total(self) -> int:
+        """Number of keys sorted."""
+        return sum(w.output_count for w in self.workers)
+
+    @property
+    def shuffle_bytes(self) -> int:
+        """Key bytes that crossed the network between workers."""
+        return sum(w.bytes_sent for w in self.workers)
+
+    @property
+    def skew(self) -> float:
+        """Largest output shard relative to the mean (1.0 is perfect balance)."""
+        if not self.total:
+            return 1.0
+        mean = self.total / len(self.workers)
+        return max(w.output_count for w in self.workers) / mean
+
+    @property
+    def phase_times(self) -> dict[str, float]:
+        """Slowest worker per phase, i.e. the phase's share of the wall time."""
+        return {
+            phase: max((w.phases.get(phase, 0.0) for w in self.workers), default=0.0)
+            for phase in PHASES
+        }
+
+    @property
+    def paths(self) -> list[str]:
+        """Output shards in rank order; their concatenation is sorted."""
+        return [w.path for w in self.workers]
+
+    def summary(self) -> str:
+        """Shuffle volume, skew and per-phase times as text."""
+        lines = [
+            f"Sorted {self.total:,} keys on {len(self.workers)} workers "
+            f"with {self.algorithm} in {self.wall:.3f}s",
+            f"Shuffle: {self.shuffle_bytes:,} bytes "
+            f"({self.shuffle_bytes / max(1, self.total * DTYPE.itemsize):.0%} "
+            "of the data)",
+            f"Skew:    {self.skew:.2f}x the mean shard",
+        ]
+        for phase, seconds in self.phase_times.items():
+            lines.append(f"{phase:<10} {seconds:9.3f}s")
+        return "\n".join(lines)
+
+
+class Coordinator:
+    """
+    Runs the control plane of one distributed sample sort.
+
+    The listening socket is bound on construction so that workers can be
+    started (and connect) before ``run`` is called. Ranks follow the order
+    in which workers connect.
+
+    Args:
+        workers: Number of workers to wait for
+        algorithm: Key of the bulk sort ``ENGINES`` used for local sorts
+        samples: Sample size requested from each worker
+        host: Interface to listen on
+        port: Port to listen on (0 picks a free one)
+        seed: Base seed of the workers' samplers
+        timeout: Seconds to wait on any single socket operation
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        algorithm: str = "numpy",
+        samples: int = DEFAULT_SAMPLES,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int = 0,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if algorithm not in ENGINES:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        self.workers = workers
+        self.algorithm = algorithm
+        self.samples = samples
+        self.seed = seed
+        self.timeout = timeout
+        self._server = socket.create_server((host, port), backlog=workers)
+        self._server.settimeout(timeout)
+
+    @property
+    def address(self) -> str:
+        """``HOST:PORT`` for workers to connect to."""
+        host, port = self._server.getsockname()[:2]
+        return f"{host}:{port}"
+
+    def close(self) -> None:
+        self._server.close()
+
+    def __enter__(self) -> "Coordinator":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def run(self) -> DistributedSortReport:
+        """
+        Drive one sort from registration to the final reports.
+
+        Returns:
+            Per-worker reports, in rank order
+
+        Raises:
+            DistributedSortError: If a worker fails or disconnects
+        """
+        start = time.perf_counter()
+        conns: list[socket.socket] = []
+        try:
+            peers = []
+            for _ in range(self.workers):
+                conn, (host, _) = self._server.accept()
+                conn.settimeout(self.timeout)
+                conns.append(conn)
+                hello, _ = expect(conn, "hello")
+                peers.append([host, hello["port"]])
+            for rank, conn in enumerate(conns):
+                meta = {
+                    "rank": rank,
+                    "peers": peers,
+                    "algorithm": self.algorithm,
+                    "samples": self.samples,
+                    "seed": self.seed,
+                }
+                send_message(conn, "assign", meta)
+
+            samples = [payload for _, payload in self._gather(conns, "samples")]
+            splitters = pick_splitters(np.concatenate(samples), self.workers)
+            for conn in conns:
+                send_message(conn, "splitters", payload=splitters)
+
+            report = DistributedSortReport(self.algorithm, splitters.tolist())
+            for rank, (done, _) in enumerate(self._gather(conns, "done")):
+                report.workers.append(
+                    WorkerReport(
+                        rank,
+                        done["input"],
+                        done["output"],
+                        done["bytes_sent"],
+                        done["bytes_received"],
+                        done["phases"],
+                        done["path"],
+                    )
+                )
+            report.wall = time.perf_counter() - start
+            return report
+        finally:
+            for conn in conns:
+                conn.close()
+
+    def _gather(
+        self, conns: list[socket.socket], kind: str
+    ) -> list[tuple[dict[str, Any], np.ndarray]]:
+        """
+        One message of ``kind`` from every worker, in rank order.
+
+        Messages are read as workers become ready, so the first failure
+        surfaces at once instead of behind slower, healthy workers.
+        """
+        messages: dict[int, tuple[dict[str, Any], np.ndarray]] = {}
+        pending = dict(enumerate(conns))
+        deadline = time.monotonic() + self.timeout
+        while pending:
+            ready, _, _ = select.select(
+                list(pending.values()), [], [], max(0.0, deadline - time.monotonic())
+            )
+            if not ready:
+                raise DistributedSortError(f"timed out waiting for {kind}")
+            for rank, conn in list(pending.items()):
+                if conn not in ready:
+                    continue
+                try:
+                    messages[rank] = expect(conn, kind)
+                except (OSError, DistributedSortError) as e:
+                    raise DistributedSortError(f"worker {rank}: {e}") from e
+                del pending[rank]
+                deadline = time.monotonic() + self.timeout
+        return [messages[rank] for rank in range(len(conns))]
+
+
+def main(
+    workers: int = typer.Option(..., help="Number of workers to wait for"),
+    host: str = typer.Option("0.0.0.0", help="Interface to listen on"),
+    port: int = typer.Option(7000, help="Port to listen on"),
+    algorithm: str = typer.Option("numpy", help=f"One of: {', '.join(ENGINES)}"),
+    samples: int = typer.Option(DEFAULT_SAMPLES, help="Samples per worker"),
+    seed: int = typer.Option(0, help="Seed for the workers' samplers"),
+    timeout: float = typer.Option(DEFAULT_TIMEOUT, help="Socket timeout (s)"),
+) -> None:
+    """Coordinate a distributed sample sort across remote workers."""
+    from algorithms.profiling.benchmark import format_table
+
+    try:
+        coordinator = Coordinator(
+            workers, algorithm, samples, host, port, seed, timeout
+        )
+    except (OSError, ValueError) as e:
+        raise typer.BadParameter(str(e)) from None
+    with coordinator:
+        typer.echo(f"Waiting for {workers} workers on {coordinator.address}", err=True)
+        try:
+            report = coordinator.run()
+        except (OSError, DistributedSortError) as e:
+            typer.echo(f"Error: {e}", err=True)
+            raise typer.Exit(1) from None
+    typer.echo(format_table(report.workers))
+    typer.echo(report.summary())
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,96 @@
+"""
+Local harness for the distributed sample sort.
+
+Runs the coordinator in this process and every worker as a separate OS
+process on the same machine, talking over loopback TCP exactly as they
+would across hosts. Useful for testing and for measuring the shuffle and
+skew of a dataset before renting a cluster.
+"""
+
+import multiprocessing
+from pathlib import Path
+
+import numpy as np
+
+from algorithms.sorting import bulk_io
+
+from .coordinator import DEFAULT_SAMPLES, Coordinator, DistributedSortReport
+from .protocol import DEFAULT_TIMEOUT, DistributedSortError
+from .worker import run_worker
+
+
+def write_input_shards(
+    values: np.ndarray, workers: int, directory: str | Path
+) -> list[Path]:
+    """
+    Split keys into ``workers`` contiguous raw int64 input shards.
+
+    Returns:
+        Shard paths in worker order
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for rank, part in enumerate(np.array_split(np.asarray(values), workers)):
+        path = directory / f"input-{rank:04d}.i64"
+        bulk_io.write_binary(part, path)
+        paths.append(path)
+    return paths
+
+
+def read_output(report: DistributedSortReport) -> np.ndarray:
+    """Concatenate the output shards of a finished sort in rank order."""
+    parts = [np.asarray(bulk_io.read_binary(path)) for path in report.paths]
+    return np.concatenate(parts) if parts else np.empty(0, dtype=bulk_io.DTYPE)
+
+
+def run_local(
+    inputs: list[Path],
+    output_dir: str | Path,
+    algorithm: str = "numpy",
+    samples: int = DEFAULT_SAMPLES,
+    seed: int = 0,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> DistributedSortReport:
+    """
+    Sort input shards with one local worker process per shard.
+
+    Args:
+        inputs: Raw int64 input shards, one per worker
+        output_dir: Directory for the sorted output shards
+        algorithm: Key of the bulk sort ``ENGINES`` used by the workers
+        samples: Sample size per worker
+        seed: Base seed of the workers' samplers
+        timeout: Seconds to wait on any single socket operation
+
+    Returns:
+        The coordinator's report; output shards are listed in rank order
+
+    Raises:
+        DistributedSortError: If a worker fails
+    """
+    with Coordinator(
+        len(inputs), algorithm, samples, seed=seed, timeout=timeout
+    ) as coordinator:
+        processes = [
+            multiprocessing.Process(
+                target=run_worker,
+                args=(coordinator.address, path, output_dir, timeout),
+                daemon=True,
+            )
+            for path in inputs
+        ]
+        for process in processes:
+            process.start()
+        try:
+            report = coordinator.run()
+        finally:
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+    failed = [p.exitcode for p in processes if p.exitcode]
+    if failed:
+        raise DistributedSortError(f"worker processes exited with {failed}")
+    return report
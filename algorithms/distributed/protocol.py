@@ -0,0 +1,103 @@
+"""
+Wire format shared by the coordinator and the workers.
+
+Every message is a fixed header, a JSON object and a raw payload:
+
+    <u32 JSON length> <u64 payload length> <JSON> <payload>
+
+The JSON carries the message ``kind`` and its small fields; keys travel as
+raw little-endian int64 in the payload so buckets never pass through JSON.
+"""
+
+import json
+import socket
+import struct
+from typing import Any
+
+import numpy as np
+
+from algorithms.sorting.bulk_io import DTYPE
+
+HEADER = struct.Struct("<IQ")
+RECV_CHUNK_BYTES = 1 << 20
+DEFAULT_TIMEOUT = 300.0
+
+
+class DistributedSortError(RuntimeError):
+    """A worker failed or the protocol was violated."""
+
+
+def send_message(
+    sock: socket.socket,
+    kind: str,
+    meta: dict[str, Any] | None = None,
+    payload: np.ndarray | None = None,
+) -> None:
+    """
+    Send one framed message.
+
+    Args:
+        sock: Connected socket
+        kind: Message type, e.g. "samples"
+        meta: JSON-serializable fields
+        payload: int64 values sent raw after the header
+    """
+    header = json.dumps({"kind": kind, **(meta or {})}).encode()
+    values = np.empty(0, dtype=DTYPE) if payload is None else payload
+    body = memoryview(np.ascontiguousarray(values, dtype=DTYPE)).cast("B")
+    sock.sendall(HEADER.pack(len(header), body.nbytes) + header)
+    if body.nbytes:
+        sock.sendall(body)
+
+
+def recv_message(sock: socket.socket) -> tuple[dict[str, Any], np.ndarray]:
+    """
+    Receive one framed message.
+
+    Returns:
+        The JSON fields (including ``kind``) and the int64 payload
+
+    Raises:
+        DistributedSortError: If the peer closes mid-message or sends a
+            payload that is not whole int64 values
+    """
+    header_len, payload_len = HEADER.unpack(_recv_exact(sock, HEADER.size))
+    meta: dict[str, Any] = json.loads(_recv_exact(sock, header_len))
+    if payload_len % DTYPE.itemsize:
+        raise DistributedSortError(f"{meta.get('kind')} payload is not int64")
+    payload = np.empty(payload_len // DTYPE.itemsize, dtype=DTYPE)
+    view = memoryview(payload).cast("B")
+    received = 0
+    while received < payload_len:
+        size = min(RECV_CHUNK_BYTES, payload_len - received)
+        chunk = sock.recv_into(view[received:], size)
+        if not chunk:
+            raise DistributedSortError("connection closed mid-payload")
+        received += chunk
+    return meta, payload
+
+
+def expect(sock: socket.socket, kind: str) -> tuple[dict[str, Any], np.ndarray]:
+    """
+    Receive a message of one kind, surfacing a peer's ``error`` message.
+
+    Raises:
+        DistributedSortError: If the peer reports an error or sends
+            another kind
+    """
+    meta, payload = recv_message(sock)
+    if meta["kind"] == "error":
+        raise DistributedSortError(meta.get("message", "peer failed"))
+    if meta["kind"] != kind:
+        raise DistributedSortError(f"expected {kind}, got {meta['kind']}")
+    return meta, payload
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise DistributedSortError("connection closed mid-message")
+        data += chunk
+    return bytes(data)
@@ -0,0 +1,210 @@
+"""
+Sample sort worker.
+
+A worker owns one input shard of raw int64 keys. It registers with the
+coordinator, sends a random sample, partitions its keys by the splitters
+it gets back, exchanges buckets directly with every other worker over TCP
+and sorts what it received with one of the bulk sort engines. Bucket ``r``
+goes to the worker of rank ``r``, so the output shards concatenated in
+rank order are globally sorted.
+
+Usage:
+    python -m algorithms.distributed.worker 10.0.0.5:7000 part-3.i64 out/
+"""
+
+import socket
+import threading
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import typer
+
+from algorithms.sorting import bulk_io
+from algorithms.sorting.cli import ENGINES, PhaseTimings
+
+from .protocol import DEFAULT_TIMEOUT, DistributedSortError, expect, send_message
+
+
+def parse_address(address: str) -> tuple[str, int]:
+    """
+    Split ``HOST:PORT`` into its parts.
+
+    Raises:
+        ValueError: If the port is missing or not a number
+    """
+    host, sep, port = address.rpartition(":")
+    if not sep or not port.isdigit():
+        raise ValueError(f"expected HOST:PORT, got {address!r}")
+    return host or "127.0.0.1", int(port)
+
+
+def shard_path(output_dir: str | Path, rank: int) -> Path:
+    """Output shard of the worker with ``rank``."""
+    return Path(output_dir) / f"shard-{rank:04d}.i64"
+
+
+def partition(values: np.ndarray, splitters: np.ndarray) -> list[np.ndarray]:
+    """
+    Split keys into ``len(splitters) + 1`` buckets.
+
+    Bucket ``i`` holds the keys in ``(splitters[i-1], splitters[i]]``, so
+    every copy of a splitter value lands in the same bucket.
+    """
+    buckets = np.searchsorted(splitters, values, side="left")
+    counts = np.bincount(buckets, minlength=len(splitters) + 1)
+    grouped = values[np.argsort(buckets, kind="stable")]
+    return np.split(grouped, np.cumsum(counts)[:-1])
+
+
+def run_worker(
+    coordinator: str,
+    source: str | Path,
+    output_dir: str | Path,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> Path:
+    """
+    Take part in one distributed sort.
+
+    Args:
+        coordinator: Coordinator address as ``HOST:PORT``
+        source: Raw int64 input shard
+        output_dir: Directory for this worker's sorted output shard
+        timeout: Seconds to wait on any single socket operation
+
+    Returns:
+        Path of the sorted output shard
+
+    Raises:
+        DistributedSortError: If the coordinator or a peer fails
+    """
+    with socket.create_connection(parse_address(coordinator), timeout) as control:
+        try:
+            return _run(control, source, output_dir, timeout)
+        except Exception as e:
+            message = f"{type(e).__name__}: {e}"
+            try:
+                send_message(control, "error", {"message": message})
+            except OSError:
+                pass
+            raise
+
+
+def _run(
+    control: socket.socket, source: str | Path, output_dir: str | Path, timeout: float
+) -> Path:
+    # Advertise the interface that reaches the coordinator to the peers
+    host = control.getsockname()[0]
+    with socket.create_server((host, 0)) as listener:
+        listener.settimeout(timeout)
+        send_message(control, "hello", {"port": listener.getsockname()[1]})
+        assign, _ = expect(control, "assign")
+        rank: int = assign["rank"]
+        peers = [tuple(peer) for peer in assign["peers"]]
+        if assign["algorithm"] not in ENGINES:
+            raise ValueError(f"Unknown algorithm: {assign['algorithm']}")
+        engine = ENGINES[assign["algorithm"]]
+        timings = PhaseTimings()
+
+        with timings.phase("load"):
+            values = np.array(bulk_io.read_binary(source))
+        with timings.phase("sample"):
+            rng = np.random.default_rng(assign["seed"] + rank)
+            count = min(assign["samples"], len(values))
+            sample = rng.choice(values, count, replace=False) if count else values
+            send_message(control, "samples", {"count": len(values)}, sample)
+        # Waiting on the slowest peer's samples is not this worker's work
+        _, splitters = expect(control, "splitters")
+        with timings.phase("partition"):
+            buckets = partition(values, splitters)
+            del values
+        with timings.phase("exchange"):
+            received, bytes_sent, bytes_received = _exchange(
+                listener, rank, peers, buckets, timeout
+            )
+        with timings.phase("sort"):
+            result = engine(np.concatenate(received))
+        with timings.phase("write"):
+            path = shard_path(output_dir, rank)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            bulk_io.write_binary(result, path)
+
+    send_message(
+        control,
+        "done",
+        {
+            "input": sum(len(bucket) for bucket in buckets),
+            "output": len(result),
+            "bytes_sent": bytes_sent,
+            "bytes_received": bytes_received,
+            "phases": timings.phases,
+            "path": str(path),
+        },
+    )
+    return path
+
+
+def _exchange(
+    listener: socket.socket,
+    rank: int,
+    peers: list[tuple[Any, ...]],
+    buckets: list[np.ndarray],
+    timeout: float,
+) -> tuple[list[np.ndarray], int, int]:
+    """
+    All-to-all bucket exchange.
+
+    Receiving runs on a thread so that every worker drains its incoming
+    connections while it sends; otherwise two workers sending large
+    buckets to each other would block on full socket buffers.
+    """
+    received: list[np.ndarray] = [np.empty(0, dtype=bulk_io.DTYPE)] * len(peers)
+    received[rank] = buckets[rank]
+    failures: list[BaseException] = []
+
+    def receive() -> None:
+        try:
+            for _ in range(len(peers) - 1):
+                conn, _ = listener.accept()
+                with conn:
+                    conn.settimeout(timeout)
+                    meta, payload = expect(conn, "bucket")
+                    received[meta["rank"]] = payload
+        except BaseException as e:  # re-raised on the main thread
+            failures.append(e)
+
+    receiver = threading.Thread(target=receive, daemon=True)
+    receiver.start()
+    bytes_sent = 0
+    for peer, (host, port) in enumerate(peers):
+        if peer == rank:
+            continue
+        with socket.create_connection((host, port), timeout) as conn:
+            send_message(conn, "bucket", {"rank": rank}, buckets[peer])
+        bytes_sent += buckets[peer].nbytes
+    receiver.join(timeout)
+    if failures:
+        raise DistributedSortError(f"bucket exchange failed: {failures[0]}")
+    if receiver.is_alive():
+        raise DistributedSortError("timed out waiting for peer buckets")
+    bytes_received = sum(r.nbytes for i, r in enumerate(received) if i != rank)
+    return received, bytes_sent, bytes_received
+
+
+def main(
+    coordinator: str = typer.Argument(..., help="Coordinator HOST:PORT"),
+    source: Path = typer.Argument(..., help="Raw int64 input shard"),
+    output_dir: Path = typer.Argument(..., help="Directory for the sorted shard"),
+    timeout: float = typer.Option(DEFAULT_TIMEOUT, help="Socket timeout (s)"),
+) -> None:
+    """Join a distributed sample sort as one worker."""
+    try:
+        path = run_worker(coordinator, source, output_dir, timeout)
+    except (OSError, ValueError, DistributedSortError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+    typer.echo(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    typer.run(main)
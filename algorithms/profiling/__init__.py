@@ -0,0 +1,18 @@
+"""
+Profiling tools for the sorting algorithms.
+Hooks that measure where time and memory go inside the sorting kernels.
+The benchmark suite lives in ``algorithms.profiling.benchmark``, its
+SQLite result history in ``algorithms.profiling.history`` and the cache
+simulator in ``algorithms.profiling.cache_sim``.
+"""
+
+from .line_profiler import LineProfile, LineStats, profile_lines
+from .memory import MemoryReport, measure_memory
+
+__all__ = [
+    "MemoryReport",
+    "measure_memory",
+    "LineProfile",
+    "LineStats",
+    "profile_lines",
+]
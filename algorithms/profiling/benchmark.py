@@ -0,0 +1,288 @@
+"""
+Benchmark suite for the sorting algorithms.
+
+Times every algorithm per input size and distribution, for the plain sort
+and the traced (``*_with_steps``) variant, optionally with a memory profile.
+Every result records the presortedness of its input (inversions, runs, LIS,
+displacement, distinct values), so timings can be read against how sorted
+the data really was.
+
+``--strings`` benchmarks the string engines (MSD radix sort, multikey
+quicksort) against the comparison sorts on prefix-heavy string keys instead.
+
+With ``--record`` the results are also stored in the benchmark history
+database (see ``algorithms.profiling.history``) under the current git
+revision.
+
+Usage:
+    python -m algorithms.profiling.benchmark --size 1000 --variant traced --memory
+    python -m algorithms.profiling.benchmark --record --db benchmarks.sqlite
+    python -m algorithms.profiling.benchmark --strings --size 10000 --size 100000
+"""
+
+import statistics
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+import typer
+
+from algorithms.datasets import (
+    DATASET_NAMES,
+    STRING_DATASETS,
+    Presortedness,
+    make_dataset,
+    make_string_dataset,
+    measure_presortedness,
+)
+from algorithms.sorting import ALGORITHMS, STRING_ALGORITHMS, AlgorithmInfo
+
+from .memory import MemoryReport, measure_memory
+
+# String engines plus the n log n comparison sorts they should beat
+STRING_BENCHMARK_ALGORITHMS = [*STRING_ALGORITHMS, "quick_sort", "merge_sort"]
+
+
+class SupportsRow(Protocol):
+    """A result that renders as one table row."""
+
+    def as_row(self) -> dict[str, Any]: ...
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing (and optionally memory) for one benchmark configuration."""
+
+    algorithm: str
+    variant: str
+    size: int
+    distribution: str
+    time_s: float
+    steps: int | None = None
+    memory: MemoryReport | None = None
+    presortedness: Presortedness | None = None
+
+    def as_row(self) -> dict[str, Any]:
+        row: dict[str, Any] = {
+            "Algorithm": self.algorithm,
+            "Variant": self.variant,
+            "Size": self.size,
+            "Distribution": self.distribution,
+            "Time (seconds)": self.time_s,
+            "Steps": self.steps,
+        }
+        if self.memory is not None:
+            row.update(self.memory.as_row())
+        if self.presortedness is not None:
+            row.update(self.presortedness.as_row())
+        return row
+
+
+def run_benchmark(
+    algorithms: Iterable[str] | None = None,
+    sizes: Iterable[int] = (100, 1000),
+    distributions: Iterable[str] | None = None,
+    variants: Iterable[str] = ("plain",),
+    repeats: int = 3,
+    memory: bool = False,
+    seed: int = 0,
+) -> list[BenchmarkResult]:
+    """
+    Benchmark algorithms over every size/distribution/variant combination.
+
+    Args:
+        algorithms: Keys of ``ALGORITHMS`` to run (default: all)
+        sizes: Input sizes
+        distributions: Entries of ``DATASET_NAMES`` (default: all)
+        variants: "plain" and/or "traced"
+        repeats: Timed runs per configuration; the median is reported
+        memory: Also run once under the memory profiler
+        seed: Seed for input generation
+
+    Returns:
+        One result per configuration
+    """
+    results = []
+    for size in sizes:
+        for dist in distributions or DATASET_NAMES:
+            data = make_dataset(dist, size, seed)
+            # Measured once per input; every result on it carries the measures
+            presortedness = measure_presortedness(data)
+            for name in algorithms or ALGORITHMS:
+                for variant in variants:
+                    result = _measure(
+                        ALGORITHMS[name], variant, data, dist, repeats, memory
+                    )
+                    result.presortedness = presortedness
+                    results.append(result)
+    return results
+
+
+def run_string_benchmark(
+    algorithms: Iterable[str] | None = None,
+    sizes: Iterable[int] = (1000, 10_000),
+    distributions: Iterable[str] | None = None,
+    variants: Iterable[str] = ("plain",),
+    repeats: int = 3,
+    memory: bool = False,
+    seed: int = 0,
+    as_bytes: bool = False,
+) -> list[BenchmarkResult]:
+    """
+    Benchmark the string engines against comparison sorts on string keys.
+
+    Args:
+        algorithms: Keys of ``STRING_ALGORITHMS`` or ``ALGORITHMS`` (default:
+            ``STRING_BENCHMARK_ALGORITHMS``)
+        sizes: Numbers of keys
+        distributions: Entries of ``STRING_DATASETS`` (default: all)
+        variants: "plain" and/or "traced"
+        repeats: Timed runs per configuration; the median is reported
+        memory: Also run once under the memory profiler
+        seed: Seed for key generation
+        as_bytes: Sort UTF-8 encoded ``bytes`` keys instead of ``str``
+
+    Returns:
+        One result per configuration
+    """
+    results = []
+    for size in sizes:
+        for dist in distributions or STRING_DATASETS:
+            keys: list[Any] = make_string_dataset(dist, size, seed)
+            if as_bytes:
+                keys = [key.encode() for key in keys]
+            for name in algorithms or STRING_BENCHMARK_ALGORITHMS:
+                info = STRING_ALGORITHMS.get(name) or ALGORITHMS[name]
+                for variant in variants:
+                    results.append(_measure(info, variant, keys, dist, repeats, memory))
+    return results
+
+
+def _measure(
+    info: AlgorithmInfo[Any],
+    variant: str,
+    data: list[Any],
+    distribution: str,
+    repeats: int,
+    memory: bool,
+) -> BenchmarkResult:
+    """Median time (and optionally memory) of one algorithm on one input."""
+    func: Callable[[list[Any]], Any] = (
+        info.sort_func if variant == "plain" else info.steps_func
+    )
+    timings = []
+    output: Any = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        output = func(data)
+        timings.append(time.perf_counter() - start)
+
+    return BenchmarkResult(
+        algorithm=info.key,
+        variant=variant,
+        size=len(data),
+        distribution=distribution,
+        time_s=statistics.median(timings),
+        steps=len(output) if variant == "traced" else None,
+        memory=measure_memory(func, data)[1] if memory else None,
+    )
+
+
+def over_budget(
+    results: Iterable[BenchmarkResult], budget_bytes: int
+) -> list[BenchmarkResult]:
+    """Results whose memory peak exceeds ``budget_bytes``."""
+    return [
+        r
+        for r in results
+        if r.memory is not None and r.memory.peak_bytes > budget_bytes
+    ]
+
+
+def format_table(results: Sequence[SupportsRow]) -> str:
+    """Render results (anything with ``as_row``) as a fixed-width table."""
+    rows = [r.as_row() for r in results]
+    if not rows:
+        return "No results"
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+
+    def cell(column: str, value: Any) -> str:
+        if isinstance(value, float):
+            return f"{value:.6f}" if column.startswith("Time") else f"{value:.1f}"
+        return "" if value is None else str(value)
+
+    cells = [[cell(c, row.get(c)) for c in columns] for row in rows]
+    widths = [max(len(c), *(len(r[i]) for r in cells)) for i, c in enumerate(columns)]
+    lines = ["  ".join(c.ljust(w) for c, w in zip(columns, widths, strict=True))]
+    lines.append("  ".join("-" * w for w in widths))
+    for r in cells:
+        lines.append("  ".join(v.ljust(w) for v, w in zip(r, widths, strict=True)))
+    return "\n".join(lines)
+
+
+def main(
+    algorithm: list[str] | None = typer.Option(None, help="Algorithms to run"),
+    size: list[int] = typer.Option([100, 1000], help="Input sizes (repeatable)"),
+    distribution: list[str] | None = typer.Option(None, help="Input distributions"),
+    variant: list[str] = typer.Option(["plain"], help="plain and/or traced"),
+    repeats: int = typer.Option(3, help="Timed runs per configuration"),
+    memory: bool = typer.Option(False, help="Profile memory with tracemalloc/RSS"),
+    memory_budget_mb: float | None = typer.Option(
+        None, help="Fail if any peak allocation exceeds this budget"
+    ),
+    seed: int = typer.Option(0, help="Seed for input generation"),
+    strings: bool = typer.Option(False, help="Benchmark string keys instead"),
+    as_bytes: bool = typer.Option(False, help="With --strings, sort bytes keys"),
+    record: bool = typer.Option(False, help="Store the results in the history DB"),
+    db: Path | None = typer.Option(
+        None, help="History database (default: $SWE_BENCHMARK_DB or repo root)"
+    ),
+) -> None:
+    """Run the sorting benchmark suite and print a results table."""
+    if strings:
+        results = run_string_benchmark(
+            algorithm or None,
+            size,
+            distribution or None,
+            variant,
+            repeats,
+            memory or memory_budget_mb is not None,
+            seed,
+            as_bytes,
+        )
+    else:
+        results = run_benchmark(
+            algorithm or None,
+            size,
+            distribution or None,
+            variant,
+            repeats,
+            memory or memory_budget_mb is not None,
+            seed,
+        )
+    typer.echo(format_table(results))
+
+    if record:
+        from .history import HistoryStore
+
+        store = HistoryStore(db)
+        run_id = store.record(results, source="cli")
+        store.close()
+        typer.echo(f"Recorded run {run_id} in {store.path}")
+
+    if memory_budget_mb is not None:
+        failures = over_budget(results, int(memory_budget_mb * 1024 * 1024))
+        for r in failures:
+            peak_mb = r.memory.peak_bytes / 2**20 if r.memory else 0.0
+            typer.echo(
+                f"Over budget: {r.algorithm} ({r.variant}) n={r.size} "
+                f"{r.distribution}: {peak_mb:.1f} MB"
+            )
+        if failures:
+            raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,371 @@
+"""
+Cache and memory-locality simulator for the sorting algorithms.
+
+Big-O counts every element access the same, but on real hardware an access
+to a cache line that was just used costs a few cycles and one that misses
+every level costs hundreds. This module replays the element accesses a
+traced sort reports (``on_read``/``on_write`` of its ``TracedArray``)
+through a model of a cache hierarchy:
+
+- The array is laid out contiguously, ``element_bytes`` per element, so
+  element ``i`` lives in cache line ``i * element_bytes // line_bytes``.
+- Every level is set-associative with LRU replacement. Writes allocate
+  like reads. A line found in a lower level, or fetched from memory, is
+  filled into every level above it.
+- An access costs the latency of every level it probes, plus
+  ``memory_latency`` cycles when all of them miss.
+
+Only the sorted array is modeled. Scratch lists (merge sort's halves, the
+radix buckets) and the objects the elements point to, such as the
+characters of string keys, are not traced, so merge and radix engines look
+somewhat better than they are. Traced sorts run about 50x slower than
+plain ones, so keep sizes to tens of thousands of elements. To see the
+behavior of much larger arrays, scale the caches down by the same factor.
+
+Usage:
+    python -m algorithms.profiling.cache_sim --size 1000 --size 10000
+    python -m algorithms.profiling.cache_sim --level L1:4K:8:4 --level L2:64K:8:14
+    python -m algorithms.profiling.cache_sim --strings --size 5000
+"""
+
+import re
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, replace
+from typing import Any
+
+import typer
+
+from algorithms.datasets import make_dataset, make_string_dataset
+from algorithms.sorting import ALGORITHMS, STRING_ALGORITHMS, AlgorithmInfo
+from algorithms.sorting.tracing import BaseObserver
+
+# Cycles for an access that misses every level
+MEMORY_LATENCY = 200
+# A Python list stores 8-byte pointers; an int64 NumPy array 8-byte values
+ELEMENT_BYTES = 8
+LINE_BYTES = 64
+# The O(n log n) engines; quadratic sorts take too long to trace at sizes
+# where caches matter
+CACHE_BENCHMARK_ALGORITHMS = ["quick_sort", "merge_sort"]
+STRING_CACHE_ALGORITHMS = [*STRING_ALGORITHMS, "quick_sort", "merge_sort"]
+
+
+@dataclass(frozen=True)
+class CacheLevel:
+    """
+    One level of a set-associative cache.
+
+    Attributes:
+        name: Display name, e.g. "L1"
+        size_bytes: Capacity
+        ways: Lines per set (associativity)
+        latency: Cycles to probe this level
+        line_bytes: Bytes per cache line
+    """
+
+    name: str
+    size_bytes: int
+    ways: int
+    latency: int
+    line_bytes: int = LINE_BYTES
+
+    def __post_init__(self) -> None:
+        sets, rest = divmod(self.size_bytes, self.ways * self.line_bytes)
+        if sets < 1 or rest:
+            raise ValueError(
+                f"{self.name}: {self.size_bytes} bytes is not a whole number of "
+                f"{self.ways}-way sets of {self.line_bytes}-byte lines"
+            )
+
+    @property
+    def sets(self) -> int:
+        return self.size_bytes // (self.ways * self.line_bytes)
+
+
+# A typical desktop core: 32 KiB L1d, 1 MiB L2, an 8 MiB share of L3
+DEFAULT_HIERARCHY = (
+    CacheLevel("L1", 32 * 1024, ways=8, latency=4),
+    CacheLevel("L2", 1024 * 1024, ways=16, latency=14),
+    CacheLevel("L3", 8 * 1024 * 1024, ways=16, latency=40),
+)
+
+_SIZE = re.compile(r"^(\d+)([KMG]?)B?$", re.IGNORECASE)
+
+
+def parse_level(spec: str, line_bytes: int = LINE_BYTES) -> CacheLevel:
+    """
+    Parse a ``NAME:SIZE:WAYS:LATENCY`` level spec, e.g. ``L1:32K:8:4``.
+
+    Args:
+        spec: Level spec; SIZE takes a K, M or G suffix
+        line_bytes: Bytes per cache line
+
+    Returns:
+        The cache level
+
+    Raises:
+        ValueError: If the spec is malformed or the geometry does not divide
+    """
+    parts = spec.split(":")
+    match = _SIZE.match(parts[1]) if len(parts) == 4 else None
+    if match is None or not parts[2].isdigit() or not parts[3].isdigit():
+        raise ValueError(f"Expected NAME:SIZE:WAYS:LATENCY, got {spec!r}")
+    scale = 1024 ** " KMG".index((match[2] or " ").upper())
+    return CacheLevel(
+        parts[0], int(match[1]) * scale, int(parts[2]), int(parts[3]), line_bytes
+    )
+
+
+@dataclass
+class LevelStats:
+    """Hits and misses at one cache level."""
+
+    name: str
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
+
+
+class CacheSimulator(BaseObserver):
+    """
+    Observer replaying element accesses through a cache hierarchy.
+
+    Pass it as the ``observer`` of any sort to simulate that run.
+
+    Args:
+        levels: Cache levels, closest to the core first
+        memory_latency: Cycles for an access that misses every level
+        element_bytes: Bytes per array element
+    """
+
+    def __init__(
+        self,
+        levels: Sequence[CacheLevel] = DEFAULT_HIERARCHY,
+        memory_latency: int = MEMORY_LATENCY,
+        element_bytes: int = ELEMENT_BYTES,
+    ) -> None:
+        if not levels:
+            raise ValueError("a cache hierarchy needs at least one level")
+        self.levels = list(levels)
+        self.memory_latency = memory_latency
+        self.element_bytes = element_bytes
+        self.stats = [LevelStats(level.name) for level in self.levels]
+        # Per level, per set: tags in LRU order, least recent first
+        self._sets: list[list[dict[int, None]]] = [
+            [{} for _ in range(level.sets)] for level in self.levels
+        ]
+        self.reads = 0
+        self.writes = 0
+        self.memory_accesses = 0
+        self.cycles = 0
+        self._last_line = -1
+
+    def access(self, index: int) -> None:
+        """Simulate one access to element ``index``."""
+        address = index * self.element_bytes
+        first = self.levels[0]
+        if address // first.line_bytes == self._last_line:
+            # Same line as the previous access: an L1 hit that is already MRU
+            self.stats[0].hits += 1
+            self.cycles += first.latency
+            return
+        self._last_line = address // first.line_bytes
+
+        for level, stats, sets in zip(self.levels, self.stats, self._sets, strict=True):
+            self.cycles += level.latency
+            line = address // level.line_bytes
+            lru = sets[line % level.sets]
+            if line in lru:
+                stats.hits += 1
+                del lru[line]
+                lru[line] = None
+                self._fill_above(address, stats)
+                return
+            stats.misses += 1
+        self.memory_accesses += 1
+        self.cycles += self.memory_latency
+        self._fill_above(address, None)
+
+    def _fill_above(self, address: int, hit: LevelStats | None) -> None:
+        """Insert the line into every level that missed, evicting LRU lines."""
+        for level, stats, sets in zip(self.levels, self.stats, self._sets, strict=True):
+            if stats is hit:
+                return
+            line = address // level.line_bytes
+            lru = sets[line % level.sets]
+            if len(lru) >= level.ways:
+                del lru[next(iter(lru))]
+            lru[line] = None
+
+    def on_start(self, data: list[int]) -> None:
+        self._last_line = -1
+
+    def on_read(self, index: int) -> None:
+        self.reads += 1
+        self.access(index)
+
+    def on_write(self, index: int, value: int) -> None:
+        self.writes += 1
+        self.access(index)
+
+
+@dataclass
+class CacheReport:
+    """Simulated cache behavior of one sort run."""
+
+    algorithm: str
+    size: int
+    distribution: str
+    reads: int
+    writes: int
+    levels: list[LevelStats]
+    memory_accesses: int
+    cycles: int
+
+    @property
+    def accesses(self) -> int:
+        return self.reads + self.writes
+
+    @property
+    def cycles_per_access(self) -> float:
+        return self.cycles / self.accesses if self.accesses else 0.0
+
+    def as_row(self) -> dict[str, Any]:
+        row: dict[str, Any] = {
+            "Algorithm": self.algorithm,
+            "Size": self.size,
+            "Distribution": self.distribution,
+            "Reads": self.reads,
+            "Writes": self.writes,
+        }
+        for stats in self.levels:
+            row[f"{stats.name} Hit %"] = 100 * stats.hit_rate
+        row["Memory Accesses"] = self.memory_accesses
+        row["Cycles"] = self.cycles
+        row["Cycles/Access"] = self.cycles_per_access
+        return row
+
+
+def simulate_cache(
+    info: AlgorithmInfo[Any],
+    data: list[Any],
+    distribution: str = "",
+    levels: Sequence[CacheLevel] = DEFAULT_HIERARCHY,
+    memory_latency: int = MEMORY_LATENCY,
+    element_bytes: int = ELEMENT_BYTES,
+) -> CacheReport:
+    """
+    Run one sort traced and replay its accesses through a cache model.
+
+    Args:
+        info: Registry entry of the algorithm
+        data: Input to sort (not modified)
+        distribution: Name of the input distribution, for the report
+        levels: Cache levels, closest to the core first
+        memory_latency: Cycles for an access that misses every level
+        element_bytes: Bytes per array element
+
+    Returns:
+        Hits and misses per level and the modeled cost in cycles
+    """
+    simulator = CacheSimulator(levels, memory_latency, element_bytes)
+    info.kernel.run(data.copy(), simulator)
+    return CacheReport(
+        algorithm=info.key,
+        size=len(data),
+        distribution=distribution,
+        reads=simulator.reads,
+        writes=simulator.writes,
+        levels=simulator.stats,
+        memory_accesses=simulator.memory_accesses,
+        cycles=simulator.cycles,
+    )
+
+
+def run_cache_benchmark(
+    algorithms: Iterable[str] | None = None,
+    sizes: Iterable[int] = (1000, 10_000),
+    distributions: Iterable[str] = ("Random",),
+    levels: Sequence[CacheLevel] = DEFAULT_HIERARCHY,
+    memory_latency: int = MEMORY_LATENCY,
+    element_bytes: int = ELEMENT_BYTES,
+    seed: int = 0,
+    strings: bool = False,
+) -> list[CacheReport]:
+    """
+    Simulate every algorithm over every size/distribution combination.
+
+    Args:
+        algorithms: Keys of ``ALGORITHMS`` or ``STRING_ALGORITHMS`` (default:
+            ``CACHE_BENCHMARK_ALGORITHMS``, or ``STRING_CACHE_ALGORITHMS``
+            with ``strings``)
+        sizes: Input sizes
+        distributions: Entries of ``DATASET_NAMES``, or of
+            ``STRING_DATASETS`` with ``strings``
+        levels: Cache levels, closest to the core first
+        memory_latency: Cycles for an access that misses every level
+        element_bytes: Bytes per array element
+        seed: Seed for input generation
+        strings: Sort string keys instead of integers
+
+    Returns:
+        One report per configuration
+    """
+    registry: dict[str, AlgorithmInfo[Any]] = {**ALGORITHMS, **STRING_ALGORITHMS}
+    default = STRING_CACHE_ALGORITHMS if strings else CACHE_BENCHMARK_ALGORITHMS
+    make = make_string_dataset if strings else make_dataset
+    reports = []
+    for size in sizes:
+        for dist in distributions:
+            data: list[Any] = make(dist, size, seed)
+            for name in algorithms or default:
+                info = registry[name]
+                reports.append(
+                    simulate_cache(
+                        info, data, dist, levels, memory_latency, element_bytes
+                    )
+                )
+    return reports
+
+
+def main(
+    algorithm: list[str] | None = typer.Option(None, help="Algorithms to simulate"),
+    size: list[int] = typer.Option([1000, 10_000], help="Input sizes (repeatable)"),
+    distribution: list[str] | None = typer.Option(None, help="Input distributions"),
+    level: list[str] | None = typer.Option(
+        None, help="NAME:SIZE:WAYS:LATENCY, closest first (default: L1/L2/L3)"
+    ),
+    line_bytes: int = typer.Option(LINE_BYTES, help="Cache line size in bytes"),
+    memory_latency: int = typer.Option(MEMORY_LATENCY, help="Cycles per memory access"),
+    element_bytes: int = typer.Option(ELEMENT_BYTES, help="Bytes per array element"),
+    seed: int = typer.Option(0, help="Seed for input generation"),
+    strings: bool = typer.Option(False, help="Sort string keys instead"),
+) -> None:
+    """Simulate the cache behavior of the sorting algorithms."""
+    from .benchmark import format_table
+
+    try:
+        levels = [parse_level(spec, line_bytes) for spec in level or []] or [
+            replace(default, line_bytes=line_bytes) for default in DEFAULT_HIERARCHY
+        ]
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--level") from None
+    reports = run_cache_benchmark(
+        algorithm or None,
+        size,
+        distribution or (["URLs"] if strings else ["Random"]),
+        levels,
+        memory_latency,
+        element_bytes,
+        seed,
+        strings,
+    )
+    typer.echo(format_table(reports))
+
+
+if __name__ == "__main__":
+    typer.run(main)
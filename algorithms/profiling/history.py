@@ -0,0 +1,571 @@
+"""
+Persistent benchmark history in SQLite.
+
+Every recorded run stores where it came from: the git revision (plus its
+commit time and subject, and whether the tree was dirty), the machine
+(host, platform, CPU count, Python) and the source ("cli", "app"). Results
+are bulk-inserted beneath it, one row per algorithm, variant, size and
+distribution, with their timing, steps and memory measures. Line profiles
+are stored per line, so a slowdown can be narrowed from "this commit" to
+"this line".
+
+Queries:
+
+- ``trend``: every result matching a filter, oldest first
+- ``by_revision``: best time per configuration and revision, ordered by
+  commit time, so each point on a chart is one commit
+- ``regressions``: consecutive revisions where a configuration got slower
+  by more than a threshold
+
+The database defaults to ``benchmarks.sqlite`` at the repository root;
+set ``SWE_BENCHMARK_DB`` to use another file.
+"""
+
+import os
+import platform
+import subprocess
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import (
+    DateTime,
+    Engine,
+    Float,
+    ForeignKey,
+    Integer,
+    Select,
+    String,
+    create_engine,
+    func,
+    insert,
+    select,
+)
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from .benchmark import BenchmarkResult
+from .line_profiler import LineProfile
+
+DB_ENV = "SWE_BENCHMARK_DB"
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_DB = REPO_ROOT / "benchmarks.sqlite"
+# A configuration whose best time grows by more than this between two
+# revisions is reported as a regression
+REGRESSION_THRESHOLD = 1.2
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class RunRecord(Base):
+    """One recorded benchmark or profiling session."""
+
+    __tablename__ = "runs"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    recorded_at: Mapped[datetime] = mapped_column(DateTime, index=True)
+    source: Mapped[str] = mapped_column(String(32))
+    revision: Mapped[str | None] = mapped_column(String(40), index=True)
+    commit_time: Mapped[datetime | None] = mapped_column(DateTime)
+    commit_subject: Mapped[str | None] = mapped_column(String(200))
+    dirty: Mapped[bool]
+    machine: Mapped[str] = mapped_column(String(255), index=True)
+    platform: Mapped[str] = mapped_column(String(255))
+    processor: Mapped[str] = mapped_column(String(64))
+    cpu_count: Mapped[int]
+    python: Mapped[str] = mapped_column(String(32))
+
+
+class ResultRecord(Base):
+    """Timing and memory of one configuration within a run."""
+
+    __tablename__ = "results"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    run_id: Mapped[int] = mapped_column(ForeignKey("runs.id"), index=True)
+    algorithm: Mapped[str] = mapped_column(String(64), index=True)
+    engine: Mapped[str] = mapped_column(String(32))
+    size: Mapped[int]
+    distribution: Mapped[str] = mapped_column(String(64))
+    time_s: Mapped[float] = mapped_column(Float)
+    steps: Mapped[int | None]
+    peak_bytes: Mapped[int | None]
+    churn_bytes: Mapped[int | None]
+    rss_peak_bytes: Mapped[int | None]
+    inversion_ratio: Mapped[float | None] = mapped_column(Float)
+
+
+class LineRecord(Base):
+    """One source line of a recorded line profile."""
+
+    __tablename__ = "profile_lines"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    run_id: Mapped[int] = mapped_column(ForeignKey("runs.id"), index=True)
+    algorithm: Mapped[str] = mapped_column(String(64), index=True)
+    size: Mapped[int]
+    distribution: Mapped[str] = mapped_column(String(64))
+    function: Mapped[str] = mapped_column(String(128))
+    lineno: Mapped[int] = mapped_column(Integer)
+    line: Mapped[str] = mapped_column(String(255))
+    hits: Mapped[int]
+    time_ns: Mapped[int]
+
+
+# Columns ``trend`` and ``by_revision`` can filter on
+_FILTERS = {
+    "algorithm": ResultRecord.algorithm,
+    "engine": ResultRecord.engine,
+    "size": ResultRecord.size,
+    "distribution": ResultRecord.distribution,
+    "machine": RunRecord.machine,
+}
+
+
+def _filtered(query: Select[Any], filters: dict[str, Any]) -> Select[Any]:
+    for name, value in filters.items():
+        if value is not None:
+            query = query.where(_FILTERS[name] == value)
+    return query
+
+
+@dataclass(frozen=True)
+class GitInfo:
+    """The commit ``HEAD`` points at when a run is recorded."""
+
+    revision: str | None = None
+    commit_time: datetime | None = None
+    subject: str | None = None
+    dirty: bool = False
+
+
+@dataclass(frozen=True)
+class TrendPoint:
+    """One stored result with the run it belongs to."""
+
+    run_id: int
+    recorded_at: datetime
+    revision: str | None
+    machine: str
+    algorithm: str
+    engine: str
+    size: int
+    distribution: str
+    time_s: float
+    steps: int | None
+    peak_bytes: int | None
+
+    def as_row(self) -> dict[str, Any]:
+        return {
+            "Recorded": self.recorded_at,
+            "Revision": (self.revision or "unknown")[:10],
+            "Machine": self.machine,
+            "Algorithm": self.algorithm,
+            "Engine": self.engine,
+            "Size": self.size,
+            "Distribution": self.distribution,
+            "Time (seconds)": self.time_s,
+            "Steps": self.steps,
+            "Peak (KB)": None if self.peak_bytes is None else self.peak_bytes / 1024,
+        }
+
+
+@dataclass(frozen=True)
+class RevisionSummary:
+    """Best time of one configuration at one revision."""
+
+    revision: str | None
+    commit_time: datetime | None
+    subject: str | None
+    algorithm: str
+    engine: str
+    size: int
+    distribution: str
+    best_time_s: float
+    samples: int
+    first_recorded: datetime
+
+    @property
+    def config(self) -> tuple[str, str, int, str]:
+        return (self.algorithm, self.engine, self.size, self.distribution)
+
+    def as_row(self) -> dict[str, Any]:
+        return {
+            "Revision": (self.revision or "unknown")[:10],
+            "Commit": self.subject,
+            "Committed": self.commit_time,
+            "Algorithm": self.algorithm,
+            "Engine": self.engine,
+            "Size": self.size,
+            "Distribution": self.distribution,
+            "Best Time (seconds)": self.best_time_s,
+            "Samples": self.samples,
+        }
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A configuration that got slower from one revision to the next."""
+
+    before: RevisionSummary
+    after: RevisionSummary
+
+    @property
+    def ratio(self) -> float:
+        return self.after.best_time_s / max(self.before.best_time_s, 1e-12)
+
+    def as_row(self) -> dict[str, Any]:
+        return {
+            "Algorithm": self.after.algorithm,
+            "Engine": self.after.engine,
+            "Size": self.after.size,
+            "Distribution": self.after.distribution,
+            "From": (self.before.revision or "unknown")[:10],
+            "To": (self.after.revision or "unknown")[:10],
+            "Commit": self.after.subject,
+            "Slowdown": f"{self.ratio:.2f}x",
+        }
+
+
+def git_info(cwd: Path = REPO_ROOT) -> GitInfo:
+    """Revision, commit time and subject of ``HEAD``; empty outside a repo."""
+
+    def git(*args: str) -> str:
+        return subprocess.run(
+            ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+        ).stdout
+
+    try:
+        revision, timestamp, subject = (
+            git("log", "-1", "--format=%H%x00%ct%x00%s").strip().split("\0", 2)
+        )
+        dirty = bool(git("status", "--porcelain", "--untracked-files=no").strip())
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return GitInfo()
+    return GitInfo(
+        revision=revision,
+        commit_time=datetime.fromtimestamp(int(timestamp), UTC).replace(tzinfo=None),
+        subject=subject[:200],
+        dirty=dirty,
+    )
+
+
+def machine_info() -> dict[str, Any]:
+    """Host, platform, CPU and interpreter of this process."""
+    return {
+        "machine": platform.node() or "unknown",
+        "platform": platform.platform(),
+        "processor": platform.machine() or "unknown",
+        "cpu_count": os.cpu_count() or 1,
+        "python": platform.python_version(),
+    }
+
+
+def default_db_path() -> Path:
+    """``SWE_BENCHMARK_DB`` if set, else ``benchmarks.sqlite`` at the repo root."""
+    return Path(os.environ.get(DB_ENV) or DEFAULT_DB)
+
+
+class HistoryStore:
+    """Benchmark and profiling history in one SQLite database."""
+
+    def __init__(self, path: Path | str | None = None) -> None:
+        """
+        Open (and create if needed) the history database.
+
+        Args:
+            path: Database file (default: ``default_db_path()``)
+        """
+        self.path = Path(path) if path is not None else default_db_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.engine: Engine = create_engine(f"sqlite:///{self.path}")
+        Base.metadata.create_all(self.engine)
+
+    def close(self) -> None:
+        self.engine.dispose()
+
+    def _start_run(
+        self, session: Session, source: str, git: GitInfo | None
+    ) -> RunRecord:
+        git = git_info() if git is None else git
+        run = RunRecord(
+            recorded_at=datetime.now(UTC).replace(tzinfo=None),
+            source=source,
+            revision=git.revision,
+            commit_time=git.commit_time,
+            commit_subject=git.subject,
+            dirty=git.dirty,
+            **machine_info(),
+        )
+        session.add(run)
+        session.flush()  # Assigns run.id for the bulk insert below
+        return run
+
+    def record(
+        self,
+        results: Iterable[BenchmarkResult],
+        source: str = "cli",
+        git: GitInfo | None = None,
+    ) -> int:
+        """
+        Store benchmark results as one run.
+
+        Args:
+            results: Results from ``run_benchmark`` (or built alike)
+            source: Where they were measured, e.g. "cli" or "app"
+            git: Revision to file them under (default: the current ``HEAD``)
+
+        Returns:
+            The new run's id
+        """
+        with Session(self.engine) as session, session.begin():
+            run = self._start_run(session, source, git)
+            rows = [
+                {
+                    "run_id": run.id,
+                    "algorithm": r.algorithm,
+                    "engine": r.variant,
+                    "size": r.size,
+                    "distribution": r.distribution,
+                    "time_s": r.time_s,
+                    "steps": r.steps,
+                    "peak_bytes": r.memory.peak_bytes if r.memory else None,
+                    "churn_bytes": r.memory.churn_bytes if r.memory else None,
+                    "rss_peak_bytes": r.memory.rss_peak_bytes if r.memory else None,
+                    "inversion_ratio": (
+                        r.presortedness.inversion_ratio if r.presortedness else None
+                    ),
+                }
+                for r in results
+            ]
+            if rows:
+                session.execute(insert(ResultRecord), rows)
+            return run.id
+
+    def record_profile(
+        self,
+        profile: LineProfile,
+        algorithm: str,
+        size: int,
+        distribution: str,
+        source: str = "app",
+        git: GitInfo | None = None,
+    ) -> int:
+        """
+        Store a line profile as one run.
+
+        Args:
+            profile: Result of ``profile_lines``
+            algorithm: Key of the profiled algorithm
+            size: Input size
+            distribution: Input distribution
+            source: Where it was measured
+            git: Revision to file it under (default: the current ``HEAD``)
+
+        Returns:
+            The new run's id
+        """
+        with Session(self.engine) as session, session.begin():
+            run = self._start_run(session, source, git)
+            rows = [
+                {
+                    "run_id": run.id,
+                    "algorithm": algorithm,
+                    "size": size,
+                    "distribution": distribution,
+                    "function": profile.name,
+                    "lineno": line.lineno,
+                    "line": line.source[:255],
+                    "hits": line.hits,
+                    "time_ns": line.time_ns,
+                }
+                for line in profile.lines
+            ]
+            if rows:
+                session.execute(insert(LineRecord), rows)
+            return run.id
+
+    def trend(
+        self,
+        algorithm: str | None = None,
+        engine: str | None = None,
+        size: int | None = None,
+        distribution: str | None = None,
+        machine: str | None = None,
+    ) -> list[TrendPoint]:
+        """
+        Every stored result matching the filters, oldest first.
+
+        Args:
+            algorithm: Only this algorithm
+            engine: Only this variant ("plain", "traced")
+            size: Only this input size
+            distribution: Only this distribution
+            machine: Only runs from this host
+
+        Returns:
+            One point per stored result
+        """
+        query = _filtered(
+            select(
+                RunRecord.id,
+                RunRecord.recorded_at,
+                RunRecord.revision,
+                RunRecord.machine,
+                ResultRecord.algorithm,
+                ResultRecord.engine,
+                ResultRecord.size,
+                ResultRecord.distribution,
+                ResultRecord.time_s,
+                ResultRecord.steps,
+                ResultRecord.peak_bytes,
+            ).join(RunRecord, ResultRecord.run_id == RunRecord.id),
+            {
+                "algorithm": algorithm,
+                "engine": engine,
+                "size": size,
+                "distribution": distribution,
+                "machine": machine,
+            },
+        ).order_by(RunRecord.recorded_at, ResultRecord.id)
+        with Session(self.engine) as session:
+            return [TrendPoint(*row) for row in session.execute(query)]
+
+    def by_revision(
+        self,
+        algorithm: str | None = None,
+        engine: str | None = None,
+        size: int | None = None,
+        distribution: str | None = None,
+        machine: str | None = None,
+    ) -> list[RevisionSummary]:
+        """
+        Best time per configuration and revision, in commit order.
+
+        The minimum over repeated runs is the least noisy estimate of what a
+        revision can do; runs outside a git checkout share one "unknown"
+        revision.
+
+        Args:
+            algorithm: Only this algorithm
+            engine: Only this variant ("plain", "traced")
+            size: Only this input size
+            distribution: Only this distribution
+            machine: Only runs from this host
+
+        Returns:
+            One summary per revision and configuration
+        """
+        first_recorded = func.min(RunRecord.recorded_at)
+        query = (
+            _filtered(
+                select(
+                    RunRecord.revision,
+                    func.max(RunRecord.commit_time),
+                    func.max(RunRecord.commit_subject),
+                    ResultRecord.algorithm,
+                    ResultRecord.engine,
+                    ResultRecord.size,
+                    ResultRecord.distribution,
+                    func.min(ResultRecord.time_s),
+                    func.count(),
+                    first_recorded,
+                ).join(RunRecord, ResultRecord.run_id == RunRecord.id),
+                {
+                    "algorithm": algorithm,
+                    "engine": engine,
+                    "size": size,
+                    "distribution": distribution,
+                    "machine": machine,
+                },
+            )
+            .group_by(
+                RunRecord.revision,
+                ResultRecord.algorithm,
+                ResultRecord.engine,
+                ResultRecord.size,
+                ResultRecord.distribution,
+            )
+            .order_by(func.max(RunRecord.commit_time), first_recorded)
+        )
+        with Session(self.engine) as session:
+            return [RevisionSummary(*row) for row in session.execute(query)]
+
+    def regressions(
+        self, threshold: float = REGRESSION_THRESHOLD, **filters: Any
+    ) -> list[Regression]:
+        """
+        Revisions after which a configuration got slower.
+
+        Args:
+            threshold: Minimum ratio of best times to report, e.g. 1.2 for 20%
+            **filters: Passed to ``by_revision``
+
+        Returns:
+            One entry per slowdown, in commit order
+        """
+        previous: dict[tuple[str, str, int, str], RevisionSummary] = {}
+        found = []
+        for summary in self.by_revision(**filters):
+            before = previous.get(summary.config)
+            if before is not None:
+                regression = Regression(before, summary)
+                if regression.ratio > threshold:
+                    found.append(regression)
+            previous[summary.config] = summary
+        return found
+
+    def line_history(
+        self, algorithm: str, size: int | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Stored line profiles of ``algorithm``, one row per line per run.
+
+        Args:
+            algorithm: Algorithm key
+            size: Only profiles of this input size
+
+        Returns:
+            Rows with the run's revision and the line's hits and time
+        """
+        query = (
+            select(
+                RunRecord.id.label("Run"),
+                RunRecord.recorded_at.label("Recorded"),
+                func.coalesce(func.substr(RunRecord.revision, 1, 10), "unknown").label(
+                    "Revision"
+                ),
+                LineRecord.size.label("Size"),
+                LineRecord.function.label("Function"),
+                LineRecord.lineno.label("Line"),
+                LineRecord.line.label("Source"),
+                LineRecord.hits.label("Hits"),
+                (LineRecord.time_ns / 1e6).label("Time (ms)"),
+            )
+            .join(RunRecord, LineRecord.run_id == RunRecord.id)
+            .where(LineRecord.algorithm == algorithm)
+            .order_by(RunRecord.recorded_at, LineRecord.lineno)
+        )
+        if size is not None:
+            query = query.where(LineRecord.size == size)
+        with Session(self.engine) as session:
+            return [dict(row._mapping) for row in session.execute(query)]
+
+    def facets(self) -> dict[str, list[Any]]:
+        """Distinct values of each filter, for building query forms."""
+        with Session(self.engine) as session:
+            return {
+                name: list(
+                    session.scalars(
+                        select(column)
+                        .select_from(ResultRecord)
+                        .join(RunRecord, ResultRecord.run_id == RunRecord.id)
+                        .distinct()
+                        .order_by(column)
+                    )
+                )
+                for name, column in _FILTERS.items()
+            }
@@ -0,0 +1,180 @@
+"""
+Line-level hot-path profiler built on ``sys.monitoring`` (PEP 669).
+
+Only the code objects of the profiled function (and the sorting kernels it
+calls) get LINE events enabled, so unrelated code runs at full speed. The
+time between two consecutive line events is charged to the earlier line,
+which includes any unmonitored callees such as ``list.append``.
+"""
+
+import inspect
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import CodeType, FunctionType
+from typing import Any
+
+from algorithms.sorting.tracing import Kernel
+
+LineKey = tuple[str, int]
+
+
+@dataclass
+class LineStats:
+    """Execution count and time for one source line."""
+
+    lineno: int
+    source: str
+    hits: int = 0
+    time_ns: int = 0
+
+
+@dataclass
+class LineProfile:
+    """Per-line results for the source of the profiled functions."""
+
+    name: str
+    filename: str
+    lines: list[LineStats]
+
+    @property
+    def total_time_ns(self) -> int:
+        return sum(line.time_ns for line in self.lines)
+
+    def hottest(self, n: int = 5) -> list[LineStats]:
+        """The ``n`` lines with the most time charged to them."""
+        executed = [line for line in self.lines if line.hits]
+        return sorted(executed, key=lambda line: line.time_ns, reverse=True)[:n]
+
+    def as_rows(self) -> list[dict[str, Any]]:
+        """Rows suitable for a table or DataFrame."""
+        total = self.total_time_ns or 1
+        return [
+            {
+                "Line": line.lineno,
+                "Hits": line.hits,
+                "Time (ms)": line.time_ns / 1e6,
+                "Time %": 100.0 * line.time_ns / total,
+                "Source": line.source,
+            }
+            for line in self.lines
+        ]
+
+
+def _code_objects(code: CodeType) -> list[CodeType]:
+    """A code object and every code object nested in it."""
+    codes = [code]
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            codes.extend(_code_objects(const))
+    return codes
+
+
+def _resolve(target: Callable[..., Any] | Kernel) -> list[tuple[Any, CodeType]]:
+    """
+    Pair each function to display with the code object that actually runs.
+
+    Kernels run their plain variant, whose line numbers match the kernel's
+    source. Public sorts also pull in the kernels they call.
+    """
+    if isinstance(target, Kernel):
+        return [(target.traced, target.plain.__code__)]
+    if not isinstance(target, FunctionType):
+        raise TypeError(f"cannot profile {target!r}: not a Python function")
+
+    pairs: list[tuple[Any, CodeType]] = [(target, target.__code__)]
+    for name in target.__code__.co_names:
+        obj = target.__globals__.get(name)
+        if isinstance(obj, Kernel):
+            pairs.append((obj.traced, obj.plain.__code__))
+    return pairs
+
+
+class _LineTimer:
+    """``sys.monitoring`` LINE callback accumulating hits and time."""
+
+    def __init__(self) -> None:
+        self.hits: defaultdict[LineKey, int] = defaultdict(int)
+        self.times: defaultdict[LineKey, int] = defaultdict(int)
+        self._last: LineKey | None = None
+        self._last_ns = 0
+
+    def on_line(self, code: CodeType, lineno: int) -> None:
+        now = time.perf_counter_ns()
+        if self._last is not None:
+            self.times[self._last] += now - self._last_ns
+        key = (code.co_filename, lineno)
+        self.hits[key] += 1
+        self._last = key
+        # Start the next interval after our own bookkeeping
+        self._last_ns = time.perf_counter_ns()
+
+    def flush(self) -> None:
+        if self._last is not None:
+            self.times[self._last] += time.perf_counter_ns() - self._last_ns
+            self._last = None
+
+
+def profile_lines(
+    target: Callable[..., Any] | Kernel, *args: Any, **kwargs: Any
+) -> tuple[Any, LineProfile]:
+    """
+    Call ``target`` with per-line execution counts and timing.
+
+    Args:
+        target: Function from ``algorithms.sorting`` (or a Kernel) to profile
+        *args: Positional arguments for the call
+        **kwargs: Keyword arguments for the call
+
+    Returns:
+        The call's return value and the line profile
+    """
+    monitoring = sys.monitoring
+    pairs = _resolve(target)
+    codes = [c for _, code in pairs for c in _code_objects(code)]
+    tool = monitoring.PROFILER_ID
+    try:
+        monitoring.use_tool_id(tool, "swe-mastery-line-profiler")
+    except ValueError as e:
+        raise RuntimeError(f"sys.monitoring profiler slot is busy: {e}") from e
+
+    timer = _LineTimer()
+    try:
+        monitoring.register_callback(tool, monitoring.events.LINE, timer.on_line)
+        for code in codes:
+            monitoring.set_local_events(tool, code, monitoring.events.LINE)
+        monitoring.restart_events()
+        result: Any = None  # Kernels sort their argument in place
+        if isinstance(target, Kernel):
+            target.run(*args, **kwargs)
+        else:
+            result = target(*args, **kwargs)
+        timer.flush()
+    finally:
+        for code in codes:
+            monitoring.set_local_events(tool, code, 0)
+        monitoring.register_callback(tool, monitoring.events.LINE, None)
+        monitoring.free_tool_id(tool)
+
+    lines: list[LineStats] = []
+    filename = inspect.getsourcefile(pairs[0][0]) or pairs[0][1].co_filename
+    for source_obj, code in sorted(pairs, key=lambda p: p[1].co_firstlineno):
+        source_lines, start = inspect.getsourcelines(source_obj)
+        for offset, text in enumerate(source_lines):
+            key = (code.co_filename, start + offset)
+            lines.append(
+                LineStats(
+                    lineno=start + offset,
+                    source=text.rstrip(),
+                    hits=timer.hits.get(key, 0),
+                    time_ns=timer.times.get(key, 0),
+                )
+            )
+
+    if isinstance(target, Kernel):
+        name = target.name
+    else:
+        name = getattr(target, "__name__", repr(target))
+    return result, LineProfile(name=name, filename=filename, lines=lines)
@@ -0,0 +1,123 @@
+"""
+Memory footprint profiling based on ``tracemalloc`` and RSS sampling.
+
+``measure_memory`` runs a call under ``tracemalloc`` while a sampler thread
+polls the traced size and the process RSS:
+
+- ``peak_bytes``: exact tracemalloc peak above the level at call start
+- ``churn_bytes``: allocation churn, summed per sampling interval as
+  ``peak - level at interval start``. It is a lower bound on cumulative
+  allocation, since blocks allocated and freed within one interval below
+  an earlier peak are not seen.
+- ``rss_peak_bytes``: highest sampled RSS growth over the start of the call
+"""
+
+import resource
+import sys
+import threading
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+_STATM = Path("/proc/self/statm")
+_PAGE_SIZE = resource.getpagesize()
+
+
+def current_rss_bytes() -> int:
+    """Resident set size of this process, in bytes."""
+    try:
+        return int(_STATM.read_text().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        # No procfs: fall back to the lifetime high-water mark
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+@dataclass
+class MemoryReport:
+    """Memory used by one call."""
+
+    peak_bytes: int
+    churn_bytes: int
+    rss_peak_bytes: int
+    samples: int
+
+    def as_row(self) -> dict[str, float]:
+        return {
+            "Peak (KB)": self.peak_bytes / 1024,
+            "Churn (KB)": self.churn_bytes / 1024,
+            "RSS Peak (KB)": self.rss_peak_bytes / 1024,
+        }
+
+
+class _Sampler(threading.Thread):
+    """Background thread polling tracemalloc and RSS until stopped."""
+
+    def __init__(self, interval: float) -> None:
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.baseline = tracemalloc.get_traced_memory()[0]
+        self.peak = self.baseline
+        self.churn = 0
+        self.samples = 0
+        self.rss_start = current_rss_bytes()
+        self.rss_peak = self.rss_start
+        self._level = self.baseline
+        self._done = threading.Event()
+
+    def sample(self) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        # Resetting makes the next reading the peak of the next interval
+        tracemalloc.reset_peak()
+        self.peak = max(self.peak, peak)
+        self.churn += max(0, peak - self._level)
+        self._level = current
+        self.rss_peak = max(self.rss_peak, current_rss_bytes())
+        self.samples += 1
+
+    def run(self) -> None:
+        while not self._done.wait(self.interval):
+            self.sample()
+
+    def stop(self) -> None:
+        self._done.set()
+        self.join()
+        self.sample()
+
+
+def measure_memory(
+    func: Callable[..., Any], *args: Any, sample_interval: float = 0.001
+) -> tuple[Any, MemoryReport]:
+    """
+    Call ``func(*args)`` and report its memory footprint.
+
+    Args:
+        func: Function to measure
+        *args: Arguments for the call
+        sample_interval: Seconds between churn/RSS samples
+
+    Returns:
+        The call's return value and its memory report
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+
+    sampler = _Sampler(sample_interval)
+    sampler.start()
+    try:
+        result = func(*args)
+    finally:
+        sampler.stop()
+        if not was_tracing:
+            tracemalloc.stop()
+
+    return result, MemoryReport(
+        peak_bytes=sampler.peak - sampler.baseline,
+        churn_bytes=sampler.churn,
+        rss_peak_bytes=sampler.rss_peak - sampler.rss_start,
+        samples=sampler.samples,
+    )
@@ -0,0 +1,13 @@
+"""
+HTTP service exposing the sorting algorithms and their traces.
+
+The FastAPI application lives in ``algorithms.service.app``; the load test
+in ``algorithms.service.loadtest``.
+"""
+
+from .app import SortBatcher, app
+
+__all__ = [
+    "SortBatcher",
+    "app",
+]
@@ -0,0 +1,15 @@
+"""Command-line entry point: ``python -m algorithms.service``."""
+
+import typer
+import uvicorn
+
+
+def main(
+    host: str = typer.Option("127.0.0.1", help="Interface to bind"),
+    port: int = typer.Option(8000, help="Port to listen on"),
+) -> None:
+    """Serve the sorting API with uvicorn."""
+    uvicorn.run("algorithms.service.app:app", host=host, port=port)
+
+
+typer.run(main)
@@ -0,0 +1,227 @@
+"""
+HTTP service for the sorting algorithms and their traces.
+
+Endpoints:
+
+- ``POST /sort``: JSON ``{"algorithm": ..., "data": [...]}``, or raw
+  little-endian int64 with ``Content-Type: application/octet-stream`` and
+  ``?algorithm=``; the response uses the same encoding as the request
+- ``POST /trace``: JSON ``{"algorithm": ..., "data": [...], "max_steps": ...}``,
+  streamed back as NDJSON, one step per line, while it is generated; at
+  most ``TRACE_MAX_STEPS`` steps, ``TRACE_DEFAULT_MAX_STEPS`` if not given
+
+All sorting and tracing runs in a process pool, so the event loop only
+parses, dispatches and streams. Small sort requests for the O(n log n)
+engines arriving within a few milliseconds of each other share one trip to
+a worker; O(n²) algorithms are never batched and are capped at
+``QUADRATIC_MAX_ELEMENTS`` values.
+
+Usage:
+    python -m algorithms.service --port 8000
+"""
+
+import asyncio
+import multiprocessing
+import os
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, Literal
+
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
+
+from algorithms import sorting
+
+from . import workers
+
+if TYPE_CHECKING:
+    Algorithm = str
+    TraceAlgorithm = str
+else:
+    # Built from the registry so that new engines are accepted everywhere
+    Algorithm = Literal[workers.ALGORITHMS]
+    TraceAlgorithm = Literal[tuple(sorting.ALGORITHMS)]
+
+# Requests up to this many elements are batched, unless quadratic
+BATCH_MAX_ELEMENTS = 10_000
+BATCH_MAX_REQUESTS = 64
+BATCH_WINDOW_S = 0.002
+# Tracing is O(steps x n); refuse inputs the visualizer would not trace either
+TRACE_MAX_ELEMENTS = 2_000
+# Every step carries the whole array, so a trace is O(max_steps x n) bytes
+TRACE_DEFAULT_MAX_STEPS = 5_000
+TRACE_MAX_STEPS = 20_000
+# O(n²) sorts beyond this would pin a pool worker for minutes to hours
+QUADRATIC_MAX_ELEMENTS = 5_000
+QUADRATIC_ALGORITHMS = frozenset(
+    key for key, info in sorting.ALGORITHMS.items() if info.time_complexity == "O(n²)"
+)
+BINARY_MEDIA_TYPE = "application/octet-stream"
+
+
+class SortRequest(BaseModel):
+    algorithm: Algorithm = "quick_sort"
+    data: list[int]
+
+
+class SortResponse(BaseModel):
+    algorithm: Algorithm
+    data: list[int]
+
+
+class TraceRequest(BaseModel):
+    algorithm: TraceAlgorithm = "quick_sort"
+    data: list[int] = Field(max_length=TRACE_MAX_ELEMENTS)
+    max_steps: int = Field(default=TRACE_DEFAULT_MAX_STEPS, ge=2, le=TRACE_MAX_STEPS)
+
+
+class SortBatcher:
+    """Coalesce small sort requests into one process-pool task."""
+
+    def __init__(
+        self,
+        pool: ProcessPoolExecutor,
+        window_s: float = BATCH_WINDOW_S,
+        max_requests: int = BATCH_MAX_REQUESTS,
+    ) -> None:
+        self.pool = pool
+        self.window_s = window_s
+        self.max_requests = max_requests
+        self.batches = 0
+        self._pending: list[tuple[str, list[int], asyncio.Future[list[int]]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+
+    async def sort(self, algorithm: str, data: list[int]) -> list[int]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[int]] = loop.create_future()
+        self._pending.append((algorithm, data, future))
+        if len(self._pending) >= self.max_requests:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window_s, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        self.batches += 1
+        task = asyncio.get_running_loop().run_in_executor(
+            self.pool, workers.sort_batch, [(alg, data) for alg, data, _ in batch]
+        )
+
+        def deliver(done: asyncio.Future[list[list[int]]]) -> None:
+            error = done.exception()
+            for i, (_, _, future) in enumerate(batch):
+                if future.cancelled():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(done.result()[i])
+
+        task.add_done_callback(deliver)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    workers_count = int(os.environ.get("SWE_SERVICE_WORKERS", "0")) or None
+    pool = ProcessPoolExecutor(max_workers=workers_count)
+    manager = multiprocessing.Manager()
+    app.state.pool = pool
+    app.state.manager = manager
+    app.state.batcher = SortBatcher(pool)
+    try:
+        yield
+    finally:
+        pool.shutdown(cancel_futures=True)
+        manager.shutdown()
+
+
+app = FastAPI(title="Sorting Service", lifespan=lifespan)
+
+
+@app.get("/health")
+async def health() -> dict[str, Any]:
+    return {"status": "ok", "algorithms": list(workers.ALGORITHMS)}
+
+
+def _check_size(algorithm: str, count: int) -> None:
+    if algorithm in QUADRATIC_ALGORITHMS and count > QUADRATIC_MAX_ELEMENTS:
+        raise HTTPException(
+            413,
+            f"{algorithm} is O(n²); send at most {QUADRATIC_MAX_ELEMENTS:,} "
+            "values or use an O(n log n) algorithm",
+        )
+
+
+@app.post("/sort", response_model=SortResponse)
+async def sort(
+    request: Request, algorithm: Algorithm = Query("quick_sort")
+) -> Response | SortResponse:
+    """Sort JSON or raw int64 input with the chosen algorithm."""
+    body = await request.body()
+    loop = asyncio.get_running_loop()
+
+    if request.headers.get("content-type", "").startswith(BINARY_MEDIA_TYPE):
+        if len(body) % 8:
+            raise HTTPException(400, "binary input must be a whole number of int64")
+        _check_size(algorithm, len(body) // 8)
+        payload = await loop.run_in_executor(
+            app.state.pool, workers.sort_binary, algorithm, body
+        )
+        return Response(payload, media_type=BINARY_MEDIA_TYPE)
+
+    try:
+        parsed = SortRequest.model_validate_json(body)
+    except ValidationError as e:
+        raise HTTPException(422, e.errors(include_url=False)) from None
+    _check_size(parsed.algorithm, len(parsed.data))
+    if (
+        len(parsed.data) <= BATCH_MAX_ELEMENTS
+        and parsed.algorithm not in QUADRATIC_ALGORITHMS
+    ):
+        result = await app.state.batcher.sort(parsed.algorithm, parsed.data)
+    else:
+        result = await loop.run_in_executor(
+            app.state.pool, workers.sort_values, parsed.algorithm, parsed.data
+        )
+    return SortResponse(algorithm=parsed.algorithm, data=result)
+
+
+@app.post("/trace")
+async def trace(body: TraceRequest, request: Request) -> StreamingResponse:
+    """Stream the algorithm's visualization steps as NDJSON."""
+    queue = app.state.manager.Queue()
+    cancel = app.state.manager.Event()
+    loop = asyncio.get_running_loop()
+    job = loop.run_in_executor(
+        app.state.pool,
+        workers.stream_trace,
+        body.algorithm,
+        body.data,
+        body.max_steps,
+        queue,
+        cancel,
+    )
+
+    async def lines() -> AsyncIterator[str]:
+        try:
+            while True:
+                # Blocking get in a thread keeps the event loop free
+                chunk = await loop.run_in_executor(None, queue.get)
+                if chunk is None:
+                    break
+                yield chunk
+                if await request.is_disconnected():
+                    break
+        finally:
+            cancel.set()
+            await job
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
@@ -0,0 +1,91 @@
+"""
+Load test for the sorting service.
+
+Fires ``requests`` sort calls at ``concurrency`` in flight and reports
+throughput and latency percentiles.
+
+Usage:
+    python -m algorithms.service.loadtest --url http://127.0.0.1:8000 --size 100
+"""
+
+import asyncio
+import random
+import statistics
+import time
+
+import httpx
+import numpy as np
+import typer
+
+
+async def run_load(
+    url: str,
+    requests: int,
+    concurrency: int,
+    size: int,
+    algorithm: str,
+    binary: bool,
+) -> tuple[list[float], float]:
+    """
+    Send ``requests`` sort calls, ``concurrency`` at a time.
+
+    Returns:
+        Per-request latencies in seconds and the total wall time
+    """
+    rng = random.Random(0)
+    payloads = [[rng.randint(1, 1_000_000) for _ in range(size)] for _ in range(16)]
+    latencies: list[float] = []
+    remaining = iter(range(requests))
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        for i in remaining:
+            data = payloads[i % len(payloads)]
+            start = time.perf_counter()
+            if binary:
+                response = await client.post(
+                    "/sort",
+                    params={"algorithm": algorithm},
+                    content=np.asarray(data, dtype="<i8").tobytes(),
+                    headers={"content-type": "application/octet-stream"},
+                )
+            else:
+                response = await client.post(
+                    "/sort", json={"algorithm": algorithm, "data": data}
+                )
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        wall = time.perf_counter() - start
+    return latencies, wall
+
+
+def percentile(values: list[float], q: float) -> float:
+    """The ``q``-th percentile (0-100) of ``values``."""
+    return float(np.percentile(values, q)) if values else 0.0
+
+
+def main(
+    url: str = typer.Option("http://127.0.0.1:8000", help="Service base URL"),
+    requests: int = typer.Option(2000, help="Total requests"),
+    concurrency: int = typer.Option(32, help="Requests in flight"),
+    size: int = typer.Option(100, help="Elements per request"),
+    algorithm: str = typer.Option("quick_sort", help="Algorithm to request"),
+    binary: bool = typer.Option(False, help="Send raw int64 instead of JSON"),
+) -> None:
+    """Load-test /sort and report throughput and p50/p99 latency."""
+    latencies, wall = asyncio.run(
+        run_load(url, requests, concurrency, size, algorithm, binary)
+    )
+    typer.echo(f"Requests:   {len(latencies):,} in {wall:.2f}s")
+    typer.echo(f"Throughput: {len(latencies) / wall:,.1f} req/s")
+    typer.echo(f"Mean:       {statistics.fmean(latencies) * 1000:.2f} ms")
+    typer.echo(f"p50:        {percentile(latencies, 50) * 1000:.2f} ms")
+    typer.echo(f"p99:        {percentile(latencies, 99) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    typer.run(main)
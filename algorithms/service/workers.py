@@ -0,0 +1,148 @@
+"""
+CPU-bound work run inside the service's worker processes.
+
+Everything here is a module-level function so it can be sent to a
+``ProcessPoolExecutor``. Nothing in this module touches the event loop.
+"""
+
+import json
+import math
+import time
+from typing import Any
+
+import numpy as np
+
+from algorithms import sorting
+from algorithms.sorting.tracing import StepRecorder
+
+# Python sorting algorithms, NumPy's sort as the bulk engine, and the
+# dispatcher that picks between engines per input
+ALGORITHMS = (*sorting.ALGORITHMS, "numpy", "auto")
+# Steps per NDJSON chunk handed back to the event loop
+STREAM_CHUNK_STEPS = 64
+STREAM_CHUNK_SECONDS = 0.05
+
+
+def sort_values(algorithm: str, data: list[int]) -> list[int]:
+    """Sort a list with one of ``ALGORITHMS``."""
+    if algorithm == "numpy":
+        result: list[int] = np.sort(np.asarray(data, dtype=np.int64)).tolist()
+        return result
+    if algorithm == "auto":
+        return sorting.auto_sort(data)
+    result = sorting.get_algorithm(algorithm).sort_func(data)
+    return result
+
+
+def sort_batch(requests: list[tuple[str, list[int]]]) -> list[list[int]]:
+    """Sort several small requests in one round trip to a worker."""
+    return [sort_values(algorithm, data) for algorithm, data in requests]
+
+
+def sort_binary(algorithm: str, payload: bytes) -> bytes:
+    """Sort raw little-endian int64 values and return them in the same format."""
+    values = np.frombuffer(payload, dtype="<i8")
+    if algorithm == "numpy":
+        return np.sort(values).astype("<i8").tobytes()
+    return np.asarray(sort_values(algorithm, values.tolist()), dtype="<i8").tobytes()
+
+
+class StreamingRecorder(StepRecorder):
+    """
+    Step recorder that ships steps to a queue in NDJSON chunks.
+
+    Steps are dropped once sent, so memory stays at one chunk. Streamed steps
+    cannot be thinned later, so a step budget works forward instead: the
+    swap stride is fixed up front from the predicted trace length, and each
+    time half of the remaining budget has been sent, the stride of whichever
+    sampled kind (swaps or milestones) sent more since quadruples, so each
+    stretch covers twice as much of the trace as the one before. A trace
+    that outgrows its prediction starts decimating at the first such point.
+    Once only the final step's share is left, everything else is skipped, so
+    ``max_steps`` of at least two is a hard bound on the lines sent.
+    """
+
+    def __init__(self, queue: Any, cancel_event: Any, max_steps: int | None) -> None:
+        super().__init__(max_steps=max_steps)
+        self.queue = queue
+        self.cancel_event = cancel_event
+        self.sent = 0
+        self._lines: list[str] = []
+        self._last_flush = time.monotonic()
+        self._checkpoint = (max_steps - 1) // 2 if max_steps else 0
+
+    def on_start(self, data: list[int]) -> None:
+        super().on_start(data)
+        if self.decimate and self.expected_steps and self.max_steps:
+            # Predicted swaps fill the budget up to the first checkpoint
+            self.swap_stride = math.ceil(self.expected_steps / max(1, self._checkpoint))
+
+    def _add(
+        self,
+        highlights: list[int],
+        description: str,
+        kind: str,
+        sample: str | None = None,
+    ) -> None:
+        if self.max_steps and sample is not None and self.sent >= self.max_steps - 1:
+            # Only the final step is still within budget
+            self._skip("swaps" if sample == "swaps" else "events")
+            return
+        super()._add(highlights, description, kind, sample)
+        if self.max_steps and self.sent >= self._checkpoint:
+            self._tighten()
+
+    def _tighten(self) -> None:
+        """Halve the rate of the kind that filled the budget since last time."""
+        if not self.decimate:
+            self.decimate = True
+        else:
+            counts = self._sample_counts
+            if counts["milestones"] >= counts["swaps"]:
+                self.milestone_stride *= 4
+            else:
+                self.swap_stride *= 4
+        self._sample_counts = {"swaps": 0, "milestones": 0}
+        remaining = (self.max_steps or 0) - 1 - self.sent
+        self._checkpoint = self.sent + max(1, remaining // 2)
+
+    def _append(self, step: dict[str, Any], sample: str | None) -> None:
+        self._lines.append(json.dumps({"index": self.sent, **step}))
+        self.sent += 1
+        if sample is not None:
+            self._sample_counts[sample] += 1
+        if (
+            len(self._lines) >= STREAM_CHUNK_STEPS
+            or time.monotonic() - self._last_flush > STREAM_CHUNK_SECONDS
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        # Checked per chunk: the event is a proxy and each check is a round trip
+        if self.cancel_event.is_set():
+            raise InterruptedError("client disconnected")
+        if self._lines:
+            self.queue.put("\n".join(self._lines) + "\n")
+            self._lines = []
+        self._last_flush = time.monotonic()
+
+
+def stream_trace(
+    algorithm: str,
+    data: list[int],
+    max_steps: int | None,
+    queue: Any,
+    cancel_event: Any,
+) -> None:
+    """Generate a trace, streaming NDJSON chunks and a final summary line."""
+    recorder = StreamingRecorder(queue, cancel_event, max_steps)
+    try:
+        sorting.get_algorithm(algorithm).steps_func(data, recorder=recorder)
+        recorder.flush()
+        queue.put(json.dumps({"done": True, "steps": recorder.sent}) + "\n")
+    except InterruptedError:
+        pass
+    except Exception as e:  # Report to the client instead of a broken stream
+        queue.put(json.dumps({"error": str(e)}) + "\n")
+    finally:
+        queue.put(None)
@@ -1,23 +1,122 @@
 """
 Sorting algorithms package for the SWE Mastery Journey.
 Contains implementations of fundamental sorting algorithms with step-by-step tracking.
+
+``ALGORITHMS`` describes every algorithm, ``STRING_ALGORITHMS`` the radix
+engines for ``str`` and ``bytes`` keys, and ``auto_sort`` picks the fastest
+engine for a given input. Each ``<name>_inplace`` variant sorts a list,
+``array.array`` or NumPy array in place without copying it. The functions
+and tracing classes below are imported from their modules on first access,
+so importing the package (or reading the table) stays cheap. The modules
+behind them are private (``_merge_sort`` and so on), so importing one never
+shadows the function of the same name on the package.
 """
 
-from .bubble_sort import bubble_sort, bubble_sort_with_steps
-from .insertion_sort import insertion_sort, insertion_sort_with_steps
-from .merge_sort import merge_sort, merge_sort_with_steps
-from .quick_sort import quick_sort, quick_sort_with_steps
-from .selection_sort import selection_sort, selection_sort_with_steps
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from .registry import ALGORITHMS, STRING_ALGORITHMS, AlgorithmInfo, get_algorithm
+
+if TYPE_CHECKING:
+    from ._bubble_sort import bubble_sort, bubble_sort_inplace, bubble_sort_with_steps
+    from ._insertion_sort import (
+        insertion_sort,
+        insertion_sort_inplace,
+        insertion_sort_with_steps,
+    )
+    from ._merge_sort import merge_sort, merge_sort_inplace, merge_sort_with_steps
+    from ._msd_radix_sort import (
+        msd_radix_sort,
+        msd_radix_sort_inplace,
+        msd_radix_sort_with_steps,
+    )
+    from ._multikey_quick_sort import (
+        multikey_quick_sort,
+        multikey_quick_sort_inplace,
+        multikey_quick_sort_with_steps,
+    )
+    from ._quick_sort import quick_sort, quick_sort_inplace, quick_sort_with_steps
+    from ._selection_sort import (
+        selection_sort,
+        selection_sort_inplace,
+        selection_sort_with_steps,
+    )
+    from .auto import InputProfile, SortPlan, auto_sort, plan_sort
+    from .tracing import (
+        BaseObserver,
+        CountingObserver,
+        SortBuffer,
+        SortObserver,
+        StepRecorder,
+        TracedArray,
+    )
+
+# Public name -> submodule that defines it
+_LAZY = {
+    **{key: f"_{key}" for key in [*ALGORITHMS, *STRING_ALGORITHMS]},
+    **{f"{key}_with_steps": f"_{key}" for key in [*ALGORITHMS, *STRING_ALGORITHMS]},
+    **{f"{key}_inplace": f"_{key}" for key in [*ALGORITHMS, *STRING_ALGORITHMS]},
+    **dict.fromkeys(
+        [
+            "SortObserver",
+            "SortBuffer",
+            "BaseObserver",
+            "CountingObserver",
+            "StepRecorder",
+            "TracedArray",
+        ],
+        "tracing",
+    ),
+    **dict.fromkeys(["auto_sort", "plan_sort", "SortPlan", "InputProfile"], "auto"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_LAZY[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
+
 
 __all__ = [
+    "ALGORITHMS",
+    "STRING_ALGORITHMS",
+    "AlgorithmInfo",
+    "get_algorithm",
+    "auto_sort",
+    "plan_sort",
+    "SortPlan",
+    "InputProfile",
     "bubble_sort",
     "bubble_sort_with_steps",
+    "bubble_sort_inplace",
     "insertion_sort",
     "insertion_sort_with_steps",
+    "insertion_sort_inplace",
     "selection_sort",
     "selection_sort_with_steps",
+    "selection_sort_inplace",
     "quick_sort",
     "quick_sort_with_steps",
+    "quick_sort_inplace",
     "merge_sort",
     "merge_sort_with_steps",
+    "merge_sort_inplace",
+    "msd_radix_sort",
+    "msd_radix_sort_with_steps",
+    "msd_radix_sort_inplace",
+    "multikey_quick_sort",
+    "multikey_quick_sort_with_steps",
+    "multikey_quick_sort_inplace",
+    "SortObserver",
+    "SortBuffer",
+    "BaseObserver",
+    "CountingObserver",
+    "StepRecorder",
+    "TracedArray",
 ]
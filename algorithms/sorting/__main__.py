@@ -0,0 +1,7 @@
+"""Command-line entry point: ``python -m algorithms.sorting``."""
+
+import typer
+
+from .cli import main
+
+typer.run(main)
@@ -0,0 +1,88 @@
+"""
+Bubble Sort Implementation
+Time Complexity: O(n²)
+Space Complexity: O(1)
+Stable: Yes
+"""
+
+from typing import Any
+
+from .tracing import (
+    SortBuffer,
+    SortObserver,
+    StepRecorder,
+    record_steps,
+    sorting_kernel,
+)
+
+
+# Random input: compares ~n²/2, swaps ~n²/4, one pass mark per pass
+@sorting_kernel(expected_steps=lambda n: 0.75 * n * n + n + 2)
+def _bubble_sort(arr: list[int], trace: Any) -> None:
+    """Bubble sort kernel, sorts ``arr`` in place."""
+    n = len(arr)
+
+    for i in range(n):
+        swapped = False
+        for j in range(0, n - i - 1):
+            trace.compare(j, j + 1)
+            if arr[j] > arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                trace.swap(j, j + 1)
+                swapped = True
+
+        # Early termination if no swaps occurred
+        if not swapped:
+            break
+        trace.mark("pass", n - i - 1)
+
+
+def bubble_sort(arr: list[int], observer: SortObserver | None = None) -> list[int]:
+    """
+    Standard bubble sort implementation.
+
+    Args:
+        arr: List of integers to sort
+        observer: Optional observer notified of every array operation
+
+    Returns:
+        Sorted list of integers
+    """
+    arr = arr.copy()
+    _bubble_sort.run(arr, observer)
+    return arr
+
+
+def bubble_sort_inplace(arr: SortBuffer, observer: SortObserver | None = None) -> None:
+    """
+    Bubble sort ``arr`` in place, without copying it.
+
+    Auxiliary space: O(1).
+
+    Args:
+        arr: List, ``array.array`` or 1-D NumPy array to sort
+        observer: Optional observer notified of every array operation
+    """
+    _bubble_sort.run_inplace(arr, observer)
+
+
+def bubble_sort_with_steps(
+    arr: list[int],
+    recorder: StepRecorder | None = None,
+    max_steps: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Bubble sort with step-by-step tracking for visualization.
+
+    Args:
+        arr: List of integers to sort
+        recorder: Optional recorder to fill instead of a fresh one
+        max_steps: Step budget; longer traces keep only milestones and
+            sampled swaps, with skipped compares summarised
+
+    Returns:
+        List of steps, each containing array state, highlights, and description
+    """
+    return record_steps(
+        _bubble_sort, arr, "Bubble sort", recorder=recorder, max_steps=max_steps
+    )
@@ -0,0 +1,97 @@
+"""
+Insertion Sort Implementation
+Time Complexity: O(n²)
+Space Complexity: O(1)
+Stable: Yes
+"""
+
+from typing import Any
+
+from .tracing import (
+    SortBuffer,
+    SortObserver,
+    StepRecorder,
+    record_steps,
+    sorting_kernel,
+)
+
+
+# Random input: one insert per element (compares are not recorded)
+@sorting_kernel(expected_steps=lambda n: n + 1)
+def _insertion_sort(arr: list[int], trace: Any) -> None:
+    """Insertion sort kernel, sorts ``arr`` in place."""
+    for i in range(1, len(arr)):
+        key = arr[i]
+        j = i - 1
+
+        # Move elements greater than key one position ahead
+        while j >= 0:
+            trace.compare(j, j + 1)
+            if arr[j] <= key:
+                break
+            arr[j + 1] = arr[j]
+            j -= 1
+
+        arr[j + 1] = key
+        trace.mark("insert", j + 1, i)
+
+
+def insertion_sort(arr: list[int], observer: SortObserver | None = None) -> list[int]:
+    """
+    Standard insertion sort implementation.
+
+    Args:
+        arr: List of integers to sort
+        observer: Optional observer notified of every array operation
+
+    Returns:
+        Sorted list of integers
+    """
+    arr = arr.copy()
+    _insertion_sort.run(arr, observer)
+    return arr
+
+
+def insertion_sort_inplace(
+    arr: SortBuffer, observer: SortObserver | None = None
+) -> None:
+    """
+    Insertion sort ``arr`` in place, without copying it.
+
+    Auxiliary space: O(1).
+
+    Args:
+        arr: List, ``array.array`` or 1-D NumPy array to sort
+        observer: Optional observer notified of every array operation
+    """
+    _insertion_sort.run_inplace(arr, observer)
+
+
+def insertion_sort_with_steps(
+    arr: list[int],
+    recorder: StepRecorder | None = None,
+    max_steps: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Insertion sort with step-by-step tracking for visualization.
+
+    Compares are not recorded as steps: mid-shift the array holds a duplicate
+    in place of the lifted key, so only completed insertions are shown.
+
+    Args:
+        arr: List of integers to sort
+        recorder: Optional recorder to fill instead of a fresh one
+        max_steps: Step budget; longer traces keep only milestones and
+            sampled swaps, with skipped compares summarised
+
+    Returns:
+        List of steps, each containing array state, highlights, and description
+    """
+    return record_steps(
+        _insertion_sort,
+        arr,
+        "Insertion sort",
+        record_compares=False,
+        recorder=recorder,
+        max_steps=max_steps,
+    )
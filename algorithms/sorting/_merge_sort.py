@@ -0,0 +1,240 @@
+"""
+Merge Sort Implementation
+Time Complexity: O(n log n)
+Space Complexity: O(n)
+Stable: Yes
+"""
+
+import math
+from typing import Any
+
+from .tracing import (
+    SortBuffer,
+    SortObserver,
+    StepRecorder,
+    record_steps,
+    sorting_kernel,
+)
+
+# Runs insertion-sorted before the in-place merges start
+INPLACE_BLOCK = 20
+
+
+# Random input: ~n log2 n compares, one merged mark per merge
+@sorting_kernel(expected_steps=lambda n: n * math.log2(n + 1) + n + 2)
+def _merge_sort(arr: list[int], trace: Any) -> None:
+    """
+    Top-down merge sort kernel, sorts ``arr`` in place.
+
+    Each merge is built in a buffer and written back in one slice, so the
+    array is a permutation of the input at every reported compare.
+    """
+
+    def sort(lo: int, hi: int) -> None:
+        if hi - lo <= 1:
+            return
+
+        mid = (lo + hi) // 2
+        sort(lo, mid)
+        sort(mid, hi)
+
+        merged = []
+        i, j = lo, mid
+        while i < mid and j < hi:
+            trace.compare(i, j)
+            left, right = arr[i], arr[j]
+            if left <= right:
+                merged.append(left)
+                i += 1
+            else:
+                merged.append(right)
+                j += 1
+
+        merged.extend(arr[i:mid])
+        merged.extend(arr[j:hi])
+        arr[lo:hi] = merged
+        trace.mark("merged", lo, hi - 1)
+
+    sort(0, len(arr))
+
+
+# Random input: ~0.1 n log2(n)² compares, twice as many swaps, a mark per merge
+@sorting_kernel(expected_steps=lambda n: 0.35 * n * math.log2(n + 1) ** 2 + 2)
+def _merge_sort_inplace(arr: list[int], trace: Any) -> None:
+    """
+    Stable merge sort kernel using only swaps.
+
+    Blocks of ``INPLACE_BLOCK`` elements are insertion-sorted, then merged
+    bottom-up with SymMerge (Kim and Kutzner, 2004): each merge
+    binary-searches a split, rotates the middle into place and recurses on
+    both halves. Auxiliary space is the O(log n) recursion; time is
+    O(n log² n).
+    """
+
+    def reverse(lo: int, hi: int) -> None:
+        hi -= 1
+        while lo < hi:
+            arr[lo], arr[hi] = arr[hi], arr[lo]
+            trace.swap(lo, hi)
+            lo += 1
+            hi -= 1
+
+    def sym_merge(lo: int, mid: int, hi: int) -> None:
+        if mid - lo == 1:
+            # Sink arr[lo] past the elements of arr[mid:hi] smaller than it
+            i, j = mid, hi
+            while i < j:
+                h = (i + j) // 2
+                trace.compare(h, lo)
+                if arr[h] < arr[lo]:
+                    i = h + 1
+                else:
+                    j = h
+            for k in range(lo, i - 1):
+                arr[k], arr[k + 1] = arr[k + 1], arr[k]
+                trace.swap(k, k + 1)
+            return
+        if hi - mid == 1:
+            # Raise arr[mid] past the elements of arr[lo:mid] larger than it
+            i, j = lo, mid
+            while i < j:
+                h = (i + j) // 2
+                trace.compare(mid, h)
+                if arr[mid] < arr[h]:
+                    j = h
+                else:
+                    i = h + 1
+            for k in range(mid, i, -1):
+                arr[k], arr[k - 1] = arr[k - 1], arr[k]
+                trace.swap(k - 1, k)
+            return
+
+        half = (lo + hi) // 2
+        n = half + mid
+        start, stop = (n - hi, half) if mid > half else (lo, mid)
+        while start < stop:
+            c = (start + stop) // 2
+            trace.compare(n - 1 - c, c)
+            if arr[n - 1 - c] < arr[c]:
+                stop = c
+            else:
+                start = c + 1
+        end = n - start
+        if start < mid < end:
+            # Rotate arr[start:end] so that arr[mid:end] comes first
+            reverse(start, mid)
+            reverse(mid, end)
+            reverse(start, end)
+        if lo < start < half:
+            sym_merge(lo, start, half)
+        if half < end < hi:
+            sym_merge(half, end, hi)
+
+    n = len(arr)
+    for lo in range(0, n, INPLACE_BLOCK):
+        for i in range(lo + 1, min(lo + INPLACE_BLOCK, n)):
+            j = i
+            while j > lo:
+                trace.compare(j - 1, j)
+                if arr[j - 1] <= arr[j]:
+                    break
+                arr[j - 1], arr[j] = arr[j], arr[j - 1]
+                trace.swap(j - 1, j)
+                j -= 1
+
+    width = INPLACE_BLOCK
+    while width < n:
+        for lo in range(0, n - width, 2 * width):
+            hi = min(lo + 2 * width, n)
+            sym_merge(lo, lo + width, hi)
+            trace.mark("merged", lo, hi - 1)
+        width *= 2
+
+
+def merge_sort(arr: list[int], observer: SortObserver | None = None) -> list[int]:
+    """
+    Standard merge sort implementation.
+
+    Args:
+        arr: List of integers to sort
+        observer: Optional observer notified of every array operation
+
+    Returns:
+        Sorted list of integers
+    """
+    arr = arr.copy()
+    _merge_sort.run(arr, observer)
+    return arr
+
+
+def merge_sort_inplace(arr: SortBuffer, observer: SortObserver | None = None) -> None:
+    """
+    Stable merge sort of ``arr`` in place, without copying it.
+
+    Uses the swap-only SymMerge kernel instead of the buffered merges of
+    ``merge_sort``, trading O(n log² n) time for O(log n) auxiliary space.
+
+    Args:
+        arr: List, ``array.array`` or 1-D NumPy array to sort
+        observer: Optional observer notified of every array operation
+    """
+    _merge_sort_inplace.run_inplace(arr, observer)
+
+
+def merge(left: list[int], right: list[int]) -> list[int]:
+    """Merge two sorted arrays."""
+    return merge_inversions(left, right)[0]
+
+
+def merge_inversions(left: list[int], right: list[int]) -> tuple[list[int], int]:
+    """
+    Merge two sorted arrays, counting the inversions between them.
+
+    Args:
+        left: Sorted list whose elements come first in the original order
+        right: Sorted list whose elements come after ``left``
+
+    Returns:
+        The merged list and the number of pairs ``x`` in ``left``, ``y`` in
+        ``right`` with ``x > y``
+    """
+    result = []
+    inversions = 0
+    i = j = 0
+
+    while i < len(left) and j < len(right):
+        if left[i] <= right[j]:
+            result.append(left[i])
+            i += 1
+        else:
+            result.append(right[j])
+            j += 1
+            # right[j] jumps ahead of every left element not yet merged
+            inversions += len(left) - i
+
+    result.extend(left[i:])
+    result.extend(right[j:])
+
+    return result, inversions
+
+
+def merge_sort_with_steps(
+    arr: list[int],
+    recorder: StepRecorder | None = None,
+    max_steps: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Merge sort with step-by-step tracking for visualization.
+
+    Args:
+        arr: List of integers to sort
+        recorder: Optional recorder to fill instead of a fresh one
+        max_steps: Step budget; longer traces keep only milestones and
+            sampled swaps, with skipped compares summarised
+
+    Returns:
+        List of steps, each containing array state, highlights, and description
+    """
+    return record_steps(
+        _merge_sort, arr, "Merge sort", recorder=recorder, max_steps=max_steps
+    )
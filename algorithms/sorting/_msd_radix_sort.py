@@ -0,0 +1,131 @@
+"""
+MSD Radix Sort Implementation (string keys)
+Time Complexity: O(D + n) bucket passes, D = distinguishing prefix characters
+Space Complexity: O(n)
+Stable: Yes
+
+Sorts ``str`` or ``bytes`` keys one character position at a time, most
+significant first. Every range of keys sharing a prefix is distributed into
+buckets by its next character (end of key first), so a shared prefix is read
+once per key rather than once per comparison. A range first skips the prefix
+all of its keys share, which its minimum and maximum bound, so long common
+prefixes cost two C-level passes instead of one bucket pass per character.
+Ranges of at most ``INSERTION_CUTOFF`` keys are insertion-sorted instead,
+where comparing whole keys beats another distribution pass.
+"""
+
+import math
+from typing import Any
+
+from .registry import StrKey
+from .tracing import SortObserver, StepRecorder, record_steps, sorting_kernel
+
+INSERTION_CUTOFF = 16
+
+
+# Random words: ~n/5 log2(n) compares and as many swaps in the cutoff ranges,
+# a bucket mark per distributed range
+@sorting_kernel(expected_steps=lambda n: 0.35 * n * math.log2(n + 1) + 2)
+def _msd_radix_sort(arr: list[Any], trace: Any) -> None:
+    """MSD radix sort kernel, sorts ``arr`` in place (explicit stack)."""
+    # Sorts before every character: "" among 1-char strs, -1 among byte values
+    end = "" if arr and isinstance(arr[0], str) else -1
+    stack = [(0, len(arr), 0)]
+    while stack:
+        lo, hi, d = stack.pop()
+        if hi - lo <= INSERTION_CUTOFF:
+            for i in range(lo + 1, hi):
+                j = i
+                while j > lo:
+                    trace.compare(j - 1, j)
+                    if arr[j - 1] <= arr[j]:
+                        break
+                    arr[j - 1], arr[j] = arr[j], arr[j - 1]
+                    trace.swap(j - 1, j)
+                    j -= 1
+            continue
+
+        # Jump over the prefix the whole range shares; min and max bound it
+        first, last = min(arr[lo:hi]), max(arr[lo:hi])
+        if first == last:
+            continue
+        while d < len(first) and first[d] == last[d]:
+            d += 1
+
+        # Bucket by the character at position d, ending keys first
+        buckets: dict[Any, list[Any]] = {}
+        for key in arr[lo:hi]:
+            c = key[d] if d < len(key) else end
+            bucket = buckets.get(c)
+            if bucket is None:
+                buckets[c] = [key]
+            else:
+                bucket.append(key)
+
+        pending = []
+        start = lo
+        for c in sorted(buckets):
+            bucket = buckets[c]
+            stop = start + len(bucket)
+            arr[start:stop] = bucket
+            if c != end and stop - start > 1:
+                pending.append((start, stop, d + 1))
+            start = stop
+        trace.mark("bucket", lo, hi - 1, d)
+        # Leftmost bucket on top, so the array settles left to right
+        stack.extend(reversed(pending))
+
+
+def msd_radix_sort(
+    arr: list[StrKey], observer: SortObserver | None = None
+) -> list[StrKey]:
+    """
+    MSD radix sort of string keys.
+
+    Args:
+        arr: List of ``str`` or ``bytes`` keys (not mixed)
+        observer: Optional observer notified of every array operation
+
+    Returns:
+        Sorted list of keys
+    """
+    arr = arr.copy()
+    _msd_radix_sort.run(arr, observer)
+    return arr
+
+
+def msd_radix_sort_inplace(
+    arr: list[StrKey], observer: SortObserver | None = None
+) -> None:
+    """
+    MSD radix sort ``arr`` in place.
+
+    Auxiliary space: O(n) for the buckets of the largest range.
+
+    Args:
+        arr: List of ``str`` or ``bytes`` keys (not mixed)
+        observer: Optional observer notified of every array operation
+    """
+    _msd_radix_sort.run(arr, observer)
+
+
+def msd_radix_sort_with_steps(
+    arr: list[StrKey],
+    recorder: StepRecorder | None = None,
+    max_steps: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    MSD radix sort with step-by-step tracking for visualization.
+
+    Args:
+        arr: List of ``str`` or ``bytes`` keys to sort
+        recorder: Optional recorder to fill instead of a fresh one
+        max_steps: Step budget; longer traces keep only milestones and
+            sampled swaps, with skipped compares summarised
+
+    Returns:
+        List of steps, each containing array state, highlights, and description
+    """
+    return record_steps(
+        _msd_radix_sort, arr, "MSD radix sort", recorder=recorder, max_steps=max_steps
+    )
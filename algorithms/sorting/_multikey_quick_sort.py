@@ -0,0 +1,143 @@
+"""
+Multikey Quick Sort Implementation (three-way radix quicksort, string keys)
+Time Complexity: O(D + n log n) character compares, D = distinguishing prefixes
+Space Complexity: O(log n + L) stack, L = longest key
+Stable: No
+
+Bentley and Sedgewick's three-way radix quicksort: partition the keys on
+one character of a pivot key into smaller, equal and larger ranges. Only the
+equal range moves on to the next character, so a shared prefix is compared
+once per key and character instead of once per key comparison. As in MSD
+radix sort, each range skips the prefix all of its keys share, and ranges of
+at most ``INSERTION_CUTOFF`` keys are insertion-sorted.
+"""
+
+import math
+from typing import Any
+
+from ._msd_radix_sort import INSERTION_CUTOFF, StrKey
+from .tracing import SortObserver, StepRecorder, record_steps, sorting_kernel
+
+
+# Random words: ~n log2 n character compares, slightly fewer swaps, a pivot
+# and split mark per partition
+@sorting_kernel(expected_steps=lambda n: 1.8 * n * math.log2(n + 1) + 2)
+def _multikey_quick_sort(arr: list[Any], trace: Any) -> None:
+    """Multikey quick sort kernel, sorts ``arr`` in place (explicit stack)."""
+    # Characters compare as int codes, -1 past the end sorts before them all
+    text = bool(arr) and isinstance(arr[0], str)
+    stack = [(0, len(arr), 0)]
+    while stack:
+        lo, hi, d = stack.pop()
+        if hi - lo <= INSERTION_CUTOFF:
+            for i in range(lo + 1, hi):
+                j = i
+                while j > lo:
+                    trace.compare(j - 1, j)
+                    if arr[j - 1] <= arr[j]:
+                        break
+                    arr[j - 1], arr[j] = arr[j], arr[j - 1]
+                    trace.swap(j - 1, j)
+                    j -= 1
+            continue
+
+        # Jump over the prefix the whole range shares; min and max bound it
+        first, last = min(arr[lo:hi]), max(arr[lo:hi])
+        if first == last:
+            continue
+        while d < len(first) and first[d] == last[d]:
+            d += 1
+
+        mid = (lo + hi) // 2
+        trace.mark("pivot", mid)
+        arr[lo], arr[mid] = arr[mid], arr[lo]
+        trace.swap(lo, mid)
+        key = arr[lo]
+        pivot = (ord(key[d]) if text else key[d]) if d < len(key) else -1
+
+        # Character d of arr[lo:lt] < pivot, arr[lt:i] == pivot, arr[gt + 1:hi] >
+        lt, i, gt = lo, lo + 1, hi - 1
+        while i <= gt:
+            trace.compare(i, lt)
+            key = arr[i]
+            c = (ord(key[d]) if text else key[d]) if d < len(key) else -1
+            if c < pivot:
+                arr[lt], arr[i] = key, arr[lt]
+                trace.swap(lt, i)
+                lt += 1
+                i += 1
+            elif c > pivot:
+                arr[gt], arr[i] = key, arr[gt]
+                trace.swap(i, gt)
+                gt -= 1
+            else:
+                i += 1
+        trace.mark("split", lt, gt, d)
+
+        ranges = [(lo, lt, d), (gt + 1, hi, d)]
+        if pivot >= 0:
+            # Keys ending at d are all equal; the rest share one more character
+            ranges.append((lt, gt + 1, d + 1))
+        # Largest first, so each range above it on the stack is at most half
+        # its size or one character deeper: O(log n + L) stacked ranges
+        ranges.sort(key=lambda r: r[0] - r[1])
+        stack.extend(r for r in ranges if r[1] - r[0] > 1)
+
+
+def multikey_quick_sort(
+    arr: list[StrKey], observer: SortObserver | None = None
+) -> list[StrKey]:
+    """
+    Three-way radix quicksort of string keys.
+
+    Args:
+        arr: List of ``str`` or ``bytes`` keys (not mixed)
+        observer: Optional observer notified of every array operation
+
+    Returns:
+        Sorted list of keys
+    """
+    arr = arr.copy()
+    _multikey_quick_sort.run(arr, observer)
+    return arr
+
+
+def multikey_quick_sort_inplace(
+    arr: list[StrKey], observer: SortObserver | None = None
+) -> None:
+    """
+    Three-way radix quicksort ``arr`` in place.
+
+    Auxiliary space: O(log n + L) for the range stack.
+
+    Args:
+        arr: List of ``str`` or ``bytes`` keys (not mixed)
+        observer: Optional observer notified of every array operation
+    """
+    _multikey_quick_sort.run(arr, observer)
+
+
+def multikey_quick_sort_with_steps(
+    arr: list[StrKey],
+    recorder: StepRecorder | None = None,
+    max_steps: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Multikey quick sort with step-by-step tracking for visualization.
+
+    Args:
+        arr: List of ``str`` or ``bytes`` keys to sort
+        recorder: Optional recorder to fill instead of a fresh one
+        max_steps: Step budget; longer traces keep only milestones and
+            sampled swaps, with skipped compares summarised
+
+    Returns:
+        List of steps, each containing array state, highlights, and description
+    """
+    return record_steps(
+        _multikey_quick_sort,
+        arr,
+        "Multikey quick sort",
+        recorder=recorder,
+        max_steps=max_steps,
+    )
@@ -0,0 +1,116 @@
+"""
+Quick Sort Implementation
+Time Complexity: O(n log n) average, O(n²) worst
+Space Complexity: O(log n)
+Stable: No
+"""
+
+import math
+from typing import Any
+
+from .tracing import (
+    SortBuffer,
+    SortObserver,
+    StepRecorder,
+    record_steps,
+    sorting_kernel,
+)
+
+
+# Random input: ~1.39 n log2 n compares and as many swaps, pivot/partition per call
+@sorting_kernel(expected_steps=lambda n: 2.8 * n * math.log2(n + 1) + 2 * n + 2)
+def _quick_sort(arr: list[int], trace: Any) -> None:
+    """
+    Quick sort kernel, sorts ``arr`` in place.
+
+    Uses the middle element as pivot and a three-way (Dijkstra) partition so
+    runs of equal keys are settled in one pass. Recursing into the smaller
+    side keeps the stack depth at O(log n).
+    """
+
+    def sort(lo: int, hi: int) -> None:
+        while lo < hi:
+            mid = (lo + hi) // 2
+            trace.mark("pivot", mid)
+            if mid != lo:
+                arr[lo], arr[mid] = arr[mid], arr[lo]
+                trace.swap(lo, mid)
+            pivot = arr[lo]
+
+            # arr[lo:lt] < pivot, arr[lt:i] == pivot, arr[gt + 1:hi + 1] > pivot
+            lt, i, gt = lo, lo + 1, hi
+            while i <= gt:
+                trace.compare(i, lt)
+                value = arr[i]
+                if value < pivot:
+                    arr[lt], arr[i] = value, arr[lt]
+                    trace.swap(lt, i)
+                    lt += 1
+                    i += 1
+                elif value > pivot:
+                    arr[gt], arr[i] = value, arr[gt]
+                    trace.swap(i, gt)
+                    gt -= 1
+                else:
+                    i += 1
+            trace.mark("partition", lt, gt)
+
+            if lt - lo < hi - gt:
+                sort(lo, lt - 1)
+                lo = gt + 1
+            else:
+                sort(gt + 1, hi)
+                hi = lt - 1
+
+    sort(0, len(arr) - 1)
+
+
+def quick_sort(arr: list[int], observer: SortObserver | None = None) -> list[int]:
+    """
+    Standard quick sort implementation.
+
+    Args:
+        arr: List of integers to sort
+        observer: Optional observer notified of every array operation
+
+    Returns:
+        Sorted list of integers
+    """
+    arr = arr.copy()
+    _quick_sort.run(arr, observer)
+    return arr
+
+
+def quick_sort_inplace(arr: SortBuffer, observer: SortObserver | None = None) -> None:
+    """
+    Quick sort ``arr`` in place, without copying it.
+
+    Auxiliary space: O(log n) stack.
+
+    Args:
+        arr: List, ``array.array`` or 1-D NumPy array to sort
+        observer: Optional observer notified of every array operation
+    """
+    _quick_sort.run_inplace(arr, observer)
+
+
+def quick_sort_with_steps(
+    arr: list[int],
+    recorder: StepRecorder | None = None,
+    max_steps: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Quick sort with step-by-step tracking for visualization.
+
+    Args:
+        arr: List of integers to sort
+        recorder: Optional recorder to fill instead of a fresh one
+        max_steps: Step budget; longer traces keep only milestones and
+            sampled swaps, with skipped compares summarised
+
+    Returns:
+        List of steps, each containing array state, highlights, and description
+    """
+    return record_steps(
+        _quick_sort, arr, "Quick sort", recorder=recorder, max_steps=max_steps
+    )
@@ -0,0 +1,94 @@
+"""
+Selection Sort Implementation
+Time Complexity: O(n²)
+Space Complexity: O(1)
+Stable: No
+"""
+
+import math
+from typing import Any
+
+from .tracing import (
+    SortBuffer,
+    SortObserver,
+    StepRecorder,
+    record_steps,
+    sorting_kernel,
+)
+
+
+# Random input: compares ~n²/2, ~n ln n new minima, select/swap/placed per position
+@sorting_kernel(expected_steps=lambda n: 0.5 * n * n + n * math.log(n + 1) + 3 * n + 2)
+def _selection_sort(arr: list[int], trace: Any) -> None:
+    """Selection sort kernel, sorts ``arr`` in place."""
+    n = len(arr)
+
+    for i in range(n):
+        trace.mark("select", i)
+        min_idx = i
+
+        # Find minimum element in remaining unsorted array
+        for j in range(i + 1, n):
+            trace.compare(j, min_idx)
+            if arr[j] < arr[min_idx]:
+                min_idx = j
+                trace.mark("minimum", j)
+
+        # Swap the found minimum element with the first element
+        if min_idx != i:
+            arr[i], arr[min_idx] = arr[min_idx], arr[i]
+            trace.swap(i, min_idx)
+            trace.mark("placed", i)
+
+
+def selection_sort(arr: list[int], observer: SortObserver | None = None) -> list[int]:
+    """
+    Standard selection sort implementation.
+
+    Args:
+        arr: List of integers to sort
+        observer: Optional observer notified of every array operation
+
+    Returns:
+        Sorted list of integers
+    """
+    arr = arr.copy()
+    _selection_sort.run(arr, observer)
+    return arr
+
+
+def selection_sort_inplace(
+    arr: SortBuffer, observer: SortObserver | None = None
+) -> None:
+    """
+    Selection sort ``arr`` in place, without copying it.
+
+    Auxiliary space: O(1).
+
+    Args:
+        arr: List, ``array.array`` or 1-D NumPy array to sort
+        observer: Optional observer notified of every array operation
+    """
+    _selection_sort.run_inplace(arr, observer)
+
+
+def selection_sort_with_steps(
+    arr: list[int],
+    recorder: StepRecorder | None = None,
+    max_steps: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Selection sort with step-by-step tracking for visualization.
+
+    Args:
+        arr: List of integers to sort
+        recorder: Optional recorder to fill instead of a fresh one
+        max_steps: Step budget; longer traces keep only milestones and
+            sampled swaps, with skipped compares summarised
+
+    Returns:
+        List of steps, each containing array state, highlights, and description
+    """
+    return record_steps(
+        _selection_sort, arr, "Selection sort", recorder=recorder, max_steps=max_steps
+    )
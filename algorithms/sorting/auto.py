@@ -0,0 +1,248 @@
+"""
+Adaptive sorting: sample the input, then dispatch to the best engine.
+
+``auto_sort`` looks at a small, evenly spaced sample of the input (one
+triple of neighbors per 64 elements, capped at 1024) for its value range,
+duplicate ratio and how often the order changes direction, then picks an
+engine:
+
+- ``builtin``: Python's Timsort, fastest on small inputs and on inputs made
+  of a few long ascending or descending runs
+- ``numpy``: ``np.sort`` on an int64 copy, fastest on everything else
+- the package's own algorithms, when ``engines`` restricts the choice
+
+The thresholds come from benchmarking the engines over ``DATASET_NAMES``
+(best of 3-200 runs per cell):
+
+- Random data: Timsort wins up to about 200 values and NumPy from 256 up
+  (12 vs 14 us at 256 values, 36 vs 115 ms at 1M). Sampling and planning
+  cost about 10 us, so inputs below 512 values skip them and go straight
+  to Timsort.
+- Sorted, reversed, organ-pipe and sawtooth inputs change direction at
+  under 0.01% of positions. Timsort handles them in one pass and beats
+  NumPy 3-10x at 100k values.
+- Nearly-sorted input changes direction at about 30% of positions, and
+  NumPy wins there from about 1k values.
+- Duplicates never moved the crossover, so they only order the
+  pure-Python fallbacks.
+
+Set ``SWE_AUTO_SORT_DEBUG=1`` (or pass ``debug=True``) to print each
+decision and its evidence to stderr.
+"""
+
+import os
+import sys
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+import numpy as np
+
+from .registry import ALGORITHMS
+
+SortFunc = Callable[[list[int]], list[int]]
+
+# Below this size Timsort beats the round trip through a NumPy array plus
+# the ~10 us it takes to sample and plan
+SMALL_INPUT = 512
+# Inputs whose sampled triples change direction at most this often are
+# treated as a few long runs (random data sits near 2/3)
+PRESORTED_BREAKS = 0.05
+SAMPLE_EVERY = 64
+SAMPLE_MIN = 16
+SAMPLE_MAX = 1024
+DEBUG_ENV = "SWE_AUTO_SORT_DEBUG"
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+
+def _numpy_sort(data: list[int]) -> list[int]:
+    result: list[int] = np.sort(np.asarray(data, dtype=np.int64)).tolist()
+    return result
+
+
+def _registry_engine(key: str) -> SortFunc:
+    def engine(data: list[int]) -> list[int]:
+        return ALGORITHMS[key].sort_func(data)
+
+    return engine
+
+
+ENGINES: dict[str, SortFunc] = {
+    "builtin": sorted,
+    "numpy": _numpy_sort,
+    **{key: _registry_engine(key) for key in ALGORITHMS},
+}
+
+_ALL_ENGINES = tuple(ENGINES)
+# Engine preference per input class, best first
+_PREFERENCES: dict[str, tuple[str, ...]] = {
+    "small": ("builtin", "insertion_sort", "quick_sort", "merge_sort"),
+    "ascending runs": ("builtin", "insertion_sort", "merge_sort", "quick_sort"),
+    "descending runs": ("builtin", "merge_sort", "quick_sort"),
+    "duplicates": ("numpy", "builtin", "quick_sort", "merge_sort"),
+    "general": ("numpy", "builtin", "quick_sort", "merge_sort"),
+}
+_LAST_RESORT = ("selection_sort", "insertion_sort", "bubble_sort")
+
+
+@dataclass(frozen=True)
+class InputProfile:
+    """What a cheap sample says about an input."""
+
+    size: int
+    samples: int = 0
+    low: int | None = None
+    high: int | None = None
+    duplicate_ratio: float = 0.0
+    run_breaks: float = 0.0
+    ascending: float = 1.0
+    int64: bool = True
+
+
+@dataclass(frozen=True)
+class SortPlan:
+    """The engine ``auto_sort`` chose, and why."""
+
+    engine: str
+    input_class: str
+    candidates: tuple[str, ...]
+    profile: InputProfile
+
+    def explain(self) -> str:
+        """Human-readable account of the decision."""
+        p = self.profile
+        lines = [f"auto_sort: {self.engine} for {p.size:,} values ({self.input_class})"]
+        if p.samples:
+            lines.append(
+                f"  sampled {p.samples:,} neighbor triples: "
+                f"{p.run_breaks:.1%} change direction, {p.ascending:.0%} of steps "
+                f"ascend, {p.duplicate_ratio:.0%} duplicates, "
+                f"range [{p.low}, {p.high}]"
+            )
+        else:
+            lines.append(f"  below {SMALL_INPUT} values, not sampled")
+        if not p.int64:
+            lines.append("  values outside int64 or not ints: numpy excluded")
+        lines.append(f"  preference: {' > '.join(self.candidates)}")
+        return "\n".join(lines)
+
+
+def profile_input(data: list[int]) -> InputProfile:
+    """
+    Sample neighbor triples of ``data`` for order, range and duplicates.
+
+    Args:
+        data: Values to inspect
+
+    Returns:
+        Profile of the input
+    """
+    n = len(data)
+    if n < 3:
+        return InputProfile(size=n)
+    count = min(SAMPLE_MAX, max(SAMPLE_MIN, n // SAMPLE_EVERY), n - 2)
+    # Evenly spaced triples: seeding a random generator costs more than the
+    # whole sample on inputs near SMALL_INPUT
+    stride = (n - 2) // count
+    positions = range(stride // 2, stride * count, stride)
+    values = []
+    breaks = rising = falling = 0
+    for i in positions:
+        x, y, z = data[i], data[i + 1], data[i + 2]
+        values.append(x)
+        if x < y:
+            rising += 1
+            breaks += z < y
+        elif x > y:
+            falling += 1
+            breaks += z > y
+    low, high = min(values), max(values)
+    return InputProfile(
+        size=n,
+        samples=count,
+        low=low,
+        high=high,
+        duplicate_ratio=1 - len(set(values)) / count,
+        run_breaks=breaks / count,
+        ascending=rising / (rising + falling) if rising + falling else 1.0,
+        int64=all(type(v) is int for v in values)
+        and _INT64_MIN <= low
+        and high <= _INT64_MAX,
+    )
+
+
+def plan_sort(data: list[int], engines: Iterable[str] | None = None) -> SortPlan:
+    """
+    Choose an engine for ``data`` without sorting it.
+
+    Args:
+        data: Values to sort
+        engines: Engines to choose from (default: all of ``ENGINES``)
+
+    Returns:
+        The chosen engine, the input class and the evidence
+
+    Raises:
+        ValueError: If ``engines`` names an unknown engine
+    """
+    allowed = _ALL_ENGINES if engines is None else tuple(engines)
+    if allowed is not _ALL_ENGINES:
+        unknown = set(allowed) - set(ENGINES)
+        if unknown or not allowed:
+            raise ValueError(f"Unknown engines: {sorted(unknown) or 'none given'}")
+
+    if len(data) < SMALL_INPUT:
+        profile = InputProfile(size=len(data))
+        input_class = "small"
+    else:
+        profile = profile_input(data)
+        if profile.run_breaks <= PRESORTED_BREAKS:
+            ascending = profile.ascending >= 0.5
+            input_class = "ascending runs" if ascending else "descending runs"
+        elif profile.duplicate_ratio >= 0.5:
+            input_class = "duplicates"
+        else:
+            input_class = "general"
+
+    preference = [*_PREFERENCES[input_class], *_LAST_RESORT, *allowed]
+    candidates = tuple(
+        dict.fromkeys(
+            name
+            for name in preference
+            if name in allowed and (name != "numpy" or profile.int64)
+        )
+    )
+    # Only numpy can be excluded by the sample; fall back to the caller's choice
+    candidates = candidates or allowed
+    return SortPlan(candidates[0], input_class, candidates, profile)
+
+
+def auto_sort(
+    data: list[int],
+    engines: Iterable[str] | None = None,
+    debug: bool | None = None,
+) -> list[int]:
+    """
+    Sort with the engine ``plan_sort`` picks for this input.
+
+    Args:
+        data: Values to sort (not modified)
+        engines: Engines to choose from (default: all of ``ENGINES``)
+        debug: Print the decision to stderr (default: ``SWE_AUTO_SORT_DEBUG``)
+
+    Returns:
+        New sorted list
+    """
+    if debug is None:
+        debug = bool(os.environ.get(DEBUG_ENV))
+    if engines is None and not debug and len(data) < SMALL_INPUT:
+        return sorted(data)  # What plan_sort would pick, without the plan
+    plan = plan_sort(data, engines)
+    if debug:
+        print(plan.explain(), file=sys.stderr)
+    for engine in plan.candidates:
+        try:
+            return ENGINES[engine](data)
+        except OverflowError:
+            # A value outside int64 that the sample missed; try the next engine
+            continue
+    raise OverflowError("no allowed engine can sort values outside int64")
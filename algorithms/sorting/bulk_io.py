@@ -0,0 +1,132 @@
+"""
+Bulk reading and writing of integer arrays.
+
+Text is parsed by NumPy in large blocks instead of one ``int()`` call per
+token, and raw int64 files are memory-mapped rather than read. Output is
+written in chunks through a large buffer. Together these keep multi-GB
+inputs from being bound by Python-level I/O.
+"""
+
+import sys
+import warnings
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
+
+DTYPE = np.dtype("<i8")
+READ_BLOCK_BYTES = 64 << 20
+WRITE_CHUNK_VALUES = 1 << 20
+WRITE_BUFFER_BYTES = 1 << 20
+BINARY_SUFFIXES = {".i64", ".bin"}
+# Commas and semicolons separate values like whitespace does
+_SEPARATORS = bytes.maketrans(b",;", b"  ")
+_INT64 = np.iinfo(np.int64)
+
+
+def parse_text(raw: bytes) -> np.ndarray:
+    """
+    Parse integers separated by whitespace, commas or semicolons.
+
+    Args:
+        raw: Encoded text
+
+    Returns:
+        int64 array
+
+    Raises:
+        ValueError: On a token that is not an int64 integer
+    """
+    raw = raw.translate(_SEPARATORS)
+    if not raw.strip():
+        return np.empty(0, dtype=DTYPE)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            values = np.fromstring(raw, dtype=DTYPE, sep=" ")
+        except (ValueError, DeprecationWarning):
+            raise ValueError("input contains a token that is not an integer") from None
+    # NumPy saturates out-of-range values; only then pay for an exact check
+    if values.size and (values.max() == _INT64.max or values.min() == _INT64.min):
+        for token in raw.split():
+            if not _INT64.min <= int(token) <= _INT64.max:
+                raise ValueError(f"value out of int64 range: {token.decode()}")
+    return values
+
+
+def _text_blocks(stream: BinaryIO, block_bytes: int) -> Iterator[bytes]:
+    """Blocks of ``stream`` that never split a number."""
+    tail = b""
+    while block := stream.read(block_bytes):
+        block = tail + block
+        cut = max(block.rfind(sep) for sep in (b" ", b"\n", b",", b"\t", b";"))
+        if cut < 0:
+            tail = block
+            continue
+        tail = block[cut + 1 :]
+        yield block[: cut + 1]
+    if tail:
+        yield tail
+
+
+def read_text(source: str | Path, block_bytes: int = READ_BLOCK_BYTES) -> np.ndarray:
+    """Parse a text file (or ``-`` for stdin) into an int64 array."""
+    with _open_input(source) as stream:
+        parts = [parse_text(block) for block in _text_blocks(stream, block_bytes)]
+    return np.concatenate(parts) if parts else np.empty(0, dtype=DTYPE)
+
+
+def read_binary(source: str | Path) -> np.ndarray:
+    """
+    Raw little-endian int64 values from a file (memory-mapped) or stdin.
+
+    The file mapping is read-only; sorting produces a new array.
+    """
+    if str(source) == "-":
+        return np.frombuffer(sys.stdin.buffer.read(), dtype=DTYPE)
+    path = Path(source)
+    if path.stat().st_size % DTYPE.itemsize:
+        raise ValueError(f"{path} is not a whole number of int64 values")
+    if path.stat().st_size == 0:
+        return np.empty(0, dtype=DTYPE)
+    return np.memmap(path, dtype=DTYPE, mode="r")
+
+
+def write_text(
+    values: np.ndarray, target: str | Path, chunk: int = WRITE_CHUNK_VALUES
+) -> None:
+    """Write one value per line in chunks (``-`` for stdout)."""
+    with _open_output(target) as out:
+        for start in range(0, len(values), chunk):
+            block = values[start : start + chunk].tolist()
+            # One printf-style pass is faster than str() per value
+            out.write((("%d\n" * len(block)) % tuple(block)).encode())
+
+
+def write_binary(
+    values: np.ndarray, target: str | Path, chunk: int = WRITE_CHUNK_VALUES
+) -> None:
+    """Write raw little-endian int64 values in chunks (``-`` for stdout)."""
+    values = values.astype(DTYPE, copy=False)
+    with _open_output(target) as out:
+        for start in range(0, len(values), chunk):
+            out.write(memoryview(values[start : start + chunk]).cast("B"))
+
+
+def is_binary_path(path: str | Path) -> bool:
+    """Whether a file name suggests raw int64 content."""
+    return str(path) != "-" and Path(path).suffix in BINARY_SUFFIXES
+
+
+def _open_input(source: str | Path) -> AbstractContextManager[BinaryIO]:
+    if str(source) == "-":
+        return nullcontext(sys.stdin.buffer)
+    return open(source, "rb")
+
+
+def _open_output(target: str | Path) -> AbstractContextManager[BinaryIO]:
+    if str(target) == "-":
+        return nullcontext(sys.stdout.buffer)
+    return open(target, "wb", buffering=WRITE_BUFFER_BYTES)
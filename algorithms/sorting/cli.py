@@ -0,0 +1,176 @@
+"""
+Bulk sort command line.
+
+Sorts integer files from disk or stdin with any of the package's algorithms,
+NumPy's sort engines or ``auto`` (``auto_sort`` picks per input), reporting
+parse, sort and write times separately on stderr.
+
+Usage:
+    python -m algorithms.sorting data.i64 -o sorted.i64
+    seq 1000 -1 1 | python -m algorithms.sorting - --algorithm merge_sort
+    python -m algorithms.sorting data.i64 --in-place --block-mb 64
+"""
+
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import cast
+
+import numpy as np
+import typer
+
+from . import bulk_io
+from .auto import auto_sort
+from .mmap_sort import FlushMode, sort_file_inplace
+from .registry import ALGORITHMS
+
+Engine = Callable[[np.ndarray], np.ndarray]
+
+
+def _python_engine(key: str) -> Engine:
+    """Run a list-based algorithm from the registry on an array."""
+
+    def engine(values: np.ndarray) -> np.ndarray:
+        sort_func = ALGORITHMS[key].sort_func
+        return np.asarray(sort_func(values.tolist()), dtype=bulk_io.DTYPE)
+
+    return engine
+
+
+def _auto_engine(values: np.ndarray) -> np.ndarray:
+    """Let ``auto_sort`` pick the engine from a sample of the input."""
+    return np.asarray(auto_sort(values.tolist()), dtype=bulk_io.DTYPE)
+
+
+ENGINES: dict[str, Engine] = {
+    "numpy": lambda values: np.sort(values, kind="quicksort"),
+    "numpy_stable": lambda values: np.sort(values, kind="stable"),
+    "auto": _auto_engine,
+    **{key: _python_engine(key) for key in ALGORITHMS},
+}
+FORMATS = ("auto", "text", "binary")
+FLUSH_MODES = ("none", "end", "pass")
+
+
+@dataclass
+class PhaseTimings:
+    """Wall time per phase of a bulk sort."""
+
+    phases: dict[str, float] = field(default_factory=dict)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - start
+
+    def report(self, count: int) -> str:
+        lines = []
+        for name, seconds in self.phases.items():
+            rate = count / seconds if seconds > 0 else float("inf")
+            lines.append(f"{name:<6} {seconds:9.3f}s  {rate:>14,.0f} values/s")
+        total = sum(self.phases.values())
+        lines.append(f"{'total':<6} {total:9.3f}s  {count:,} values")
+        return "\n".join(lines)
+
+
+def _is_binary(fmt: str, path: str) -> bool:
+    if fmt not in FORMATS:
+        raise typer.BadParameter(f"format must be one of {', '.join(FORMATS)}")
+    return fmt == "binary" or (fmt == "auto" and bulk_io.is_binary_path(path))
+
+
+def sort_file(
+    source: str,
+    target: str,
+    algorithm: str = "numpy",
+    input_format: str = "auto",
+    output_format: str = "auto",
+) -> tuple[int, PhaseTimings]:
+    """
+    Read, sort and write an integer file.
+
+    Args:
+        source: Input path, or ``-`` for stdin
+        target: Output path, or ``-`` for stdout
+        algorithm: Key of ``ENGINES``
+        input_format: "text", "binary" (raw int64) or "auto" (by suffix)
+        output_format: As ``input_format``, for the output
+
+    Returns:
+        Number of values sorted and the per-phase timings
+    """
+    engine = ENGINES[algorithm]
+    timings = PhaseTimings()
+    with timings.phase("parse"):
+        if _is_binary(input_format, source):
+            values = bulk_io.read_binary(source)
+        else:
+            values = bulk_io.read_text(source)
+    with timings.phase("sort"):
+        result = engine(values)
+    with timings.phase("write"):
+        if _is_binary(output_format, target):
+            bulk_io.write_binary(result, target)
+        else:
+            bulk_io.write_text(result, target)
+    return len(result), timings
+
+
+def main(
+    source: str = typer.Argument("-", help="File to sort, or - for stdin"),
+    output: str = typer.Option("-", "--output", "-o", help="Output file, - for stdout"),
+    algorithm: str = typer.Option("numpy", help=f"One of: {', '.join(ENGINES)}"),
+    input_format: str = typer.Option("auto", help="text, binary (int64) or auto"),
+    output_format: str = typer.Option("auto", help="text, binary (int64) or auto"),
+    timings: bool = typer.Option(True, help="Report phase timings on stderr"),
+    in_place: bool = typer.Option(
+        False, help="Sort a raw int64 file where it lies through mmap"
+    ),
+    block_mb: float = typer.Option(32, help="In-place block size (scratch memory)"),
+    flush: str = typer.Option("end", help="In-place msync: none, end or pass"),
+    fsync: bool = typer.Option(True, help="fsync the file after an in-place sort"),
+) -> None:
+    """Sort integers from a text or raw int64 file."""
+    if algorithm not in ENGINES:
+        raise typer.BadParameter(f"Unknown algorithm: {algorithm}")
+    if in_place:
+        _sort_in_place(source, output, algorithm, block_mb, flush, fsync, timings)
+        return
+    try:
+        count, phases = sort_file(
+            source, output, algorithm, input_format, output_format
+        )
+    except (OSError, ValueError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1) from e
+    if timings:
+        typer.echo(phases.report(count), err=True)
+
+
+def _sort_in_place(
+    source: str,
+    output: str,
+    algorithm: str,
+    block_mb: float,
+    flush: str,
+    fsync: bool,
+    timings: bool,
+) -> None:
+    if source == "-" or output != "-":
+        raise typer.BadParameter("--in-place needs a file argument and no --output")
+    if algorithm != "numpy":
+        raise typer.BadParameter("--in-place always uses the block merge sort")
+    if flush not in FLUSH_MODES:
+        raise typer.BadParameter(f"flush must be one of {', '.join(FLUSH_MODES)}")
+    block_values = max(1, int(block_mb * 2**20) // bulk_io.DTYPE.itemsize)
+    try:
+        report = sort_file_inplace(source, block_values, cast(FlushMode, flush), fsync)
+    except (OSError, ValueError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1) from e
+    if timings:
+        typer.echo(report.report(), err=True)
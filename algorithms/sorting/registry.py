@@ -0,0 +1,191 @@
+"""
+Central table of the sorting algorithms.
+
+Each entry carries the metadata the visualizer, benchmark, CLI and service
+display or filter on. Implementations are resolved on first use, so reading
+the table does not import (and AST-compile) every sort module.
+
+``STRING_ALGORITHMS`` lists the string-key engines separately: they cannot
+sort the integer datasets the other tools feed to ``ALGORITHMS``.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Generic, Protocol, TypeVar
+
+if TYPE_CHECKING:
+    from .tracing import Kernel, SortBuffer, SortObserver
+
+
+# Key type of the string engines: all ``str`` or all ``bytes``
+StrKey = TypeVar("StrKey", str, bytes)
+SortFunc = TypeVar("SortFunc", default=Callable[[list[int]], list[int]])
+
+
+class StringSort(Protocol):
+    """Sort of ``str`` or ``bytes`` keys, returning keys of the same type."""
+
+    def __call__(
+        self, arr: list[StrKey], observer: "SortObserver | None" = None
+    ) -> list[StrKey]: ...
+
+
+@dataclass(frozen=True)
+class AlgorithmInfo(Generic[SortFunc]):
+    """
+    Metadata for one sorting algorithm, with lazily imported functions.
+
+    ``SortFunc`` is the type of ``sort_func``: integer lists for
+    ``ALGORITHMS``, ``StringSort`` for ``STRING_ALGORITHMS``.
+    """
+
+    key: str
+    name: str
+    time_complexity: str
+    space_complexity: str
+    stable: bool
+    in_place: bool
+    description: str
+    # Extra memory of the ``*_inplace`` variant, which never copies the input
+    inplace_space: str = "O(1)"
+
+    @property
+    def module(self) -> str:
+        return f"{__package__}._{self.key}"
+
+    @property
+    def sort_func(self) -> SortFunc:
+        """The plain sort, imported on first access."""
+        func: SortFunc = getattr(import_module(self.module), self.key)
+        return func
+
+    @property
+    def inplace_func(self) -> "Callable[[SortBuffer], None]":
+        """The zero-copy ``*_inplace`` variant, imported on first access."""
+        func: Callable[[SortBuffer], None] = getattr(
+            import_module(self.module), f"{self.key}_inplace"
+        )
+        return func
+
+    @property
+    def steps_func(self) -> Callable[..., list[dict[str, Any]]]:
+        """The traced ``*_with_steps`` variant, imported on first access."""
+        func: Callable[..., list[dict[str, Any]]] = getattr(
+            import_module(self.module), f"{self.key}_with_steps"
+        )
+        return func
+
+    @property
+    def kernel(self) -> "Kernel":
+        """The compiled kernel, to run with any observer attached."""
+        kernel: Kernel = getattr(import_module(self.module), f"_{self.key}")
+        return kernel
+
+
+ALGORITHMS: dict[str, AlgorithmInfo] = {
+    info.key: info
+    for info in (
+        AlgorithmInfo(
+            key="bubble_sort",
+            name="Bubble Sort",
+            time_complexity="O(n²)",
+            space_complexity="O(1)",
+            stable=True,
+            in_place=True,
+            description="Repeatedly compares adjacent elements and swaps them "
+            "if they are in the wrong order.",
+        ),
+        AlgorithmInfo(
+            key="insertion_sort",
+            name="Insertion Sort",
+            time_complexity="O(n²)",
+            space_complexity="O(1)",
+            stable=True,
+            in_place=True,
+            description="Builds the final sorted array one item at a time, "
+            "inserting each element into its correct position.",
+        ),
+        AlgorithmInfo(
+            key="selection_sort",
+            name="Selection Sort",
+            time_complexity="O(n²)",
+            space_complexity="O(1)",
+            stable=False,
+            in_place=True,
+            description="Finds the minimum element from unsorted part and puts "
+            "it at the beginning.",
+        ),
+        AlgorithmInfo(
+            key="quick_sort",
+            name="Quick Sort",
+            time_complexity="O(n log n)",
+            space_complexity="O(log n)",
+            stable=False,
+            in_place=True,
+            description="Divides the array into partitions around a pivot and "
+            "recursively sorts the partitions.",
+            inplace_space="O(log n)",
+        ),
+        AlgorithmInfo(
+            key="merge_sort",
+            name="Merge Sort",
+            time_complexity="O(n log n)",
+            space_complexity="O(n)",
+            stable=True,
+            in_place=False,
+            description="Divides the array into halves, sorts them separately, "
+            "and then merges them back together.",
+            inplace_space="O(log n)",
+        ),
+    )
+}
+
+# Engines for ``str``/``bytes`` keys; the comparison sorts above accept them too
+STRING_ALGORITHMS: dict[str, AlgorithmInfo[StringSort]] = {
+    info.key: info
+    for info in (
+        AlgorithmInfo[StringSort](
+            key="msd_radix_sort",
+            name="MSD Radix Sort",
+            time_complexity="O(D + n)",
+            space_complexity="O(n)",
+            stable=True,
+            in_place=False,
+            description="Distributes keys into buckets by their first character, "
+            "then each bucket by the next one, reading shared prefixes once.",
+            inplace_space="O(n)",
+        ),
+        AlgorithmInfo[StringSort](
+            key="multikey_quick_sort",
+            name="Multikey Quick Sort",
+            time_complexity="O(D + n log n)",
+            space_complexity="O(log n + L)",
+            stable=False,
+            in_place=True,
+            description="Partitions keys on one character of a pivot into "
+            "smaller, equal and larger parts; only the equal part compares "
+            "the next character.",
+            inplace_space="O(log n + L)",
+        ),
+    )
+}
+
+
+def get_algorithm(key: str) -> AlgorithmInfo:
+    """
+    Look up an algorithm by key.
+
+    Args:
+        key: Entry of ``ALGORITHMS``, e.g. "quick_sort"
+
+    Returns:
+        The algorithm's metadata
+
+    Raises:
+        ValueError: If the key is unknown
+    """
+    try:
+        return ALGORITHMS[key]
+    except KeyError:
+        raise ValueError(f"Unknown algorithm: {key}") from None
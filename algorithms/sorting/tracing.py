@@ -0,0 +1,575 @@
+"""
+Instrumented-array tracing layer.
+
+Each sorting algorithm is written once as a *kernel* against an array and a
+``trace`` handle. The kernel announces compares, swaps and algorithm-specific
+events through ``trace.<hook>(...)`` statements, and reads/writes are reported
+by the :class:`TracedArray` view it is given in traced mode.
+
+The :func:`sorting_kernel` decorator compiles two variants of every kernel:
+
+- ``traced``: the function as written, run against a :class:`TracedArray`
+- ``plain``: the same source with every ``trace.<hook>(...)`` statement
+  stripped out, run against the caller's list directly
+
+With no observer attached the plain variant runs, so tracing costs nothing
+when it is disabled.
+
+A :class:`StepRecorder` can be given a ``max_steps`` budget. When the
+kernel's predicted trace length exceeds it, compares and minor events are
+folded into counts attached to the next milestone, and swaps (and, when
+they alone would overflow the budget, milestones) are sampled at a stride,
+so trace memory and generation time stay bounded while the final array
+remains exact.
+"""
+
+import ast
+import inspect
+import math
+import textwrap
+from collections.abc import Callable, MutableSequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Protocol, cast, overload
+
+if TYPE_CHECKING:
+    import numpy as np
+
+TRACE_PARAM = "trace"
+
+# Events kept when a trace is decimated; anything else is only counted
+MILESTONE_EVENTS = frozenset(
+    {"pass", "insert", "placed", "partition", "merged", "bucket", "split"}
+)
+
+
+class SortObserver(Protocol):
+    """Receives the operations a kernel performs on a traced array."""
+
+    def on_start(self, data: list[int]) -> None: ...
+
+    def on_read(self, index: int) -> None: ...
+
+    def on_write(self, index: int, value: int) -> None: ...
+
+    def on_compare(self, i: int, j: int) -> None: ...
+
+    def on_swap(self, i: int, j: int) -> None: ...
+
+    def on_event(self, kind: str, indices: tuple[int, ...]) -> None: ...
+
+    def on_finish(self, data: list[int]) -> None: ...
+
+
+class BaseObserver:
+    """No-op observer; subclass and override only the hooks you need."""
+
+    def on_start(self, data: list[int]) -> None:
+        pass
+
+    def on_read(self, index: int) -> None:
+        pass
+
+    def on_write(self, index: int, value: int) -> None:
+        pass
+
+    def on_compare(self, i: int, j: int) -> None:
+        pass
+
+    def on_swap(self, i: int, j: int) -> None:
+        pass
+
+    def on_event(self, kind: str, indices: tuple[int, ...]) -> None:
+        pass
+
+    def on_finish(self, data: list[int]) -> None:
+        pass
+
+
+class CountingObserver(BaseObserver):
+    """Counts every reported operation."""
+
+    def __init__(self) -> None:
+        self.reads = 0
+        self.writes = 0
+        self.compares = 0
+        self.swaps = 0
+        self.events: dict[str, int] = {}
+
+    def on_read(self, index: int) -> None:
+        self.reads += 1
+
+    def on_write(self, index: int, value: int) -> None:
+        self.writes += 1
+
+    def on_compare(self, i: int, j: int) -> None:
+        self.compares += 1
+
+    def on_swap(self, i: int, j: int) -> None:
+        self.swaps += 1
+
+    def on_event(self, kind: str, indices: tuple[int, ...]) -> None:
+        self.events[kind] = self.events.get(kind, 0) + 1
+
+
+class TracedArray:
+    """List view that reports element access to an observer.
+
+    A kernel receives the same object as both ``arr`` and ``trace``: indexing
+    reports reads and writes, and ``compare``/``swap``/``mark`` report the
+    algorithm-level operations.
+    """
+
+    __slots__ = ("data", "observer")
+
+    def __init__(self, data: list[int], observer: SortObserver) -> None:
+        self.data = data
+        self.observer = observer
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            for i in range(*index.indices(len(self.data))):
+                self.observer.on_read(i)
+            return self.data[index]
+        value = self.data[index]
+        self.observer.on_read(index % len(self.data))
+        return value
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            positions = range(*index.indices(len(self.data)))
+            values = list(value)
+            if len(values) != len(positions):
+                raise ValueError("traced slice assignment must preserve length")
+            self.data[index] = values
+            for i, v in zip(positions, values, strict=True):
+                self.observer.on_write(i, v)
+            return
+        self.data[index] = value
+        self.observer.on_write(index % len(self.data), value)
+
+    def compare(self, i: int, j: int) -> None:
+        self.observer.on_compare(i, j)
+
+    def swap(self, i: int, j: int) -> None:
+        self.observer.on_swap(i, j)
+
+    def mark(self, kind: str, *indices: int) -> None:
+        self.observer.on_event(kind, indices)
+
+
+# Kernels only compare and move elements, so string-key kernels share the type
+KernelFunc = Callable[[list[Any], Any], None]
+StepEstimate = Callable[[int], float]
+# What the ``*_inplace`` sorts accept: lists, ``array.array``, NumPy arrays
+type SortBuffer = MutableSequence[int] | np.ndarray
+
+
+def writable_view(buffer: Any) -> memoryview:
+    """
+    Zero-copy, element-addressable view of a one-dimensional buffer.
+
+    Args:
+        buffer: Object exporting the buffer protocol, e.g. a NumPy array
+
+    Returns:
+        A writable ``memoryview`` over the buffer's memory
+
+    Raises:
+        TypeError: If ``buffer`` does not export the buffer protocol
+        ValueError: If the buffer is read-only or not one-dimensional
+    """
+    try:
+        view = memoryview(buffer)
+    except TypeError:
+        raise TypeError(
+            f"cannot sort {type(buffer).__name__} in place: "
+            "expected a list, array.array or NumPy array"
+        ) from None
+    if view.readonly or view.ndim != 1:
+        view.release()
+        raise ValueError("in-place sorts need a writable, one-dimensional buffer")
+    return view
+
+
+@dataclass(frozen=True)
+class Kernel:
+    """A sorting kernel compiled into its plain and traced variants."""
+
+    name: str
+    plain: KernelFunc
+    traced: KernelFunc
+    expected_steps: StepEstimate | None = None
+
+    def predict_steps(self, n: int) -> int | None:
+        """Predicted full trace length on ``n`` random elements, if known."""
+        if self.expected_steps is None:
+            return None
+        return math.ceil(self.expected_steps(n))
+
+    def run(self, arr: list[Any], observer: SortObserver | None = None) -> None:
+        """Sort ``arr`` in place, reporting to ``observer`` if one is given."""
+        if observer is None:
+            self.plain(arr, None)
+            return
+        view = TracedArray(arr, observer)
+        observer.on_start(arr)
+        # The view duck-types as list[int] for everything a kernel does
+        self.traced(cast(list[int], view), view)
+        observer.on_finish(arr)
+
+    def run_inplace(
+        self, buffer: SortBuffer, observer: SortObserver | None = None
+    ) -> None:
+        """
+        Sort a list, ``array.array`` or 1-D NumPy array in place.
+
+        Mutable sequences are sorted directly and other buffers through a
+        ``memoryview`` of their memory, so the data is never copied. Only a
+        traced run on something other than a list sorts a list copy (which
+        is what observers expect) and writes the result back.
+        """
+        if isinstance(buffer, list):
+            self.run(buffer, observer)
+            return
+        target: Any = (
+            buffer if isinstance(buffer, MutableSequence) else writable_view(buffer)
+        )
+        try:
+            if observer is None:
+                self.plain(target, None)
+                return
+            data = list(target)
+            self.run(data, observer)
+            for i, value in enumerate(data):
+                target[i] = value
+        finally:
+            if isinstance(target, memoryview):
+                target.release()
+
+
+class _StripTraceHooks(ast.NodeTransformer):
+    """Remove ``trace.<hook>(...)`` expression statements from a function."""
+
+    def generic_visit(self, node: ast.AST) -> ast.AST:
+        super().generic_visit(node)
+        body = getattr(node, "body", None)
+        if isinstance(body, list) and not body:
+            body.append(ast.Pass())
+        return node
+
+    def visit_Expr(self, node: ast.Expr) -> ast.AST | None:
+        call = node.value
+        if (
+            isinstance(call, ast.Call)
+            and isinstance(call.func, ast.Attribute)
+            and isinstance(call.func.value, ast.Name)
+            and call.func.value.id == TRACE_PARAM
+        ):
+            return None
+        return node
+
+
+@overload
+def sorting_kernel(
+    func: KernelFunc, *, expected_steps: StepEstimate | None = None
+) -> Kernel: ...
+
+
+@overload
+def sorting_kernel(
+    *, expected_steps: StepEstimate
+) -> Callable[[KernelFunc], Kernel]: ...
+
+
+def sorting_kernel(
+    func: KernelFunc | None = None, *, expected_steps: StepEstimate | None = None
+) -> Kernel | Callable[[KernelFunc], Kernel]:
+    """
+    Decorator compiling a kernel into plain and traced variants.
+
+    The kernel must take ``(arr, trace)`` and sort ``arr`` in place. Trace
+    hooks must be standalone statements so they can be stripped.
+
+    Args:
+        func: Kernel function written against ``arr`` and ``trace``
+        expected_steps: Recorded steps for ``n`` random elements, used to
+            plan decimation under a step budget
+
+    Returns:
+        Kernel bundling both variants
+    """
+    if func is None:
+        return lambda f: sorting_kernel(f, expected_steps=expected_steps)
+
+    params = list(inspect.signature(func).parameters)
+    if params[1:2] != [TRACE_PARAM]:
+        raise TypeError(f"{func.__name__} must take (arr, {TRACE_PARAM})")
+
+    source = textwrap.dedent(inspect.getsource(func))
+    tree = ast.parse(source)
+    func_def = cast(ast.FunctionDef, tree.body[0])
+    func_def.decorator_list = []
+    _StripTraceHooks().visit(func_def)
+    ast.fix_missing_locations(tree)
+    # Keep line numbers pointing at the original source for profilers
+    ast.increment_lineno(tree, func.__code__.co_firstlineno - 1)
+
+    namespace: dict[str, Any] = {}
+    code = compile(tree, inspect.getsourcefile(func) or "<kernel>", "exec")
+    exec(code, func.__globals__, namespace)  # nosec B102 - our own source
+    plain = cast(KernelFunc, namespace[func.__name__])
+    plain.__qualname__ = func.__qualname__
+    plain.__module__ = func.__module__
+
+    return Kernel(
+        name=func.__name__.strip("_"),
+        plain=plain,
+        traced=func,
+        expected_steps=expected_steps,
+    )
+
+
+class StepRecorder(BaseObserver):
+    """
+    Observer building the visualizer's list of step dicts.
+
+    Each step holds the ``array``, its ``highlights``, a ``description``
+    and its ``kind``: "start", "compare", "swap", the kernel event (e.g.
+    "partition") or "finish".
+
+    With ``max_steps`` set and ``expected_steps`` predicting more than that,
+    the recorder decimates: compares and non-milestone events are only
+    counted, swaps and milestones are kept every ``swap_stride``-th and
+    ``milestone_stride``-th time, and milestone steps summarise what was
+    skipped since the previous one. Each time the trace reaches the budget,
+    every other recorded swap is dropped and the swap stride doubled, so
+    swaps stay evenly sampled; once milestones alone fill more than three
+    quarters of the budget they are thinned the same way instead. A trace
+    that outgrows an optimistic prediction starts decimating when it hits
+    the budget. Only the first and final steps are never dropped, so a
+    budget of at least two steps is a hard bound.
+    """
+
+    def __init__(
+        self,
+        name: str = "",
+        record_compares: bool = True,
+        max_steps: int | None = None,
+    ) -> None:
+        self.name = name
+        self.record_compares = record_compares
+        self.max_steps = max_steps
+        self.expected_steps: int | None = None
+        self.decimate = False
+        self.swap_stride = 1
+        self.milestone_stride = 1
+        self.steps: list[dict[str, Any]] = []
+        self.skipped = {"compares": 0, "swaps": 0, "events": 0}
+        self._pending = dict(self.skipped)
+        self._swaps_seen = 0
+        self._milestones_seen = 0
+        # Per step: "swaps", "milestones" or None for steps never thinned
+        self._samples: list[str | None] = []
+        self._sample_counts = {"swaps": 0, "milestones": 0}
+        self._data: list[int] = []
+
+    def _add(
+        self,
+        highlights: list[int],
+        description: str,
+        kind: str,
+        sample: str | None = None,
+    ) -> None:
+        self._append(
+            {
+                "array": self._data.copy(),
+                "highlights": highlights,
+                "description": description,
+                "kind": kind,
+            },
+            sample,
+        )
+        if self.max_steps and len(self.steps) >= self.max_steps:
+            if not self.decimate:
+                self._start_decimating()
+            while len(self.steps) >= self.max_steps and any(
+                self._sample_counts.values()
+            ):
+                self._thin()
+
+    def _append(self, step: dict[str, Any], sample: str | None) -> None:
+        self.steps.append(step)
+        self._samples.append(sample)
+        if sample is not None:
+            self._sample_counts[sample] += 1
+
+    def _start_decimating(self) -> None:
+        """Switch to decimation mid-trace; steps so far thin like swaps."""
+        self.decimate = True
+        self._samples[1:] = ["swaps"] * (len(self._samples) - 1)
+        self._sample_counts = {"swaps": len(self._samples) - 1, "milestones": 0}
+
+    def _thin(self) -> None:
+        """Drop every other step of one sampled kind and double its stride."""
+        milestones = self._sample_counts["milestones"]
+        budget = self.max_steps or 0
+        if milestones * 4 > budget * 3 or not self._sample_counts["swaps"]:
+            kind = "milestones"
+            self.milestone_stride *= 2
+        else:
+            kind = "swaps"
+            self.swap_stride *= 2
+        keep = []
+        seen = 0
+        for step, sample in zip(self.steps, self._samples, strict=True):
+            if sample == kind:
+                seen += 1
+                if seen % 2:
+                    continue
+            keep.append((step, sample))
+        # In place: callers may hold a reference to the live list
+        self.steps[:] = [step for step, _ in keep]
+        self._samples = [sample for _, sample in keep]
+        self._sample_counts[kind] = seen // 2
+
+    def _skip(self, kind: str) -> None:
+        self.skipped[kind] += 1
+        self._pending[kind] += 1
+
+    def _summary(self, pending: dict[str, int]) -> str:
+        parts = [
+            f"{count:,} {kind}"
+            for kind, count in pending.items()
+            if count and kind != "events"
+        ]
+        return f" ({', '.join(parts)} not shown)" if parts else ""
+
+    def on_start(self, data: list[int]) -> None:
+        self._data = data
+        if self.max_steps is not None and self.expected_steps is not None:
+            # The stride then adapts by thinning as the budget fills
+            self.decimate = self.expected_steps > self.max_steps
+        self._add(
+            [], f"Starting {self.name.lower()} with {len(data)} elements", "start"
+        )
+
+    def on_compare(self, i: int, j: int) -> None:
+        if self.decimate:
+            self._skip("compares")
+        elif self.record_compares:
+            a = self._data
+            self._add([i, j], f"Comparing {a[i]} and {a[j]}", "compare")
+
+    def on_swap(self, i: int, j: int) -> None:
+        a = self._data
+        if self.decimate:
+            self._swaps_seen += 1
+            if self._swaps_seen % self.swap_stride:
+                self._skip("swaps")
+                return
+        sample = "swaps" if self.decimate else None
+        self._add([i, j], f"Swapped {a[j]} and {a[i]}", "swap", sample)
+
+    def on_event(self, kind: str, indices: tuple[int, ...]) -> None:
+        if self.decimate and kind not in MILESTONE_EVENTS:
+            self._skip("events")
+            return
+        if self.decimate:
+            self._milestones_seen += 1
+            if self._milestones_seen % self.milestone_stride:
+                self._skip("events")
+                return
+        highlights, description = describe_event(self._data, kind, indices)
+        if self.decimate:
+            description += self._summary(self._pending)
+            self._pending = dict.fromkeys(self._pending, 0)
+        self._add(
+            highlights, description, kind, "milestones" if self.decimate else None
+        )
+
+    def on_finish(self, data: list[int]) -> None:
+        summary = self._summary(self.skipped) if self.decimate else ""
+        self._add([], f"{self.name} complete!{summary}", "finish")
+
+
+def describe_event(
+    a: list[int], kind: str, indices: tuple[int, ...]
+) -> tuple[list[int], str]:
+    """Human-readable highlights and description for a kernel event."""
+    if kind == "pass":
+        (k,) = indices
+        return [k], f"Pass complete: {a[k]} settled at position {k}"
+    if kind == "insert":
+        pos, src = indices
+        return [pos, src], f"Inserted element {a[pos]} at position {pos}"
+    if kind == "select":
+        (i,) = indices
+        return [i], f"Finding minimum from position {i}"
+    if kind == "minimum":
+        (j,) = indices
+        return [j], f"New minimum found: {a[j]}"
+    if kind == "placed":
+        (i,) = indices
+        return [i], f"Placed {a[i]} in position {i}"
+    if kind == "pivot":
+        (p,) = indices
+        return [p], f"Pivot selected: {a[p]} at position {p}"
+    if kind == "partition":
+        lt, gt = indices
+        return (
+            list(range(lt, gt + 1)),
+            f"Partition complete. Pivot {a[lt]} is in final position",
+        )
+    if kind == "merged":
+        lo, hi = indices
+        return list(range(lo, hi + 1)), f"Merged positions {lo} to {hi}"
+    if kind == "bucket":
+        lo, hi, depth = indices
+        return (
+            list(range(lo, hi + 1)),
+            f"Bucketed positions {lo} to {hi} by character {depth}",
+        )
+    if kind == "split":
+        lt, gt, depth = indices
+        return (
+            list(range(lt, gt + 1)),
+            f"Split on character {depth}: positions {lt} to {gt} share it",
+        )
+    return list(indices), f"Event '{kind}' at positions {list(indices)}"
+
+
+def record_steps(
+    kernel: Kernel,
+    arr: list[Any],
+    name: str,
+    record_compares: bool = True,
+    recorder: StepRecorder | None = None,
+    max_steps: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Run a kernel on a copy of ``arr`` and record visualization steps.
+
+    Args:
+        kernel: Compiled sorting kernel
+        arr: List of integers to sort
+        name: Display name used in the first and last step
+        record_compares: Whether compare events produce steps
+        recorder: Recorder to fill, e.g. one enforcing limits (default: new)
+        max_steps: Step budget; decimates when the prediction exceeds it
+
+    Returns:
+        List of steps, each containing array state, highlights, and description
+    """
+    if recorder is None:
+        recorder = StepRecorder()
+    # The algorithm decides naming and compare policy; the recorder, storage
+    recorder.name = name
+    recorder.record_compares = record_compares
+    if max_steps is not None:
+        recorder.max_steps = max_steps
+    recorder.expected_steps = kernel.predict_steps(len(arr))
+    kernel.run(arr.copy(), recorder)
+    return recorder.steps
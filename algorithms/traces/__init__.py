@@ -0,0 +1,52 @@
+"""
+Infrastructure for storing, sharing and analyzing step traces.
+"""
+
+from .analytics import (
+    AccessHeatmap,
+    Displacement,
+    PhaseWork,
+    TraceColumns,
+    access_heatmap,
+    compare_distances,
+    displacement,
+    phase_work,
+)
+from .cache import CacheStats, TraceCache, content_key, shared_cache, trace_nbytes
+from .jobs import (
+    TraceCancelled,
+    TraceJob,
+    TraceLimitExceeded,
+    TraceWorkerPool,
+    shared_pool,
+)
+from .race import Race, RaceLane, run_race
+from .tracefile import TraceFile, load_trace, trace_to_bytes, write_trace
+
+__all__ = [
+    "AccessHeatmap",
+    "CacheStats",
+    "Displacement",
+    "PhaseWork",
+    "Race",
+    "RaceLane",
+    "TraceCache",
+    "TraceCancelled",
+    "TraceColumns",
+    "TraceJob",
+    "TraceFile",
+    "TraceLimitExceeded",
+    "TraceWorkerPool",
+    "access_heatmap",
+    "compare_distances",
+    "content_key",
+    "displacement",
+    "load_trace",
+    "phase_work",
+    "run_race",
+    "shared_cache",
+    "shared_pool",
+    "trace_nbytes",
+    "trace_to_bytes",
+    "write_trace",
+]
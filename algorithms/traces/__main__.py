@@ -0,0 +1,47 @@
+"""Command-line entry point: ``python -m algorithms.traces``."""
+
+from pathlib import Path
+
+import typer
+
+from algorithms import sorting
+from algorithms.datasets import make_dataset
+
+from .cache import Trace
+from .tracefile import DEFAULT_SNAPSHOT_INTERVAL, write_trace
+
+
+def main(
+    algorithm: str = typer.Argument(..., help="e.g. quick_sort"),
+    output: Path = typer.Argument(..., help="Trace file to write"),
+    distribution: str = typer.Option("Random", help="Input distribution"),
+    size: int = typer.Option(1000, help="Number of elements"),
+    seed: int | None = typer.Option(None, help="Seed for reproducible input"),
+    max_steps: int | None = typer.Option(None, help="Step budget (decimates)"),
+    snapshot_interval: int = typer.Option(DEFAULT_SNAPSHOT_INTERVAL),
+    compress: bool = typer.Option(False, help="zlib-compress sections"),
+) -> None:
+    """Generate a reference trace offline and write it as a binary trace file."""
+    if algorithm not in sorting.ALGORITHMS:
+        raise typer.BadParameter(f"Unknown algorithm: {algorithm}")
+    steps_func = sorting.ALGORITHMS[algorithm].steps_func
+    data = make_dataset(distribution, size, seed)
+    trace: Trace = steps_func(data, max_steps=max_steps)
+    write_trace(
+        output,
+        trace,
+        snapshot_interval,
+        compress,
+        metadata={
+            "algorithm": algorithm,
+            "distribution": distribution,
+            "size": size,
+            "seed": seed,
+            "max_steps": max_steps,
+        },
+    )
+    nbytes = output.stat().st_size
+    typer.echo(f"Wrote {len(trace):,} steps to {output} ({nbytes:,} bytes)")
+
+
+typer.run(main)
@@ -0,0 +1,231 @@
+"""
+Process-wide, memory-budgeted trace cache.
+
+Traces are keyed by algorithm and a content hash of the input, so every
+session asking for the same trace gets a reference to one shared list
+instead of its own copy. Entries are evicted least-recently-used once the
+byte budget is exceeded and, if a spill directory is configured, written to
+disk so they can be reloaded instead of recomputed.
+
+Cached traces are shared: callers must treat them as read-only.
+"""
+
+import hashlib
+import os
+import pickle  # nosec B403 - spill files are written and read by this process
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+Trace = list[dict[str, Any]]
+
+DEFAULT_BUDGET_BYTES = 256 * 1024 * 1024
+
+
+def content_key(algorithm: str, data: list[int], **params: Any) -> str:
+    """Cache key from the algorithm, a hash of the input and extra params."""
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        digest.update(array("q", data).tobytes())
+    except OverflowError:
+        digest.update(repr(data).encode())
+    extra = ",".join(f"{k}={params[k]!r}" for k in sorted(params))
+    return f"{algorithm}:{len(data)}:{digest.hexdigest()}:{extra}"
+
+
+def step_nbytes(step: dict[str, Any]) -> int:
+    """
+    Approximate memory held by one step.
+
+    Counts the step dict, array and highlight lists and description. Ints
+    are shared between snapshot copies and are not counted.
+    """
+    return (
+        sys.getsizeof(step)
+        + sys.getsizeof(step.get("array", ()))
+        + sys.getsizeof(step.get("highlights", ()))
+        + sys.getsizeof(step.get("description", ""))
+    )
+
+
+def trace_nbytes(trace: Trace) -> int:
+    """Approximate memory held by a trace (see ``step_nbytes``)."""
+    return sys.getsizeof(trace) + sum(step_nbytes(step) for step in trace)
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    spill_hits: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class TraceCache:
+    """Thread-safe LRU cache of traces under a byte budget."""
+
+    def __init__(
+        self,
+        budget_bytes: int = DEFAULT_BUDGET_BYTES,
+        spill_dir: str | Path | None = None,
+    ) -> None:
+        self.budget_bytes = budget_bytes
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        if self.spill_dir:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, tuple[Trace, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending: dict[str, threading.Event] = {}
+
+    def _spill_path(self, key: str) -> Path | None:
+        if self.spill_dir is None:
+            return None
+        name = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return self.spill_dir / f"{name}.trace.pkl"
+
+    def _insert(self, key: str, trace: Trace) -> None:
+        """Insert under the lock, evicting (and spilling) LRU entries."""
+        replaced = self._entries.pop(key, None)
+        if replaced is not None:
+            self.stats.bytes -= replaced[1]
+        nbytes = trace_nbytes(trace)
+        if nbytes > self.budget_bytes:
+            self._spill(key, trace)
+            self.stats.entries = len(self._entries)
+            return
+        self._entries[key] = (trace, nbytes)
+        self.stats.bytes += nbytes
+        while self.stats.bytes > self.budget_bytes:
+            old_key, (old_trace, old_bytes) = self._entries.popitem(last=False)
+            self.stats.bytes -= old_bytes
+            self.stats.evictions += 1
+            self._spill(old_key, old_trace)
+        self.stats.entries = len(self._entries)
+
+    def _spill(self, key: str, trace: Trace) -> None:
+        path = self._spill_path(key)
+        if path is not None and not path.exists():
+            tmp = path.with_suffix(".tmp")
+            with tmp.open("wb") as f:
+                pickle.dump(trace, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp.replace(path)
+
+    def _load_spilled(self, key: str) -> Trace | None:
+        path = self._spill_path(key)
+        if path is None or not path.exists():
+            return None
+        with path.open("rb") as f:
+            trace: Trace = pickle.load(f)  # nosec B301 - our own spill file
+        return trace
+
+    def get(self, key: str) -> Trace | None:
+        """Cached trace for ``key`` from memory or spill, else None (a miss)."""
+        trace = self._lookup(key)
+        if trace is None:
+            with self._lock:
+                self.stats.misses += 1
+        return trace
+
+    def _lookup(self, key: str) -> Trace | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry[0]
+
+        trace = self._load_spilled(key)
+        if trace is not None:
+            with self._lock:
+                self.stats.spill_hits += 1
+                self._insert(key, trace)
+        return trace
+
+    def put(self, algorithm: str, data: list[int], trace: Trace, **params: Any) -> None:
+        """Store a trace computed elsewhere, e.g. by a background job."""
+        with self._lock:
+            self._insert(content_key(algorithm, data, **params), trace)
+
+    def get_or_compute(
+        self,
+        algorithm: str,
+        data: list[int],
+        compute: Callable[[list[int]], Trace],
+        **params: Any,
+    ) -> Trace:
+        """
+        Return the shared trace for ``algorithm`` on ``data``.
+
+        Concurrent requests for the same key wait for a single computation.
+
+        Args:
+            algorithm: Algorithm key
+            data: Input array
+            compute: Function producing the trace from a copy of ``data``
+            **params: Extra parameters that change the trace (part of the key)
+
+        Returns:
+            The cached trace (shared, read-only)
+        """
+        key = content_key(algorithm, data, **params)
+        while True:
+            trace = self._lookup(key)
+            if trace is not None:
+                return trace
+            with self._lock:
+                pending = self._pending.get(key)
+                if pending is None:
+                    self._pending[key] = threading.Event()
+                    self.stats.misses += 1
+                    break
+            pending.wait()
+
+        try:
+            trace = compute(data.copy())
+            with self._lock:
+                self._insert(key, trace)
+            return trace
+        finally:
+            with self._lock:
+                self._pending.pop(key).set()
+
+    def clear(self) -> None:
+        """Drop every entry, in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+            self.stats = CacheStats()
+            if self.spill_dir:
+                for path in self.spill_dir.glob("*.trace.pkl"):
+                    path.unlink()
+
+
+_shared: TraceCache | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_cache() -> TraceCache:
+    """
+    The process-wide cache.
+
+    Configured from ``SWE_TRACE_CACHE_MB`` (budget) and
+    ``SWE_TRACE_SPILL_DIR`` (enables spill to disk) on first use.
+    """
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            budget_mb = float(os.environ.get("SWE_TRACE_CACHE_MB", "256"))
+            _shared = TraceCache(
+                budget_bytes=int(budget_mb * 1024 * 1024),
+                spill_dir=os.environ.get("SWE_TRACE_SPILL_DIR") or None,
+            )
+        return _shared
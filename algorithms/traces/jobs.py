@@ -0,0 +1,185 @@
+"""
+Background trace generation with progress, cancellation and limits.
+
+A ``TraceJob`` runs a ``*_with_steps`` function in a worker thread with a
+``BudgetedRecorder``. The recorder appends to a list the caller can read at
+any time, so playback can start on the prefix produced so far. Before every
+step it checks for cancellation and for the job's time and memory limits,
+and aborts the kernel by raising when one is hit.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from algorithms.sorting.tracing import StepRecorder
+
+from .cache import Trace, step_nbytes
+
+TraceFunc = Callable[..., Trace]
+
+
+class TraceAborted(Exception):
+    """Raised inside the kernel to stop trace generation."""
+
+
+class TraceCancelled(TraceAborted):
+    """The job was cancelled by the user."""
+
+
+class TraceLimitExceeded(TraceAborted):
+    """The job ran past its time or memory limit."""
+
+
+class BudgetedRecorder(StepRecorder):
+    """Step recorder enforcing cancellation, a deadline and a byte budget."""
+
+    def __init__(
+        self,
+        cancel_event: threading.Event,
+        time_limit_s: float | None = None,
+        memory_limit_bytes: int | None = None,
+        max_steps: int | None = None,
+    ) -> None:
+        super().__init__(max_steps=max_steps)
+        self.cancel_event = cancel_event
+        self.deadline = (
+            time.monotonic() + time_limit_s if time_limit_s is not None else None
+        )
+        self.memory_limit_bytes = memory_limit_bytes
+        self.nbytes = 0
+
+    def _add(
+        self,
+        highlights: list[int],
+        description: str,
+        kind: str,
+        sample: str | None = None,
+    ) -> None:
+        if self.cancel_event.is_set():
+            raise TraceCancelled("Trace generation cancelled")
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise TraceLimitExceeded("Trace generation hit its time limit")
+        super()._add(highlights, description, kind, sample)
+        limit = self.memory_limit_bytes
+        if limit is not None and self.nbytes > limit:
+            raise TraceLimitExceeded("Trace generation hit its memory limit")
+
+    def _append(self, step: dict[str, Any], sample: str | None) -> None:
+        super()._append(step, sample)
+        self.nbytes += step_nbytes(step)
+
+    def _thin(self) -> None:
+        super()._thin()
+        self.nbytes = sum(step_nbytes(step) for step in self.steps)
+
+
+class TraceJob:
+    """Handle on a trace being generated in the background."""
+
+    def __init__(
+        self,
+        func: TraceFunc,
+        data: list[int],
+        time_limit_s: float | None = None,
+        memory_limit_bytes: int | None = None,
+        max_steps: int | None = None,
+    ) -> None:
+        self.func = func
+        self.data = data
+        self.started = time.monotonic()
+        self.finished: float | None = None
+        self.error: str | None = None
+        self._cancel = threading.Event()
+        self.recorder = BudgetedRecorder(
+            self._cancel, time_limit_s, memory_limit_bytes, max_steps
+        )
+        self.future: Future[None] | None = None
+
+    @property
+    def steps(self) -> Trace:
+        """Steps produced so far (grows while the job runs)."""
+        return self.recorder.steps
+
+    @property
+    def done(self) -> bool:
+        return self.future is not None and self.future.done()
+
+    @property
+    def completed(self) -> bool:
+        """True once the full trace was generated."""
+        return self.done and self.error is None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.monotonic()) - self.started
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def run(self) -> None:
+        try:
+            self.func(self.data, self.recorder)
+        except TraceAborted as e:
+            self.error = str(e)
+        except Exception as e:  # Surface any kernel failure to the UI
+            self.error = f"Error generating steps: {e}"
+        finally:
+            self.finished = time.monotonic()
+
+    def wait(self, timeout: float | None = None) -> None:
+        if self.future is not None:
+            self.future.result(timeout)
+
+
+class TraceWorkerPool:
+    """Thread pool running trace jobs."""
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="trace-worker"
+        )
+
+    def submit(
+        self,
+        func: TraceFunc,
+        data: list[int],
+        time_limit_s: float | None = None,
+        memory_limit_bytes: int | None = None,
+        max_steps: int | None = None,
+    ) -> TraceJob:
+        """
+        Start generating a trace in the background.
+
+        Args:
+            func: A ``*_with_steps`` function accepting ``recorder=``
+            data: Input array (copied by the trace function)
+            time_limit_s: Stop after this many seconds
+            memory_limit_bytes: Stop once the steps exceed this size
+            max_steps: Step budget; larger traces are decimated
+
+        Returns:
+            Job handle for progress, prefix playback and cancellation
+        """
+        job = TraceJob(func, data, time_limit_s, memory_limit_bytes, max_steps)
+        job.future = self._executor.submit(job.run)
+        return job
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(cancel_futures=True)
+
+
+_shared: TraceWorkerPool | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_pool() -> TraceWorkerPool:
+    """Process-wide pool; size from ``SWE_TRACE_WORKERS`` (default 4)."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = TraceWorkerPool(int(os.environ.get("SWE_TRACE_WORKERS", "4")))
+        return _shared
@@ -0,0 +1,150 @@
+"""
+Race several algorithms on the same input, one worker process each.
+
+Every lane records its trace in its own process, so generating a race costs
+about as long as its slowest lane (given enough cores) instead of the sum of
+all lanes. Lanes ship their traces back in the compact binary format, along
+with the cumulative operation count and elapsed time at every step.
+
+``Race.timeline`` puts the lanes on a common axis: for evenly spaced points
+of total operations (compares plus array writes) or of elapsed time, it
+gives the step each lane had reached, which is what synchronized playback
+needs.
+"""
+
+import os
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from algorithms.sorting.tracing import StepRecorder
+
+from .cache import Trace
+from .tracefile import TraceFile, load_trace, trace_to_bytes
+
+TraceFunc = Callable[..., Trace]
+AXES = ("operations", "time")
+
+
+class RaceRecorder(StepRecorder):
+    """Step recorder stamping each step with operations and time so far."""
+
+    def __init__(self, max_steps: int | None = None) -> None:
+        super().__init__(max_steps=max_steps)
+        self.operations = 0
+        self.started = time.perf_counter()
+
+    def on_compare(self, i: int, j: int) -> None:
+        self.operations += 1
+        super().on_compare(i, j)
+
+    def on_write(self, index: int, value: int) -> None:
+        self.operations += 1
+
+    def _append(self, step: dict[str, Any], sample: str | None) -> None:
+        # Stored on the step so decimation thins them together
+        step["operations"] = self.operations
+        step["elapsed"] = time.perf_counter() - self.started
+        super()._append(step, sample)
+
+
+@dataclass
+class RaceLane:
+    """One algorithm's trace in a race."""
+
+    name: str
+    steps: TraceFile
+    operations: np.ndarray
+    elapsed: np.ndarray
+
+    @property
+    def total_operations(self) -> int:
+        return int(self.operations[-1]) if len(self.operations) else 0
+
+    @property
+    def total_time(self) -> float:
+        return float(self.elapsed[-1]) if len(self.elapsed) else 0.0
+
+
+def _run_lane(
+    name: str, func: TraceFunc, data: list[int], max_steps: int | None
+) -> tuple[str, bytes, np.ndarray, np.ndarray]:
+    """Worker: record one lane and encode it for the trip back."""
+    recorder = RaceRecorder(max_steps)
+    steps = func(data, recorder=recorder)
+    operations = np.array([step.pop("operations") for step in steps], dtype=np.int64)
+    elapsed = np.array([step.pop("elapsed") for step in steps], dtype=np.float64)
+    encoded = trace_to_bytes(steps, metadata={"algorithm": name})
+    return name, encoded, operations, elapsed
+
+
+@dataclass
+class Race:
+    """Lanes of a race on one input."""
+
+    data: list[int]
+    lanes: list[RaceLane]
+    wall_time: float
+
+    def timeline(self, frames: int, axis: str = "operations") -> np.ndarray:
+        """
+        Step index reached by each lane at evenly spaced points of ``axis``.
+
+        Args:
+            frames: Number of points; the last is when the slowest lane ends
+            axis: "operations" or "time"
+
+        Returns:
+            Array of shape (lanes, frames) of step indices
+        """
+        if axis not in AXES:
+            raise ValueError(f"axis must be one of {AXES}")
+        marks = [
+            lane.operations if axis == "operations" else lane.elapsed
+            for lane in self.lanes
+        ]
+        end = max((float(m[-1]) for m in marks if len(m)), default=0.0)
+        points = np.linspace(0.0, end, frames)
+        return np.stack(
+            [
+                np.clip(np.searchsorted(m, points, side="right") - 1, 0, len(m) - 1)
+                for m in marks
+            ]
+        )
+
+
+def run_race(
+    funcs: Mapping[str, TraceFunc],
+    data: list[int],
+    max_steps: int | None = None,
+    max_workers: int | None = None,
+) -> Race:
+    """
+    Record every algorithm's trace on ``data`` in parallel processes.
+
+    Args:
+        funcs: Lane name to ``*_with_steps`` function (module-level, picklable)
+        data: Input shared by all lanes
+        max_steps: Step budget per lane
+        max_workers: Worker processes (default: one per lane, up to the CPUs)
+
+    Returns:
+        Race with lanes in the order of ``funcs``
+    """
+    workers = max_workers or min(len(funcs), os.cpu_count() or 1)
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [
+            pool.submit(_run_lane, name, func, data, max_steps)
+            for name, func in funcs.items()
+        ]
+        results = [future.result() for future in futures]
+    lanes = [
+        RaceLane(name, load_trace(encoded), operations, elapsed)
+        for name, encoded, operations, elapsed in results
+    ]
+    return Race(data=data, lanes=lanes, wall_time=time.perf_counter() - start)
@@ -0,0 +1,430 @@
+"""
+Compact binary trace files with lazy, memory-mapped replay.
+
+A trace is stored column by column instead of as a list of dicts:
+
+- ``diff_offsets`` / ``diff_index`` / ``diff_value``: for every step, the
+  positions whose value changed since the previous step and their new values
+- ``hl_offsets`` / ``highlights``: the highlighted positions of every step
+- ``desc_ids`` / ``desc_offsets`` / ``desc_blob``: an index per step into a
+  table of distinct descriptions
+- ``kind_ids``: an index per step into the header's ``kinds``, the step
+  kinds the recorder wrote ("compare", "swap", "partition"...)
+- ``snapshots``: the full array every ``snapshot_interval`` steps
+
+Step ``i`` is rebuilt from the nearest snapshot at or before it plus at most
+``snapshot_interval - 1`` diffs, so random access stays cheap without storing
+every array. Uncompressed sections are read straight out of a memory map;
+compressed sections (zlib) are inflated on first use.
+
+File layout::
+
+    b"SWTRACE1" | uint32 header length | JSON header | padding | sections
+
+Usage:
+    python -m algorithms.traces quick_sort trace.swt --size 2000 --seed 42
+"""
+
+import io
+import json
+import mmap
+import struct
+import zlib
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import IO, Any, overload
+
+import numpy as np
+
+MAGIC = b"SWTRACE1"
+FORMAT_VERSION = 2
+# Version 1 files lack step kinds; they replay but their steps have no "kind"
+READABLE_VERSIONS = (1, 2)
+DEFAULT_SNAPSHOT_INTERVAL = 256
+# Steps diffed per vectorized block while writing
+ENCODE_BLOCK = 1024
+ALIGNMENT = 8
+_SECTIONS = (
+    "diff_offsets",
+    "diff_index",
+    "diff_value",
+    "hl_offsets",
+    "highlights",
+    "desc_ids",
+    "desc_offsets",
+    "desc_blob",
+    "snapshots",
+)
+_KIND_SECTIONS = ("kind_ids",)
+_HEADER_KEYS = frozenset(
+    {"n_steps", "array_len", "snapshot_interval", "compression", "metadata"}
+)
+
+
+def _encode(
+    steps: Iterable[dict[str, Any]], snapshot_interval: int
+) -> tuple[dict[str, np.ndarray], list[str], int, int]:
+    """
+    Split steps into column arrays.
+
+    Returns:
+        The columns, the kind names ``kind_ids`` indexes, the number of steps
+        and the array length
+    """
+    diff_counts: list[np.ndarray] = []
+    diff_index: list[np.ndarray] = []
+    diff_value: list[np.ndarray] = []
+    hl_counts: list[int] = []
+    highlights: list[int] = []
+    desc_ids: list[int] = []
+    table: dict[str, int] = {}
+    kind_ids: list[int] = []
+    kinds: dict[str, int] = {}
+    snapshots: list[np.ndarray] = []
+
+    prev: np.ndarray | None = None
+    n_steps = 0
+    block: list[list[int]] = []
+
+    def flush() -> None:
+        nonlocal prev, n_steps
+        if not block:
+            return
+        arrays = np.array(block, dtype=np.int64)
+        if arrays.ndim != 2 or (prev is not None and arrays.shape[1] != len(prev)):
+            raise ValueError("every step must hold an array of the same length")
+        previous = np.vstack([arrays[:1] if prev is None else prev[None], arrays])
+        changed = previous[1:] != previous[:-1]
+        rows, cols = np.nonzero(changed)
+        diff_counts.append(np.bincount(rows, minlength=len(arrays)))
+        diff_index.append(cols.astype(np.int32))
+        diff_value.append(arrays[rows, cols])
+        first = n_steps
+        # Snapshot every step whose global index is a multiple of the interval
+        start = -first % snapshot_interval
+        # Copy, so the snapshots do not keep every diffed block alive
+        snapshots.extend(arrays[start::snapshot_interval].copy())
+        n_steps += len(arrays)
+        prev = arrays[-1]
+        block.clear()
+
+    for step in steps:
+        block.append(step["array"])
+        hl = step.get("highlights", [])
+        hl_counts.append(len(hl))
+        highlights.extend(hl)
+        desc_ids.append(table.setdefault(step.get("description", ""), len(table)))
+        kind_ids.append(kinds.setdefault(step.get("kind", ""), len(kinds)))
+        if len(block) == ENCODE_BLOCK:
+            flush()
+    flush()
+
+    array_len = 0 if prev is None else len(prev)
+    encoded = [text.encode() for text in table]
+    columns = {
+        "diff_offsets": _offsets(np.concatenate(diff_counts) if diff_counts else []),
+        "diff_index": _concat(diff_index, np.int32),
+        "diff_value": _concat(diff_value, np.int64),
+        "hl_offsets": _offsets(hl_counts),
+        "highlights": np.array(highlights, dtype=np.int32),
+        "desc_ids": np.array(desc_ids, dtype=np.uint32),
+        "desc_offsets": _offsets([len(b) for b in encoded]),
+        "desc_blob": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+        "kind_ids": np.array(kind_ids, dtype=np.uint16),
+        "snapshots": (
+            np.concatenate(snapshots) if snapshots else np.empty(0, np.int64)
+        ),
+    }
+    return columns, list(kinds), n_steps, array_len
+
+
+def _offsets(counts: Any) -> np.ndarray:
+    out = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=out[1:])
+    return out
+
+
+def _concat(parts: list[np.ndarray], dtype: type) -> np.ndarray:
+    return np.concatenate(parts).astype(dtype) if parts else np.empty(0, dtype)
+
+
+def dump_trace(
+    steps: Iterable[dict[str, Any]],
+    file: IO[bytes],
+    snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL,
+    compress: bool = False,
+    metadata: dict[str, Any] | None = None,
+) -> None:
+    """
+    Write a trace to a binary file object.
+
+    Args:
+        steps: Step dicts as produced by the ``*_with_steps`` functions
+        file: Binary file object to write to
+        snapshot_interval: Store the full array every this many steps
+        compress: zlib-compress each section (smaller, but not mmap-able)
+        metadata: JSON-serializable extra information, e.g. the algorithm
+    """
+    if snapshot_interval < 1:
+        raise ValueError("snapshot_interval must be at least 1")
+    columns, kinds, n_steps, array_len = _encode(steps, snapshot_interval)
+
+    payloads: list[bytes] = []
+    sections: dict[str, dict[str, Any]] = {}
+    offset = 0
+    for name, column in columns.items():
+        raw = np.ascontiguousarray(column).tobytes()
+        data = zlib.compress(raw) if compress else raw
+        sections[name] = {
+            "offset": offset,
+            "nbytes": len(data),
+            "dtype": column.dtype.str,
+            "count": len(column),
+        }
+        payloads.append(data)
+        offset += len(data) + (-len(data) % ALIGNMENT)
+
+    header = json.dumps(
+        {
+            "version": FORMAT_VERSION,
+            "n_steps": n_steps,
+            "array_len": array_len,
+            "snapshot_interval": snapshot_interval,
+            "compression": "zlib" if compress else None,
+            "sections": sections,
+            "kinds": kinds,
+            "metadata": metadata or {},
+        }
+    ).encode()
+    preamble = MAGIC + struct.pack("<I", len(header)) + header
+    file.write(preamble + b"\0" * (-len(preamble) % ALIGNMENT))
+    for data in payloads:
+        file.write(data + b"\0" * (-len(data) % ALIGNMENT))
+
+
+def write_trace(
+    path: str | Path,
+    steps: Iterable[dict[str, Any]],
+    snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL,
+    compress: bool = False,
+    metadata: dict[str, Any] | None = None,
+) -> Path:
+    """Write a trace to ``path``; see ``dump_trace`` for the arguments."""
+    path = Path(path)
+    with path.open("wb") as f:
+        dump_trace(steps, f, snapshot_interval, compress, metadata)
+    return path
+
+
+def trace_to_bytes(
+    steps: Iterable[dict[str, Any]],
+    snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL,
+    compress: bool = True,
+    metadata: dict[str, Any] | None = None,
+) -> bytes:
+    """Encode a trace in memory, e.g. for a download; compressed by default."""
+    buffer = io.BytesIO()
+    dump_trace(steps, buffer, snapshot_interval, compress, metadata)
+    return buffer.getvalue()
+
+
+def _parse_header(buffer: bytes | mmap.mmap) -> tuple[dict[str, Any], int]:
+    """
+    Validated header of an encoded trace and the offset of its first section.
+
+    Raises:
+        ValueError: If the buffer is not a trace, is truncated or has a
+            malformed header
+    """
+    if buffer[: len(MAGIC)] != MAGIC:
+        raise ValueError("not a trace file")
+    start = len(MAGIC) + 4
+    try:
+        (header_len,) = struct.unpack_from("<I", buffer, len(MAGIC))
+        if start + header_len > len(buffer):
+            raise ValueError("header is truncated")
+        header = json.loads(bytes(buffer[start : start + header_len]))
+        if header["version"] not in READABLE_VERSIONS:
+            raise ValueError(f"unsupported trace format version {header['version']}")
+        base = start + header_len + (-(start + header_len) % ALIGNMENT)
+        has_kinds = header["version"] >= 2
+        required = _HEADER_KEYS | {"kinds"} if has_kinds else _HEADER_KEYS
+        missing = required - header.keys()
+        if missing:
+            raise ValueError(f"header lacks {', '.join(sorted(missing))}")
+        if has_kinds and not all(isinstance(k, str) for k in header["kinds"]):
+            raise ValueError("header kinds must be strings")
+        for name in (*_SECTIONS, *(_KIND_SECTIONS if has_kinds else ())):
+            info = header["sections"][name]
+            np.dtype(info["dtype"])
+            end = base + int(info["offset"]) + int(info["nbytes"])
+            if end > len(buffer):
+                raise ValueError(f"section {name} is truncated")
+    except (struct.error, KeyError, TypeError) as e:
+        raise ValueError(f"malformed trace header: {e!r}") from None
+    return header, base
+
+
+class TraceFile(Sequence[dict[str, Any]]):
+    """
+    Read-only, lazily decoded view of a binary trace.
+
+    Behaves like the list of step dicts it was written from: ``len``,
+    indexing, slicing and iteration decode steps on demand. Stepping forward
+    from the last decoded step only applies the new diffs.
+    """
+
+    def __init__(self, source: str | Path | bytes) -> None:
+        self._mmap: mmap.mmap | None = None
+        self._buffer: bytes | mmap.mmap
+        if isinstance(source, bytes | bytearray | memoryview):
+            self._buffer = bytes(source)
+        else:
+            with Path(source).open("rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._buffer = self._mmap
+
+        self._columns: dict[str, np.ndarray] = {}
+        self._descriptions: dict[int, str] = {}
+        self._cursor: tuple[int, np.ndarray] | None = None
+        try:
+            self._header, self._base = _parse_header(self._buffer)
+        except ValueError:
+            self.close()
+            raise
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        return dict(self._header["metadata"])
+
+    @property
+    def array_len(self) -> int:
+        return int(self._header["array_len"])
+
+    @property
+    def snapshot_interval(self) -> int:
+        return int(self._header["snapshot_interval"])
+
+    def column(self, name: str) -> np.ndarray:
+        """Raw, read-only column by section name, e.g. ``"desc_ids"``."""
+        column = self._columns.get(name)
+        if column is None:
+            info = self._header["sections"][name]
+            offset = self._base + info["offset"]
+            dtype = np.dtype(info["dtype"])
+            if self._header["compression"] == "zlib":
+                try:
+                    raw = zlib.decompress(
+                        self._buffer[offset : offset + info["nbytes"]]
+                    )
+                except zlib.error as e:
+                    raise ValueError(f"corrupt trace section {name}: {e}") from None
+                column = np.frombuffer(raw, dtype=dtype)
+            else:
+                column = np.frombuffer(
+                    self._buffer, dtype=dtype, count=info["count"], offset=offset
+                )
+            self._columns[name] = column
+        return column
+
+    def _description(self, step: int) -> str:
+        desc_id = int(self.column("desc_ids")[step])
+        text = self._descriptions.get(desc_id)
+        if text is None:
+            offsets = self.column("desc_offsets")
+            blob = self.column("desc_blob")
+            text = blob[offsets[desc_id] : offsets[desc_id + 1]].tobytes().decode()
+            self._descriptions[desc_id] = text
+        return text
+
+    @property
+    def kinds(self) -> list[str]:
+        """Kind names ``kind_ids`` indexes; empty for version 1 files."""
+        return list(self._header.get("kinds", []))
+
+    def kind(self, step: int) -> str:
+        """Kind of ``step``, or "" if the file or the step has none."""
+        kinds = self._header.get("kinds")
+        if not kinds:
+            return ""
+        kind_id = int(self.column("kind_ids")[step])
+        if kind_id >= len(kinds):
+            raise ValueError(f"corrupt trace: step {step} has kind {kind_id}")
+        return str(kinds[kind_id])
+
+    def _apply(self, arr: np.ndarray, first: int, last: int) -> None:
+        """Apply the diffs of steps ``first`` to ``last`` inclusive."""
+        offsets = self.column("diff_offsets")
+        lo, hi = offsets[first], offsets[last + 1]
+        # Later steps must win, and fancy assignment keeps the last duplicate
+        arr[self.column("diff_index")[lo:hi]] = self.column("diff_value")[lo:hi]
+
+    def array(self, step: int) -> np.ndarray:
+        """The array at ``step`` as an int64 copy."""
+        interval = self.snapshot_interval
+        snap = step // interval
+        base = snap * interval
+        if self._cursor is not None and base <= self._cursor[0] <= step:
+            # Step forward from the last decoded array
+            base, arr = self._cursor
+        else:
+            n = self.array_len
+            arr = self.column("snapshots")[snap * n : (snap + 1) * n].copy()
+        if step > base:
+            self._apply(arr, base + 1, step)
+        self._cursor = (step, arr)
+        return arr.copy()
+
+    def step(self, index: int) -> dict[str, Any]:
+        """Decode one step into the dict shape the visualizer uses."""
+        offsets = self.column("hl_offsets")
+        highlights = self.column("highlights")[offsets[index] : offsets[index + 1]]
+        step = {
+            "array": self.array(index).tolist(),
+            "highlights": highlights.tolist(),
+            "description": self._description(index),
+        }
+        kind = self.kind(index)
+        if kind:
+            step["kind"] = kind
+        return step
+
+    def __len__(self) -> int:
+        return int(self._header["n_steps"])
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self.step(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("trace step out of range")
+        return self.step(index)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for i in range(len(self)):
+            yield self.step(i)
+
+    def close(self) -> None:
+        self._columns.clear()
+        self._cursor = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> "TraceFile":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def load_trace(source: str | Path | bytes) -> TraceFile:
+    """Open a trace file (or encoded bytes) for lazy replay."""
+    return TraceFile(source)
@@ -0,0 +1,70 @@
+"""
+Tests for the adaptive ``auto_sort`` dispatcher.
+"""
+
+import pytest
+
+from algorithms.datasets import make_dataset
+from algorithms.sorting import auto_sort, plan_sort
+
+DISTRIBUTIONS = [
+    "Random",
+    "Sorted",
+    "Reverse Sorted",
+    "Nearly Sorted",
+    "Few Unique",
+    "Organ Pipe",
+    "Sawtooth",
+    "All Equal Except One",
+]
+
+
+@pytest.mark.parametrize("distribution", DISTRIBUTIONS)
+@pytest.mark.parametrize("size", [0, 1, 2, 50, 5000])
+def test_auto_sort_sorts_every_distribution(distribution: str, size: int) -> None:
+    """Whatever engine is chosen, the result is sorted and the input untouched."""
+    data = make_dataset(distribution, size, seed=3)
+    original = data.copy()
+    assert auto_sort(data) == sorted(data)
+    assert data == original
+
+
+@pytest.mark.parametrize(
+    "distribution,size,engine",
+    [
+        ("Random", 100, "builtin"),
+        ("Sorted", 20_000, "builtin"),
+        ("Reverse Sorted", 20_000, "builtin"),
+        ("Organ Pipe", 20_000, "builtin"),
+        ("Random", 20_000, "numpy"),
+        ("Nearly Sorted", 20_000, "numpy"),
+    ],
+)
+def test_plan_follows_benchmark_thresholds(
+    distribution: str, size: int, engine: str
+) -> None:
+    """Timsort for small or run-structured input, NumPy for the rest."""
+    assert plan_sort(make_dataset(distribution, size, seed=1)).engine == engine
+
+
+def test_restricted_engines_and_debug_output(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Callers can limit the engines; debug mode explains the choice."""
+    data = make_dataset("Sorted", 1000)
+    plan = plan_sort(data, engines=["quick_sort", "insertion_sort", "merge_sort"])
+    assert plan.engine == "insertion_sort"
+    assert plan.input_class == "ascending runs"
+
+    auto_sort(data, debug=True)
+    assert "auto_sort: builtin for 1,000 values" in capsys.readouterr().err
+
+    with pytest.raises(ValueError):
+        plan_sort(data, engines=["bogo_sort"])
+
+
+def test_values_outside_int64_skip_numpy() -> None:
+    """Big integers fall back to an engine that can compare them."""
+    data = [2**70, -(2**65), 5] * 200
+    assert plan_sort(data).engine != "numpy"
+    assert auto_sort(data) == sorted(data)
@@ -0,0 +1,86 @@
+"""
+Tests for the data structures library.
+"""
+
+import random
+
+import pytest
+
+from algorithms.data_structures import SortedList
+from algorithms.sorting import ALGORITHMS
+
+
+@pytest.mark.parametrize("load", [4, 5, 64])
+def test_random_updates_match_a_sorted_list(load: int) -> None:
+    """Inserts, removals and pops keep order, rank and select exact."""
+    rng = random.Random(load)
+    container: SortedList[int] = SortedList(load=load)
+    expected: list[int] = []
+    for step in range(3000):
+        op = rng.random()
+        if op < 0.55 or not expected:
+            value = rng.randrange(200)
+            container.add(value)
+            expected.append(value)
+            expected.sort()
+        elif op < 0.8:
+            value = rng.randrange(200)
+            assert container.discard(value) == (value in expected)
+            if value in expected:
+                expected.remove(value)
+        else:
+            index = rng.randrange(-len(expected), len(expected))
+            assert container.pop(index) == expected.pop(index)
+
+        if step % 50 == 0:
+            assert list(container) == expected
+            assert [container[i] for i in range(len(expected))] == expected
+            probe = rng.randrange(200)
+            assert container.rank(probe) == sum(v < probe for v in expected)
+            assert container.count(probe) == expected.count(probe)
+
+
+def test_range_iteration() -> None:
+    """irange honors bounds and inclusivity; slices and islice by position."""
+    container = SortedList(range(0, 100, 2), load=4)
+
+    assert list(container.irange(10, 20)) == [10, 12, 14, 16, 18, 20]
+    assert list(container.irange(10, 20, inclusive=(False, False))) == [12, 14, 16, 18]
+    assert list(container.irange(high=4)) == [0, 2, 4]
+    assert list(container.irange(95)) == [96, 98]
+    assert list(container.islice(47, 60)) == [94, 96, 98]
+    assert container[5:9] == [10, 12, 14, 16]
+    assert container[::20] == [0, 40, 80]
+    assert list(reversed(container))[:2] == [98, 96]
+
+
+@pytest.mark.parametrize("key", ["merge_sort", "quick_sort"])
+def test_bulk_load_from_sorted_output(key: str) -> None:
+    """Output of any engine loads as-is; unsorted input is rejected."""
+    data = random.Random(7).choices(range(1000), k=2000)
+    container = SortedList.from_sorted(ALGORITHMS[key].sort_func(data), load=16)
+
+    assert container == SortedList(data)
+    assert container.select(-1) == max(data)
+    with pytest.raises(ValueError, match="not sorted at index 2"):
+        SortedList.from_sorted([1, 2, 0])
+
+
+def test_errors_and_bulk_update() -> None:
+    """Missing values and bad positions raise; update merges in bulk."""
+    container = SortedList([3, 1, 2])
+
+    with pytest.raises(ValueError):
+        container.remove(5)
+    with pytest.raises(IndexError):
+        container[3]
+    with pytest.raises(IndexError):
+        SortedList[int]().pop()
+    with pytest.raises(ValueError):
+        SortedList(load=2)
+
+    container.update([0, 9, 2])
+    assert list(container) == [0, 1, 2, 2, 3, 9]
+    assert 9 in container and 4 not in container
+    del container[0]
+    assert repr(container) == "SortedList([1, 2, 2, 3, 9])"
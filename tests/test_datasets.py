@@ -0,0 +1,158 @@
+"""
+Tests for the dataset generators and presortedness metrics.
+"""
+
+import itertools
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from algorithms.datasets import (
+    ADVERSARIAL_DATASETS,
+    DATASET_NAMES,
+    DISTRIBUTIONS,
+    all_equal_except_one,
+    antiqsort,
+    count_inversions,
+    generate,
+    generate_to_file,
+    generators,
+    make_dataset,
+    measure_presortedness,
+    organ_pipe,
+    sawtooth,
+)
+from algorithms.sorting import CountingObserver, merge_sort, quick_sort
+
+
+def test_antiqsort_drives_quick_sort_quadratic() -> None:
+    """The adversary's input costs quick sort ~n²/2 comparisons."""
+    size = 300
+    killer = antiqsort(quick_sort, size)
+    assert sorted(killer) == list(range(1, size + 1))
+
+    counter = CountingObserver()
+    assert quick_sort(killer, counter) == sorted(killer)
+    assert counter.compares > size * size // 4
+
+
+def test_antiqsort_does_not_hurt_merge_sort() -> None:
+    """Merge sort stays O(n log n) on the quick sort killer."""
+    size = 300
+    counter = CountingObserver()
+    merge_sort(antiqsort(quick_sort, size), counter)
+    assert counter.compares < size * 10
+
+
+def test_fixed_patterns() -> None:
+    """Fixed adversarial patterns have the documented shape."""
+    assert organ_pipe(7) == [1, 2, 3, 4, 3, 2, 1]
+    assert sawtooth(6, teeth=2) == [1, 2, 3, 1, 2, 3]
+    assert all_equal_except_one(4) == [2, 2, 2, 1]
+    assert all_equal_except_one(0) == []
+
+
+@pytest.mark.parametrize("size", [1, 7, 10, 100, 1001])
+@pytest.mark.parametrize("teeth", [1, 3, 8, 64])
+def test_sawtooth_has_one_run_per_tooth(size: int, teeth: int) -> None:
+    """Every tooth is a non-empty ascending run starting at 1."""
+    data = sawtooth(size, teeth)
+    starts = [i for i, value in enumerate(data) if value == 1]
+    lengths = [b - a for a, b in zip(starts, starts[1:] + [size], strict=True)]
+
+    assert len(starts) == min(teeth, size) and starts[0] == 0
+    assert max(lengths) - min(lengths) <= 1
+    assert all(data[i] == data[i - 1] + 1 for i in range(1, size) if data[i] != 1)
+
+
+@pytest.mark.parametrize("name", list(ADVERSARIAL_DATASETS))
+def test_adversarial_datasets_have_requested_size(name: str) -> None:
+    """Every registered generator honours the requested size."""
+    for size in (0, 1, 2, 17):
+        assert len(ADVERSARIAL_DATASETS[name](size)) == size
+
+
+@pytest.mark.parametrize("name", list(DISTRIBUTIONS))
+def test_generate_is_reproducible(name: str) -> None:
+    """Same seed, same data; the array has the requested size and dtype."""
+    first = generate(name, 1000, seed=7)
+    assert first.dtype == np.int64 and len(first) == 1000
+    assert np.array_equal(first, generate(name, 1000, seed=7))
+
+
+def test_file_matches_memory_across_chunks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Streaming to a memmap yields exactly the in-memory data."""
+    monkeypatch.setattr(generators, "CHUNK_SIZE", 64)
+    for name in DISTRIBUTIONS:
+        path = generate_to_file(tmp_path / "data.i64", name, 1000, seed=3)
+        on_disk = np.fromfile(path, dtype=np.int64)
+        assert np.array_equal(on_disk, generate(name, 1000, seed=3)), name
+
+
+def test_ordered_distributions_are_permutations() -> None:
+    """Positional distributions keep 1..n and bound displacement."""
+    size = 5000
+    expected = np.arange(1, size + 1)
+    for name in ("Sorted", "Reverse Sorted", "Nearly Sorted", "K-Sorted"):
+        assert np.array_equal(np.sort(generate(name, size, seed=1)), expected)
+
+    k_sorted = generate("K-Sorted", size, seed=1)
+    displacement = np.abs(k_sorted - expected)
+    assert displacement.max() <= generators.K_SORTED_DISPLACEMENT
+
+
+def test_make_dataset_covers_every_name() -> None:
+    """Every listed dataset builds as a list of ints."""
+    for name in DATASET_NAMES:
+        data = make_dataset(name, 20, seed=0)
+        assert len(data) == 20 and all(isinstance(x, int) for x in data)
+
+    with pytest.raises(ValueError):
+        generate("Bogus", 10)
+
+
+def test_inversions_match_brute_force() -> None:
+    """The merge-based count agrees with checking every pair."""
+    rng = np.random.default_rng(7)
+    for size in [0, 1, 2, 17, 64]:
+        values = rng.integers(0, 6, size).tolist()
+        expected = sum(a > b for a, b in itertools.combinations(values, 2))
+        assert count_inversions(values) == expected
+
+
+def test_presortedness_extremes() -> None:
+    """Sorted and reversed inputs sit at opposite ends of every measure."""
+    ascending = measure_presortedness(list(range(100)))
+    assert (ascending.inversions, ascending.runs, ascending.lis) == (0, 1, 100)
+    assert ascending.max_displacement == 0 and ascending.distinct_ratio == 1.0
+
+    descending = measure_presortedness(list(range(100, 0, -1)))
+    assert descending.inversion_ratio == 1.0
+    assert (descending.runs, descending.lis, descending.max_displacement) == (
+        100,
+        1,
+        99,
+    )
+
+
+def test_sampled_presortedness_estimates_exact() -> None:
+    """Above the exact limit, inversions are estimated from sampled pairs."""
+    values = make_dataset("Nearly Sorted", 5000, seed=2)
+    exact = measure_presortedness(values)
+    sampled = measure_presortedness(values, exact_limit=1000, sample_size=20_000)
+    assert sampled.sampled and not exact.sampled
+    assert sampled.inversion_ratio == pytest.approx(exact.inversion_ratio, abs=0.02)
+    assert (sampled.runs, sampled.distinct) == (exact.runs, exact.distinct)
+
+
+@pytest.mark.parametrize("name", ["Random", "Nearly Sorted", "Reverse Sorted"])
+def test_sampled_lis_is_a_lower_bound(name: str) -> None:
+    """The sampled LIS never exceeds the exact one, whatever the input."""
+    values = make_dataset(name, 5000, seed=3)
+    exact = measure_presortedness(values)
+    sampled = measure_presortedness(values, exact_limit=1000, sample_size=500)
+    assert 1 <= sampled.lis <= exact.lis
+    assert measure_presortedness(sorted(values), exact_limit=1000).lis == 5000
@@ -0,0 +1,74 @@
+"""
+Tests for the distributed sample sort and its local harness.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from algorithms.distributed import (
+    DistributedSortError,
+    partition,
+    pick_splitters,
+    read_output,
+    run_local,
+    write_input_shards,
+)
+
+
+def test_partition_keeps_duplicates_of_a_splitter_together() -> None:
+    """Bucket i holds (splitters[i-1], splitters[i]]; nothing is lost."""
+    values = np.array([5, 1, 9, 3, 3, 7, 3, 0], dtype="<i8")
+    splitters = pick_splitters(np.array([3, 0, 9, 5, 7, 1]), 3)
+
+    buckets = partition(values, splitters)
+
+    assert splitters.tolist() == [3, 7]
+    assert [sorted(b.tolist()) for b in buckets] == [[0, 1, 3, 3, 3], [5, 7], [9]]
+    assert pick_splitters(np.empty(0, dtype="<i8"), 3).tolist() == [0, 0]
+
+
+@pytest.mark.parametrize(
+    ("workers", "algorithm"), [(1, "numpy"), (3, "numpy"), (2, "merge_sort")]
+)
+def test_local_run_produces_globally_sorted_shards(
+    tmp_path: Path, workers: int, algorithm: str
+) -> None:
+    """Shards concatenated in rank order equal the sorted input."""
+    values = np.random.default_rng(workers).integers(-(10**12), 10**12, 20_000)
+    inputs = write_input_shards(values, workers, tmp_path / "input")
+
+    report = run_local(inputs, tmp_path / "output", algorithm, timeout=60)
+
+    assert np.array_equal(read_output(report), np.sort(values))
+    assert [w.rank for w in report.workers] == list(range(workers))
+    assert sum(w.bytes_sent for w in report.workers) == report.shuffle_bytes
+    assert report.shuffle_bytes == sum(w.bytes_received for w in report.workers)
+    assert report.skew < 1.5
+    assert set(report.phase_times) >= {"sample", "exchange", "sort"}
+    if workers == 1:
+        assert report.shuffle_bytes == 0
+
+
+def test_skewed_input_and_empty_shards(tmp_path: Path) -> None:
+    """Heavy duplicates are reported as skew; empty inputs still finish."""
+    values = np.concatenate([np.full(9_000, 42), np.arange(1_000)])
+    inputs = write_input_shards(values, 3, tmp_path / "input")
+    inputs.append(tmp_path / "input" / "empty.i64")
+    inputs[-1].write_bytes(b"")
+
+    report = run_local(inputs, tmp_path / "output", timeout=60)
+
+    assert np.array_equal(read_output(report), np.sort(values))
+    assert report.skew > 3
+    assert min(w.input_count for w in report.workers) == 0
+
+
+def test_worker_failure_surfaces(tmp_path: Path) -> None:
+    """A worker that cannot read its shard fails the whole sort."""
+    inputs = write_input_shards(np.arange(10), 2, tmp_path / "input")
+    inputs[1].write_bytes(b"\x00" * 5)
+
+    with pytest.raises(DistributedSortError, match="not a whole number of int64"):
+        run_local(inputs, tmp_path / "output", timeout=10)
@@ -0,0 +1,176 @@
+"""
+Tests for the profiling tools.
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from algorithms.datasets import make_dataset
+from algorithms.profiling import measure_memory, profile_lines
+from algorithms.profiling.benchmark import BenchmarkResult, over_budget, run_benchmark
+from algorithms.profiling.cache_sim import (
+    CacheLevel,
+    CacheSimulator,
+    parse_level,
+    run_cache_benchmark,
+    simulate_cache,
+)
+from algorithms.profiling.history import GitInfo, HistoryStore
+from algorithms.sorting import (
+    ALGORITHMS,
+    bubble_sort,
+    bubble_sort_with_steps,
+    selection_sort,
+)
+from algorithms.sorting._selection_sort import _selection_sort
+from algorithms.sorting.tracing import CountingObserver
+
+
+def test_line_profile_counts_inner_loop() -> None:
+    """The comparison line runs once per compare made by selection sort."""
+    data = list(range(20, 0, -1))
+    result, profile = profile_lines(selection_sort, data)
+
+    assert result == sorted(data)
+    compare_line = next(
+        line for line in profile.lines if "if arr[j] < arr[min_idx]" in line.source
+    )
+    assert compare_line.hits == 20 * 19 // 2
+    assert profile.hottest(1)[0].hits > 0
+
+
+def test_trace_hooks_are_never_executed() -> None:
+    """Profiling runs the plain kernel, so trace hook lines stay cold."""
+    _, profile = profile_lines(_selection_sort, [3, 1, 2])
+    hooks = [line for line in profile.lines if "trace." in line.source]
+    assert hooks
+    assert all(line.hits == 0 for line in hooks)
+
+
+def test_measure_memory_sees_trace_copies() -> None:
+    """Step traces copy the array per step, so they outweigh the plain sort."""
+    data = list(range(200, 0, -1))
+    _, plain = measure_memory(bubble_sort, data)
+    steps, traced = measure_memory(bubble_sort_with_steps, data)
+
+    assert traced.peak_bytes > plain.peak_bytes
+    assert traced.peak_bytes >= len(steps) * len(data)
+    assert traced.churn_bytes >= traced.peak_bytes // 2
+
+
+def test_benchmark_reports_memory_per_variant() -> None:
+    """Benchmark rows carry memory columns and a step count for traces."""
+    results = run_benchmark(
+        ["merge_sort"], [50], ["Random"], ["plain", "traced"], repeats=1, memory=True
+    )
+    plain, traced = results
+    assert plain.steps is None and traced.steps
+    assert traced.memory is not None and "Peak (KB)" in traced.as_row()
+    assert plain.presortedness is not None and "Inversions" in plain.as_row()
+    assert over_budget(results, 0) == results
+
+
+def test_history_traces_slowdown_to_commit(tmp_path: Path) -> None:
+    """Runs are grouped per revision in commit order and slowdowns flagged."""
+    store = HistoryStore(tmp_path / "history.sqlite")
+    commits = [("a" * 40, 1.0), ("b" * 40, 1.1), ("c" * 40, 2.5)]
+    for day, (revision, time_s) in enumerate(commits, start=1):
+        git = GitInfo(revision, datetime(2025, 1, day), f"commit {day}")
+        for repeat in (time_s, time_s * 2):  # The best of both counts
+            results = [
+                BenchmarkResult("quick_sort", "plain", 100, "Random", repeat),
+                BenchmarkResult("merge_sort", "plain", 100, "Random", 1.0),
+            ]
+            store.record(results, git=git)
+
+    assert len(store.trend()) == 12
+    quick = store.by_revision(algorithm="quick_sort")
+    assert [r.revision for r in quick] == [c[0] for c in commits]
+    assert [r.best_time_s for r in quick] == [1.0, 1.1, 2.5]
+    assert all(r.samples == 2 for r in quick)
+
+    (regression,) = store.regressions()
+    assert regression.after.algorithm == "quick_sort"
+    assert regression.after.subject == "commit 3"
+    assert regression.ratio == pytest.approx(2.5 / 1.1)
+    assert store.facets()["algorithm"] == ["merge_sort", "quick_sort"]
+
+
+def test_history_records_benchmark_memory(tmp_path: Path) -> None:
+    """Measured results keep their memory columns and machine info."""
+    store = HistoryStore(tmp_path / "history.sqlite")
+    results = run_benchmark(["merge_sort"], [50], ["Sorted"], repeats=1, memory=True)
+    store.record(results, source="app")
+
+    (point,) = store.trend(machine=store.facets()["machine"][0])
+    assert point.algorithm == "merge_sort" and point.distribution == "Sorted"
+    assert point.peak_bytes is not None and point.peak_bytes > 0
+    assert store.trend(size=1000) == []
+
+
+def test_cache_levels_parse_and_validate() -> None:
+    """Level specs take size suffixes; geometry must divide into sets."""
+    assert parse_level("L2:1M:16:14") == CacheLevel("L2", 2**20, 16, 14)
+    assert parse_level("L1:512:2:4", line_bytes=32).sets == 8
+    with pytest.raises(ValueError, match="NAME:SIZE:WAYS:LATENCY"):
+        parse_level("L1:32K:8")
+    with pytest.raises(ValueError, match="whole number"):
+        parse_level("L1:100:2:4")
+
+
+def test_cache_simulator_lru_sets() -> None:
+    """Scans hit within a line; conflicting lines evict least recent first."""
+    sim = CacheSimulator([CacheLevel("L1", 256, ways=2, latency=1)], 100)
+    for i in range(32):  # 4 lines of 8 elements, fit exactly
+        sim.access(i)
+    assert (sim.stats[0].hits, sim.stats[0].misses) == (28, 4)
+
+    # Lines 0, 2 and 4 share set 0 of 2 ways: 4 evicts 0, 0 evicts 2...
+    for i in (0, 16, 32, 0, 16):
+        sim.access(i)
+    assert (sim.stats[0].hits, sim.stats[0].misses) == (30, 7)
+    assert sim.memory_accesses == 7
+    assert sim.cycles == 37 * 1 + 7 * 100
+
+
+def test_cache_simulator_falls_back_to_lower_levels() -> None:
+    """A line evicted from L1 is still found in the larger L2."""
+    sim = CacheSimulator(
+        [CacheLevel("L1", 128, ways=1, latency=1), CacheLevel("L2", 1024, 4, 10)],
+        100,
+    )
+    for i in (0, 16, 0):  # Lines 0 and 2 conflict in the direct-mapped L1
+        sim.access(i)
+    assert [(s.hits, s.misses) for s in sim.stats] == [(0, 3), (1, 2)]
+    assert sim.cycles == 3 * 1 + 3 * 10 + 2 * 100
+
+
+def test_simulate_cache_replays_every_access() -> None:
+    """Each traced read and write goes through the model once."""
+    data = make_dataset("Random", 500, seed=6)
+    counts = CountingObserver()
+    ALGORITHMS["quick_sort"].kernel.run(data.copy(), counts)
+
+    report = simulate_cache(ALGORITHMS["quick_sort"], data, "Random")
+    assert (report.reads, report.writes) == (counts.reads, counts.writes)
+    l1 = report.levels[0]
+    assert l1.hits + l1.misses == report.accesses
+    # 500 8-byte elements fit in L1: only the 63 compulsory misses reach memory
+    assert report.memory_accesses == -(-500 * 8 // 64)
+    assert report.as_row()["L1 Hit %"] > 99
+
+
+def test_cache_benchmark_covers_string_engines() -> None:
+    """String keys run the radix engines next to the comparison sorts."""
+    reports = run_cache_benchmark(
+        sizes=[300], distributions=["File Paths"], strings=True
+    )
+    assert [r.algorithm for r in reports] == [
+        "msd_radix_sort",
+        "multikey_quick_sort",
+        "quick_sort",
+        "merge_sort",
+    ]
+    assert all(r.cycles > 0 and r.size == 300 for r in reports)
@@ -0,0 +1,143 @@
+"""
+Tests for the sorting HTTP service.
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from algorithms.datasets import antiqsort
+from algorithms.service import app
+from algorithms.service.app import (
+    QUADRATIC_MAX_ELEMENTS,
+    TRACE_DEFAULT_MAX_STEPS,
+    TRACE_MAX_STEPS,
+)
+from algorithms.sorting import quick_sort
+
+
+def test_sort_json_and_binary() -> None:
+    """JSON and raw int64 inputs are sorted and returned in kind."""
+    with TestClient(app) as client:
+        response = client.post(
+            "/sort", json={"algorithm": "merge_sort", "data": [5, -1, 3, 3]}
+        )
+        assert response.json() == {"algorithm": "merge_sort", "data": [-1, 3, 3, 5]}
+
+        values = np.array([9, 2, 7, 2**40, -5], dtype="<i8")
+        response = client.post(
+            "/sort",
+            params={"algorithm": "numpy"},
+            content=values.tobytes(),
+            headers={"content-type": "application/octet-stream"},
+        )
+        assert np.frombuffer(response.content, "<i8").tolist() == sorted(values)
+
+
+def test_sort_rejects_unknown_algorithm() -> None:
+    """Validation errors are reported, not raised in a worker."""
+    with TestClient(app) as client:
+        response = client.post("/sort", json={"algorithm": "bogo_sort", "data": [1]})
+        assert response.status_code == 422
+
+
+def test_sort_caps_quadratic_algorithms() -> None:
+    """Large inputs for O(n²) sorts are refused before reaching a worker."""
+    values = np.arange(QUADRATIC_MAX_ELEMENTS + 1, dtype="<i8")[::-1]
+    with TestClient(app) as client:
+        response = client.post(
+            "/sort", json={"algorithm": "bubble_sort", "data": values.tolist()}
+        )
+        assert response.status_code == 413
+        response = client.post(
+            "/sort",
+            params={"algorithm": "selection_sort"},
+            content=values.tobytes(),
+            headers={"content-type": "application/octet-stream"},
+        )
+        assert response.status_code == 413
+        response = client.post(
+            "/sort", json={"algorithm": "merge_sort", "data": values.tolist()}
+        )
+        assert response.json()["data"] == sorted(values.tolist())
+
+
+def test_concurrent_small_sorts_share_batches() -> None:
+    """Fast-engine requests in one window are coalesced; O(n²) ones are not."""
+    with TestClient(app) as client:
+        batcher = app.state.batcher
+        batcher.window_s = 0.5
+
+        def post(i: int) -> list[int]:
+            body = {"algorithm": "quick_sort", "data": [i, 3, -i]}
+            data: list[int] = client.post("/sort", json=body).json()["data"]
+            return data
+
+        with ThreadPoolExecutor(max_workers=16) as threads:
+            results = list(threads.map(post, range(16)))
+        assert results == [sorted([i, 3, -i]) for i in range(16)]
+        assert batcher.batches <= 4
+
+        before = batcher.batches
+        client.post("/sort", json={"algorithm": "bubble_sort", "data": [2, 1]})
+        assert batcher.batches == before
+
+
+def test_trace_streams_ndjson_steps() -> None:
+    """Every line is a step, followed by a summary."""
+    with TestClient(app) as client:
+        response = client.post(
+            "/trace", json={"algorithm": "insertion_sort", "data": [3, 1, 2]}
+        )
+        lines = [json.loads(line) for line in response.text.splitlines()]
+    *steps, summary = lines
+    assert summary == {"done": True, "steps": len(steps)}
+    assert [step["index"] for step in steps] == list(range(len(steps)))
+    assert steps[-1]["array"] == [1, 2, 3]
+
+
+@pytest.mark.parametrize(
+    ("algorithm", "data", "max_steps"),
+    [
+        ("bubble_sort", list(range(1000, 0, -1)), 100),
+        ("quick_sort", antiqsort(quick_sort, 1000), 200),
+        ("insertion_sort", list(range(500, 0, -1)), 2),
+    ],
+)
+def test_trace_streams_at_most_max_steps(
+    algorithm: str, data: list[int], max_steps: int
+) -> None:
+    """Milestone-heavy and mispredicted traces still stream within budget."""
+    with TestClient(app) as client:
+        response = client.post(
+            "/trace",
+            json={"algorithm": algorithm, "data": data, "max_steps": max_steps},
+        )
+        *steps, summary = [json.loads(line) for line in response.text.splitlines()]
+    assert summary == {"done": True, "steps": len(steps)}
+    assert len(steps) <= max_steps
+    assert steps[-1]["array"] == sorted(data)
+    assert "not shown" in steps[-1]["description"]
+
+
+def test_trace_budget_has_a_server_side_cap() -> None:
+    """Omitted budgets get the default; larger ones are rejected."""
+    data = list(range(300, 0, -1))
+    with TestClient(app) as client:
+        response = client.post(
+            "/trace", json={"algorithm": "bubble_sort", "data": data}
+        )
+        *steps, summary = [json.loads(line) for line in response.text.splitlines()]
+        assert summary["done"] and len(steps) <= TRACE_DEFAULT_MAX_STEPS
+        response = client.post(
+            "/trace",
+            json={
+                "algorithm": "bubble_sort",
+                "data": data,
+                "max_steps": TRACE_MAX_STEPS + 1,
+            },
+        )
+        assert response.status_code == 422
@@ -4,21 +4,32 @@ Tests both standard implementations and step-by-step tracking versions.
 Part of the core infrastructure testing for the SWE Mastery Journey.
 """
 
+import array
+import math
+import random
+import subprocess
 import sys
+import tracemalloc
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pytest
 
 from algorithms.sorting import (
+    ALGORITHMS,
+    CountingObserver,
     bubble_sort,
     bubble_sort_with_steps,
+    get_algorithm,
     insertion_sort,
     insertion_sort_with_steps,
     merge_sort,
+    merge_sort_inplace,
     merge_sort_with_steps,
     quick_sort,
+    quick_sort_inplace,
     quick_sort_with_steps,
     selection_sort,
     selection_sort_with_steps,
@@ -59,11 +70,7 @@ class TestSortingAlgorithms:
     ]:
         """Provide all sorting function pairs (standard, with_steps)."""
         return [
-            (bubble_sort, bubble_sort_with_steps, "Bubble Sort"),
-            (insertion_sort, insertion_sort_with_steps, "Insertion Sort"),
-            (selection_sort, selection_sort_with_steps, "Selection Sort"),
-            (quick_sort, quick_sort_with_steps, "Quick Sort"),
-            (merge_sort, merge_sort_with_steps, "Merge Sort"),
+            (info.sort_func, info.steps_func, info.name) for info in ALGORITHMS.values()
         ]
 
     def test_empty_array(
@@ -399,6 +406,154 @@ class TestEdgeCases:
             assert step["description"].strip(), f"Step {i} has empty description"
             assert len(step["description"]) > 5, f"Step {i} description too short"
 
+    def test_insertion_sort_compares_next_to_held_key(self) -> None:
+        """Each traced compare pairs a slot with the key's current hole."""
+
+        class CompareLog(CountingObserver):
+            def __init__(self) -> None:
+                super().__init__()
+                self.pairs: list[tuple[int, int]] = []
+
+            def on_compare(self, i: int, j: int) -> None:
+                self.pairs.append((i, j))
+
+        observer = CompareLog()
+        insertion_sort([4, 3, 2, 1], observer)
+        assert observer.pairs
+        assert all(j == i + 1 for i, j in observer.pairs)
+
+
+class TestAlgorithmRegistry:
+    """Test the central algorithm table and its lazy loading."""
+
+    def test_registry_matches_package_exports(self) -> None:
+        """Every entry resolves to the functions the package exports."""
+        import algorithms.sorting as sorting
+
+        for key, info in ALGORITHMS.items():
+            assert info.key == key
+            assert info.sort_func is getattr(sorting, key)
+            assert info.steps_func is getattr(sorting, f"{key}_with_steps")
+            assert info.inplace_func is getattr(sorting, f"{key}_inplace")
+        with pytest.raises(ValueError):
+            get_algorithm("bogo_sort")
+
+    def test_import_does_not_load_sort_modules(self) -> None:
+        """Reading the table is cheap; a module loads on first use only."""
+        code = (
+            "import sys\n"
+            "from algorithms.sorting import ALGORITHMS\n"
+            "assert 'algorithms.sorting._merge_sort' not in sys.modules\n"
+            "assert ALGORITHMS['merge_sort'].sort_func([2, 1]) == [1, 2]\n"
+            "assert 'algorithms.sorting._quick_sort' not in sys.modules\n"
+        )
+        subprocess.run(
+            [sys.executable, "-c", code], check=True, cwd=project_root, timeout=60
+        )
+
+    def test_sort_module_imports_do_not_shadow_exports(self) -> None:
+        """Importing a sort module first leaves the package's functions bound."""
+        code = (
+            "from algorithms.datasets import measure_presortedness\n"
+            "from algorithms.sorting._quick_sort import quick_sort_inplace\n"
+            "measure_presortedness([3, 1, 2])\n"
+            "from algorithms.sorting import merge_sort, quick_sort\n"
+            "assert merge_sort([3, 1, 2]) == quick_sort([3, 1, 2]) == [1, 2, 3]\n"
+            "from algorithms.sorting import multikey_quick_sort, msd_radix_sort\n"
+            "assert msd_radix_sort(['b', 'a']) == ['a', 'b']\n"
+        )
+        subprocess.run(
+            [sys.executable, "-c", code], check=True, cwd=project_root, timeout=60
+        )
+
+
+# Auxiliary bytes allowed by each documented ``inplace_space`` bound
+AUX_BUDGETS: dict[str, Callable[[int], float]] = {
+    "O(1)": lambda n: 2048,
+    "O(log n)": lambda n: 512 * math.log2(n),
+}
+BUFFERS: dict[str, Callable[[list[int]], Any]] = {
+    "list": list,
+    "array": lambda values: array.array("q", values),
+    "numpy": lambda values: np.array(values, dtype=np.int64),
+}
+
+
+def aux_bytes(sort: Callable[[Any], None], buffer: Any) -> int:
+    """Peak bytes allocated while ``sort`` runs, above the level at its start."""
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        sort(buffer)
+        return tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+
+class TestInPlaceSorts:
+    """The ``*_inplace`` variants sort the caller's buffer without copying it."""
+
+    @pytest.mark.parametrize("kind", BUFFERS)
+    @pytest.mark.parametrize("key", ALGORITHMS)
+    def test_sorts_buffer_in_place(self, key: str, kind: str) -> None:
+        """Lists, array.array and NumPy arrays are sorted where they are."""
+        sort = ALGORITHMS[key].inplace_func
+        for size in (0, 1, 2, 37, 300):
+            values = [random.randint(-50, 50) for _ in range(size)]
+            buffer = BUFFERS[kind](values)
+            sort(buffer)
+            assert list(buffer) == sorted(values)
+
+    @pytest.mark.parametrize("kind", BUFFERS)
+    @pytest.mark.parametrize("key", ALGORITHMS)
+    def test_auxiliary_space_bound(self, key: str, kind: str) -> None:
+        """Extra memory stays within the documented bound, far below a copy."""
+        info = ALGORITHMS[key]
+        size = 4000 if "n log n" in info.time_complexity else 300
+        values = [random.randint(-(10**9), 10**9) for _ in range(size)]
+        buffer = BUFFERS[kind](values)
+
+        used = aux_bytes(info.inplace_func, buffer)
+
+        assert list(buffer) == sorted(values)
+        assert used <= AUX_BUDGETS[info.inplace_space](size) < 8 * size
+
+    def test_merge_sort_inplace_is_stable(self) -> None:
+        """Equal keys keep their order through the swap-only merges."""
+
+        class Item:
+            def __init__(self, key: int, tag: int) -> None:
+                self.key, self.tag = key, tag
+
+            def __lt__(self, other: "Item") -> bool:
+                return self.key < other.key
+
+            def __le__(self, other: "Item") -> bool:
+                return self.key <= other.key
+
+        items = [Item(random.randint(0, 9), tag) for tag in range(500)]
+        shuffled = items.copy()
+        merge_sort_inplace(shuffled)  # type: ignore[arg-type]
+        expected = sorted(items, key=lambda item: item.key)
+        assert [(i.key, i.tag) for i in shuffled] == [(i.key, i.tag) for i in expected]
+
+    def test_traced_run_writes_back_and_rejects_bad_buffers(self) -> None:
+        """Observers see every operation; unsortable buffers fail clearly."""
+        buffer = np.array([5, 3, 9, 1, 3])
+        observer = CountingObserver()
+        quick_sort_inplace(buffer, observer)
+        assert buffer.tolist() == [1, 3, 3, 5, 9]
+        assert observer.swaps > 0
+
+        frozen = np.array([2, 1])
+        frozen.flags.writeable = False
+        with pytest.raises(ValueError):
+            merge_sort_inplace(frozen)
+        with pytest.raises(ValueError):
+            merge_sort_inplace(np.zeros((2, 2), dtype=np.int64))
+        with pytest.raises(TypeError):
+            merge_sort_inplace((2, 1))  # type: ignore[arg-type]
+
 
 if __name__ == "__main__":
     # Run tests with verbose output
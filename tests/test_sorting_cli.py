@@ -0,0 +1,98 @@
+"""
+Tests for bulk integer I/O and the sort command line.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from algorithms.sorting import bulk_io, mmap_sort
+from algorithms.sorting.cli import main, sort_file
+from algorithms.sorting.mmap_sort import sort_file_inplace
+
+runner = CliRunner()
+app = typer.Typer()
+app.command()(main)
+
+
+def test_parse_text_accepts_mixed_separators() -> None:
+    """Whitespace, commas and semicolons all separate values."""
+    assert bulk_io.parse_text(b"5, 3\n-1 2;9\t0").tolist() == [5, 3, -1, 2, 9, 0]
+    assert bulk_io.parse_text(b"  \n").size == 0
+
+
+@pytest.mark.parametrize("raw", [b"1 two 3", b"1.5 2", b"99999999999999999999"])
+def test_parse_text_rejects_bad_tokens(raw: bytes) -> None:
+    """Non-integers and out-of-range values are errors, not silent data."""
+    with pytest.raises(ValueError):
+        bulk_io.parse_text(raw)
+
+
+def test_read_text_blocks_do_not_split_numbers(tmp_path: Path) -> None:
+    """Block boundaries fall between numbers whatever the block size."""
+    values = np.arange(-500, 500) * 12345
+    path = tmp_path / "values.txt"
+    path.write_text(" ".join(map(str, values)))
+    assert (bulk_io.read_text(path, block_bytes=7) == values).all()
+
+
+@pytest.mark.parametrize("algorithm", ["numpy", "merge_sort", "auto"])
+def test_sort_file_text_to_binary(tmp_path: Path, algorithm: str) -> None:
+    """Text input sorts into a raw int64 file, with every phase timed."""
+    source = tmp_path / "in.txt"
+    source.write_text("9\n-4\n7\n7\n0\n")
+    count, timings = sort_file(str(source), str(tmp_path / "out.i64"), algorithm)
+    assert count == 5
+    assert set(timings.phases) == {"parse", "sort", "write"}
+    assert np.fromfile(tmp_path / "out.i64", "<i8").tolist() == [-4, 0, 7, 7, 9]
+
+
+def test_cli_sorts_stdin_to_stdout() -> None:
+    """``-`` reads stdin and writes stdout."""
+    result = runner.invoke(
+        app, ["-", "--algorithm", "quick_sort", "--no-timings"], input="3,1,2"
+    )
+    assert result.exit_code == 0
+    assert result.stdout.split() == ["1", "2", "3"]
+
+
+@pytest.mark.parametrize("block_values", [1, 7, 64, 10_000])
+def test_sort_file_inplace_matches_numpy(tmp_path: Path, block_values: int) -> None:
+    """Small blocks exercise the rotation merges as well as the buffered ones."""
+    values = np.random.default_rng(block_values).integers(-50, 50, 3_001)
+    path = tmp_path / "values.i64"
+    values.astype("<i8").tofile(path)
+    report = sort_file_inplace(path, block_values=block_values, flush="pass")
+    assert (np.fromfile(path, "<i8") == np.sort(values)).all()
+    assert report.values == len(values)
+    assert report.passes == max(0, int(np.ceil(np.log2(len(values) / block_values))))
+
+
+def test_sort_file_inplace_edge_cases(tmp_path: Path) -> None:
+    """Empty files are a no-op; partial int64 values are rejected."""
+    empty = tmp_path / "empty.i64"
+    empty.write_bytes(b"")
+    assert sort_file_inplace(empty).values == 0
+    ragged = tmp_path / "ragged.i64"
+    ragged.write_bytes(b"\0" * 12)
+    with pytest.raises(ValueError):
+        sort_file_inplace(ragged)
+
+
+def test_sort_file_inplace_surfaces_sort_errors(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A failing merge raises its own error, not BufferError from closing the map."""
+
+    def fail(self: mmap_sort._BlockMerger, lo: int, mid: int, hi: int) -> None:
+        view = self.a[lo:hi]  # noqa: F841 - held by the traceback's frame
+        raise RuntimeError("merge failed")
+
+    monkeypatch.setattr(mmap_sort._BlockMerger, "merge", fail)
+    path = tmp_path / "values.i64"
+    np.arange(100, 0, -1).astype("<i8").tofile(path)
+    with pytest.raises(RuntimeError, match="merge failed"):
+        sort_file_inplace(path, block_values=8)
@@ -0,0 +1,65 @@
+"""
+Tests for the string-key sorting engines.
+"""
+
+import pytest
+
+from algorithms.datasets import STRING_DATASETS, make_string_dataset
+from algorithms.profiling.benchmark import run_string_benchmark
+from algorithms.sorting import STRING_ALGORITHMS, msd_radix_sort
+
+ENGINES = list(STRING_ALGORITHMS)
+
+
+@pytest.mark.parametrize("dataset", STRING_DATASETS)
+@pytest.mark.parametrize("key", ENGINES)
+def test_sorts_str_and_bytes_keys(key: str, dataset: str) -> None:
+    """Every dataset sorts as ``sorted`` would, as str and as UTF-8 bytes."""
+    sort = STRING_ALGORITHMS[key].sort_func
+    for size in (0, 1, 2, 16, 17, 500):
+        keys = make_string_dataset(dataset, size, seed=size)
+        assert sort(keys) == sorted(keys)
+        encoded = [k.encode() for k in keys]
+        assert sort(encoded) == sorted(encoded)
+
+
+@pytest.mark.parametrize("key", ENGINES)
+def test_prefixes_empty_keys_and_long_shared_prefixes(key: str) -> None:
+    """Keys ending inside another's prefix sort first; depth is not recursion."""
+    keys = ["", "a", "ab", "abc", "", "ab", "b", "ba", "Z", "é"] * 4
+    # Longer than the recursion limit, differing only at the end
+    keys += ["p" * 5000 + tail for tail in ("b", "a", "", "ab", "a")] * 5
+    sort = STRING_ALGORITHMS[key].sort_func
+    assert sort(keys) == sorted(keys)
+
+
+def test_msd_radix_sort_is_stable() -> None:
+    """Equal keys keep their input order through buckets and cutoffs."""
+    keys = [f"key-{i % 7}" for i in range(200)]  # Distinct objects, equal values
+    result = msd_radix_sort(keys)
+    for value in set(keys):
+        in_order = [k for k in keys if k == value]
+        sorted_run = [k for k in result if k == value]
+        assert all(a is b for a, b in zip(in_order, sorted_run, strict=True))
+
+
+@pytest.mark.parametrize(
+    "key,event", [("msd_radix_sort", "Bucketed"), ("multikey_quick_sort", "Split")]
+)
+def test_traced_variant_records_radix_steps(key: str, event: str) -> None:
+    """The traced variant ends sorted and describes its character passes."""
+    keys = make_string_dataset("URLs", 60, seed=4)
+    steps = STRING_ALGORITHMS[key].steps_func(keys)
+
+    assert steps[0]["array"] == keys
+    assert steps[-1]["array"] == sorted(keys)
+    assert any(step["description"].startswith(event) for step in steps)
+
+
+def test_string_benchmark_compares_engines() -> None:
+    """The string benchmark runs radix engines next to comparison sorts."""
+    results = run_string_benchmark(sizes=[200], distributions=["Shared Prefix"])
+    assert {r.algorithm for r in results} == {*ENGINES, "quick_sort", "merge_sort"}
+    assert all(r.size == 200 and r.time_s > 0 for r in results)
+    with pytest.raises(ValueError):
+        make_string_dataset("Phone Numbers", 10)
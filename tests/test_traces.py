@@ -0,0 +1,316 @@
+"""
+Tests for trace storage and sharing.
+"""
+
+import pickle  # nosec B403 - size comparison only
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from algorithms.datasets import make_dataset
+from algorithms.sorting import (
+    bubble_sort_with_steps,
+    merge_sort_with_steps,
+    quick_sort_with_steps,
+)
+from algorithms.traces import (
+    TraceCache,
+    TraceColumns,
+    TraceWorkerPool,
+    access_heatmap,
+    compare_distances,
+    content_key,
+    displacement,
+    load_trace,
+    phase_work,
+    run_race,
+    trace_nbytes,
+    trace_to_bytes,
+    write_trace,
+)
+
+
+class CountingCompute:
+    """Trace function that counts how often it runs."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.calls = 0
+        self.delay = delay
+
+    def __call__(self, data: list[int]) -> list[dict[str, Any]]:
+        self.calls += 1
+        time.sleep(self.delay)
+        return merge_sort_with_steps(data)
+
+
+def test_identical_requests_share_one_trace() -> None:
+    """Same algorithm and data: one computation, one shared list."""
+    cache = TraceCache()
+    compute = CountingCompute()
+    first = cache.get_or_compute("merge_sort", [3, 1, 2], compute)
+    second = cache.get_or_compute("merge_sort", [3, 1, 2], compute)
+
+    assert first is second
+    assert compute.calls == 1
+    assert cache.stats.hits == 1 and cache.stats.misses == 1
+    assert cache.get_or_compute("merge_sort", [3, 2, 1], compute) is not first
+
+
+def test_get_counts_misses() -> None:
+    """Direct lookups that find nothing are misses, as in get_or_compute."""
+    cache = TraceCache()
+    assert cache.get("missing") is None
+    cache.put("merge_sort", [2, 1], merge_sort_with_steps([2, 1]))
+
+    assert cache.get(content_key("merge_sort", [2, 1])) is not None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_key_depends_on_content_and_params() -> None:
+    """Keys change with data, algorithm and extra parameters."""
+    base = content_key("quick_sort", [1, 2, 3])
+    assert base == content_key("quick_sort", [1, 2, 3])
+    assert base != content_key("quick_sort", [1, 3, 2])
+    assert base != content_key("merge_sort", [1, 2, 3])
+    assert base != content_key("quick_sort", [1, 2, 3], max_steps=10)
+
+
+def test_lru_eviction_respects_budget() -> None:
+    """Oldest traces are evicted once the byte budget is exceeded."""
+    one = merge_sort_with_steps(list(range(200)))
+    cache = TraceCache(budget_bytes=int(trace_nbytes(one) * 2.5))
+    compute = CountingCompute()
+    for start in range(4):
+        cache.get_or_compute("merge_sort", list(range(start, start + 200)), compute)
+
+    assert cache.stats.bytes <= cache.budget_bytes
+    assert cache.stats.evictions == 2
+    assert cache.stats.entries == 2
+
+
+def test_repeated_put_replaces_the_entry() -> None:
+    """Storing a key again replaces its bytes instead of adding to them."""
+    trace = merge_sort_with_steps(list(range(100)))
+    cache = TraceCache(budget_bytes=int(trace_nbytes(trace) * 2.5))
+    for _ in range(4):
+        cache.put("merge_sort", [1, 2], trace)
+
+    assert cache.stats.bytes == trace_nbytes(trace)
+    assert cache.stats.entries == 1 and cache.stats.evictions == 0
+    assert cache.get(content_key("merge_sort", [1, 2])) is trace
+
+
+def test_evicted_traces_reload_from_spill(tmp_path: Path) -> None:
+    """With a spill directory, evicted traces come back without recompute."""
+    cache = TraceCache(budget_bytes=1, spill_dir=tmp_path)
+    compute = CountingCompute()
+    trace = cache.get_or_compute("merge_sort", [5, 4, 3, 2, 1], compute)
+    again = cache.get_or_compute("merge_sort", [5, 4, 3, 2, 1], compute)
+
+    assert again == trace
+    assert compute.calls == 1
+    assert cache.stats.spill_hits == 1
+    cache.clear()
+    assert not list(tmp_path.iterdir())
+
+
+def test_concurrent_requests_compute_once() -> None:
+    """Sessions racing on the same key wait for one computation."""
+    cache = TraceCache()
+    compute = CountingCompute(delay=0.05)
+    results: list[Any] = []
+
+    def request() -> None:
+        results.append(cache.get_or_compute("merge_sort", [2, 1], compute))
+
+    threads = [threading.Thread(target=request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert compute.calls == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_background_job_completes() -> None:
+    """A finished job holds the same trace as a direct call."""
+    pool = TraceWorkerPool(max_workers=2)
+    data = [5, 2, 4, 1, 3]
+    job = pool.submit(bubble_sort_with_steps, data)
+    job.wait(timeout=10)
+
+    assert job.completed
+    assert job.steps == bubble_sort_with_steps(data)
+    pool.shutdown()
+
+
+def test_background_job_can_be_cancelled() -> None:
+    """Cancelling stops a long trace, keeping the prefix for playback."""
+    pool = TraceWorkerPool(max_workers=1)
+    job = pool.submit(bubble_sort_with_steps, list(range(3000, 0, -1)))
+    while len(job.steps) < 100:
+        time.sleep(0.01)
+    job.cancel()
+    job.wait(timeout=10)
+
+    assert job.done and not job.completed
+    assert job.error is not None and "cancelled" in job.error
+    assert len(job.steps) >= 100
+    assert job.steps[0]["array"][0] == 3000
+    pool.shutdown()
+
+
+def test_background_job_limits() -> None:
+    """Time and memory limits stop runaway traces."""
+    pool = TraceWorkerPool(max_workers=2)
+    data = list(range(2000, 0, -1))
+    slow = pool.submit(bubble_sort_with_steps, data, time_limit_s=0.05)
+    large = pool.submit(bubble_sort_with_steps, data, memory_limit_bytes=1 << 20)
+    slow.wait(timeout=10)
+    large.wait(timeout=10)
+
+    assert slow.error is not None and "time limit" in slow.error
+    assert large.error is not None and "memory limit" in large.error
+    assert large.recorder.nbytes <= (1 << 20) + 20_000
+    pool.shutdown()
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_trace_file_round_trip(tmp_path: Path, compress: bool) -> None:
+    """Every step decodes back to the recorded dict, in any order."""
+    steps = quick_sort_with_steps(make_dataset("Random", 60, seed=3))
+    path = write_trace(
+        tmp_path / "quick.swt",
+        steps,
+        snapshot_interval=16,
+        compress=compress,
+        metadata={"algorithm": "quick_sort"},
+    )
+    with load_trace(path) as trace:
+        assert len(trace) == len(steps)
+        assert trace.metadata == {"algorithm": "quick_sort"}
+        assert trace[-1] == steps[-1]
+        assert trace[37] == steps[37]
+        assert trace[5:9] == steps[5:9]
+        assert list(trace) == steps
+
+
+def test_trace_bytes_are_compact() -> None:
+    """Diffs and a description table beat pickled snapshots."""
+    steps = bubble_sort_with_steps(make_dataset("Random", 100, seed=3))
+    encoded = trace_to_bytes(steps)
+    assert len(encoded) < len(pickle.dumps(steps)) / 10
+    assert load_trace(encoded)[-1]["array"] == steps[-1]["array"]
+
+
+def test_load_trace_rejects_other_files() -> None:
+    """Arbitrary bytes are not mistaken for a trace."""
+    with pytest.raises(ValueError):
+        load_trace(b"not a trace at all")
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_load_trace_rejects_damaged_files(compress: bool) -> None:
+    """Truncated or garbled traces raise ValueError, never struct or key errors."""
+    encoded = trace_to_bytes(quick_sort_with_steps([5, 3, 8, 1]), compress=compress)
+    garbled = encoded.replace(b'"sections"', b'"sectionz"')
+    for damaged in (encoded[:10], encoded[:60], encoded[:-16], garbled):
+        with pytest.raises(ValueError):
+            trace = load_trace(damaged)
+            list(trace)
+
+
+def test_race_lanes_finish_sorted_and_align() -> None:
+    """Each lane sorts the shared input; the timeline is per-lane monotonic."""
+    data = make_dataset("Random", 40, seed=5)
+    race = run_race(
+        {"bubble": bubble_sort_with_steps, "merge": merge_sort_with_steps}, data
+    )
+    assert [lane.name for lane in race.lanes] == ["bubble", "merge"]
+    for lane in race.lanes:
+        assert lane.steps[-1]["array"] == sorted(data)
+        assert len(lane.operations) == len(lane.steps)
+
+    timeline = race.timeline(20)
+    assert timeline.shape == (2, 20)
+    assert (timeline[:, 1:] >= timeline[:, :-1]).all()
+    # Merge sort needs fewer operations, so it finishes before the last frame
+    merge_done = timeline[1] == len(race.lanes[1].steps) - 1
+    assert merge_done[-1] and merge_done.argmax() < 19
+
+
+def test_trace_analytics_match_the_steps() -> None:
+    """Vectorized aggregates agree with counting the step dicts directly."""
+    data = make_dataset("Random", 50, seed=8)
+    steps = bubble_sort_with_steps(data)
+    columns = TraceColumns.from_trace(steps)
+    compares = [s for s in steps if s["description"].startswith("Comparing")]
+    swaps = [s for s in steps if s["description"].startswith("Swapped")]
+    # Compares since the previous pass, at every pass
+    per_pass, since = [], 0
+    for step in steps:
+        since += step["description"].startswith("Comparing")
+        if step["description"].startswith("Pass"):
+            per_pass.append(since)
+            since = 0
+    assert columns.kind_counts() == {
+        "start": 1,
+        "finish": 1,
+        "compare": len(compares),
+        "swap": len(swaps),
+        "pass": len(per_pass),
+    }
+
+    heatmap = access_heatmap(columns, step_bins=10, position_bins=7)
+    assert heatmap.totals["reads"].sum() == 2 * len(compares)
+    assert heatmap.totals["swaps"][0] == sum(0 in s["highlights"] for s in swaps)
+    for name, totals in heatmap.totals.items():
+        assert heatmap.timeline[name].shape == (10, 7)
+        assert heatmap.timeline[name].sum() == totals.sum()
+
+    phases = phase_work(columns)
+    assert list(phases.compares) == per_pass
+    assert phases.swaps.sum() == len(swaps)
+    assert phases.writes.sum() == heatmap.totals["writes"].sum()
+    assert compare_distances(columns) == {"1": len(compares)}
+
+    moved = displacement(columns, samples=20)
+    assert moved.mean[-1] == 0 and moved.max[0] > 0
+    assert moved.by_position.shape == (20, 50)
+
+
+def test_trace_analytics_use_recorded_kinds() -> None:
+    """Kinds come from the recorder, not from the wording of descriptions."""
+    steps = quick_sort_with_steps(make_dataset("Random", 60, seed=4))
+    reworded = [{**step, "description": "step"} for step in steps]
+    expected = TraceColumns.from_trace(steps).kind_counts()
+    assert TraceColumns.from_trace(reworded).kind_counts() == expected
+    assert expected["compare"] == sum(s["kind"] == "compare" for s in steps)
+
+
+def test_displacement_of_a_partial_trace() -> None:
+    """Cancelled traces are measured against the sorted input, not the last step."""
+    steps = bubble_sort_with_steps(list(range(40, 0, -1)))
+    full = displacement(TraceColumns.from_trace(steps), samples=10)
+    partial = displacement(TraceColumns.from_trace(steps[: len(steps) // 2]))
+
+    assert partial.mean[0] == full.mean[0] > 0
+    assert partial.mean[-1] > 0 and full.mean[-1] == 0
+
+
+def test_trace_analytics_on_a_trace_file() -> None:
+    """Loaded trace files are analyzed column by column, not step by step."""
+    steps = quick_sort_with_steps(make_dataset("Random", 200, seed=9))
+    columns = TraceColumns.from_trace(load_trace(trace_to_bytes(steps)))
+
+    phases = phase_work(columns)
+    partitions = [s for s in steps if s["description"].startswith("Partition")]
+    assert list(phases.kinds) == ["partition"] * len(partitions)
+    assert [(lo, hi) for lo, hi in zip(phases.lo, phases.hi, strict=True)] == [
+        (min(s["highlights"]), max(s["highlights"])) for s in partitions
+    ]
+    assert sum(compare_distances(columns).values()) == columns.kind_counts()["compare"]
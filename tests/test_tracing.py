@@ -0,0 +1,137 @@
+"""
+Tests for the instrumented-array tracing layer.
+Checks that plain and traced kernels agree and that tracing is stripped
+from the plain fast path.
+"""
+
+from collections.abc import Callable
+from types import CodeType
+from typing import Any
+
+import pytest
+
+from algorithms.datasets import make_dataset
+from algorithms.sorting import (
+    ALGORITHMS,
+    CountingObserver,
+    bubble_sort,
+    bubble_sort_with_steps,
+    insertion_sort,
+    merge_sort,
+    merge_sort_with_steps,
+    quick_sort,
+    quick_sort_with_steps,
+    selection_sort,
+)
+from algorithms.sorting._bubble_sort import _bubble_sort
+from algorithms.sorting._insertion_sort import _insertion_sort
+from algorithms.sorting._merge_sort import _merge_sort
+from algorithms.sorting._quick_sort import _quick_sort
+from algorithms.sorting._selection_sort import _selection_sort
+from algorithms.sorting.tracing import Kernel, StepRecorder
+
+KERNELS = [_bubble_sort, _insertion_sort, _selection_sort, _quick_sort, _merge_sort]
+SORTS = [bubble_sort, insertion_sort, selection_sort, quick_sort, merge_sort]
+
+
+def _all_names(code: CodeType) -> set[str]:
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _all_names(const)
+    return names
+
+
+@pytest.mark.parametrize("kernel", KERNELS, ids=lambda k: k.name)
+def test_plain_variant_has_no_trace_hooks(kernel: Kernel) -> None:
+    """The plain variant must not reference any trace hook."""
+    names = _all_names(kernel.plain.__code__)
+    assert not names & {"compare", "swap", "mark"}
+    assert {"compare", "swap", "mark"} & _all_names(kernel.traced.__code__)
+
+
+@pytest.mark.parametrize("sort_func", SORTS)
+def test_traced_matches_plain(sort_func: Callable[..., list[int]]) -> None:
+    """Attaching an observer must not change the result."""
+    data = [9, 3, 7, 3, 1, 8, 2, 2, 6, 0]
+    counter = CountingObserver()
+    assert sort_func(data, counter) == sort_func(data) == sorted(data)
+    assert counter.reads > 0
+
+
+def test_bubble_sort_early_exit_is_traced() -> None:
+    """Sorted input stops after one pass in the traced variant too."""
+    counter = CountingObserver()
+    bubble_sort(list(range(10)), counter)
+    assert counter.compares == 9
+    assert counter.swaps == 0
+
+
+def test_step_messages_name_the_algorithm() -> None:
+    """Initial step names the algorithm actually running."""
+    steps = bubble_sort_with_steps([2, 1])
+    assert "bubble sort" in steps[0]["description"]
+
+
+def test_merge_steps_show_merges() -> None:
+    """Merge sort records its individual merges."""
+    steps = merge_sort_with_steps([4, 3, 2, 1])
+    merges = [s for s in steps if s["description"].startswith("Merged")]
+    assert len(merges) == 3
+    assert merges[-1]["array"] == [1, 2, 3, 4]
+
+
+def test_recorder_snapshots_are_independent() -> None:
+    """Each step owns its array copy."""
+    recorder = StepRecorder("Quick sort")
+    _quick_sort.run([3, 2, 1], recorder)
+    arrays: list[Any] = [step["array"] for step in recorder.steps]
+    assert arrays[0] == [3, 2, 1]
+    assert arrays[-1] == [1, 2, 3]
+
+
+def test_predicted_steps_match_full_trace() -> None:
+    """Predictions for random input are within 2x of the real length."""
+    data = make_dataset("Random", 200, seed=1)
+    for kernel, steps_func in [
+        (_bubble_sort, bubble_sort_with_steps),
+        (_merge_sort, merge_sort_with_steps),
+    ]:
+        predicted = kernel.predict_steps(len(data))
+        assert predicted is not None
+        assert 0.5 <= len(steps_func(data)) / predicted <= 2
+
+
+def test_max_steps_decimates_long_traces() -> None:
+    """A step budget bounds the trace but keeps milestones and the result."""
+    data = make_dataset("Random", 300, seed=1)
+    full = bubble_sort_with_steps(data)
+    steps = bubble_sort_with_steps(data, max_steps=500)
+    assert len(steps) <= 500
+    assert steps[-1]["array"] == full[-1]["array"] == sorted(data)
+
+    passes = [s["description"] for s in full if s["description"].startswith("Pass")]
+    kept = [s for s in steps if s["description"].startswith("Pass")]
+    assert len(kept) == len(passes)
+    assert "compares" in kept[0]["description"]
+    assert "not shown" in steps[-1]["description"]
+
+
+@pytest.mark.parametrize(
+    "key", ["bubble_sort", "insertion_sort", "selection_sort", "merge_sort"]
+)
+def test_max_steps_bounds_milestone_heavy_traces(key: str) -> None:
+    """Milestones alone can outnumber the budget; they are thinned too."""
+    data = make_dataset("Random", 2000, seed=3)
+    steps = ALGORITHMS[key].steps_func(data, max_steps=100)
+
+    assert len(steps) <= 100
+    assert steps[-1]["array"] == sorted(data)
+    if key == "bubble_sort":
+        assert any(s["description"].startswith("Swapped") for s in steps)
+
+
+def test_max_steps_leaves_short_traces_untouched() -> None:
+    """Traces predicted to fit the budget are recorded in full."""
+    data = [5, 1, 4, 2, 3]
+    assert quick_sort_with_steps(data, max_steps=1000) == quick_sort_with_steps(data)
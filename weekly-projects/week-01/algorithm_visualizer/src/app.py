@@ -4,100 +4,203 @@ Part of the 24-Week SWE Mastery Journey - Week 1, Day 3
 """
 
 import sys
-import time
 from collections.abc import Callable
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
-import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
-from algorithms.sorting.bubble_sort import bubble_sort_with_steps
-from algorithms.sorting.insertion_sort import insertion_sort_with_steps
-from algorithms.sorting.merge_sort import merge_sort_with_steps
-from algorithms.sorting.quick_sort import quick_sort_with_steps
-from algorithms.sorting.selection_sort import selection_sort_with_steps
+from algorithms.datasets import (
+    DATASET_NAMES,
+    STRING_DATASETS,
+    Presortedness,
+    make_dataset,
+    make_string_dataset,
+    measure_presortedness,
+)
+from algorithms.sorting import ALGORITHMS, STRING_ALGORITHMS, AlgorithmInfo
+from algorithms.sorting.bulk_io import parse_text
+from algorithms.traces import (
+    AccessHeatmap,
+    Displacement,
+    Race,
+    TraceColumns,
+    TraceJob,
+    access_heatmap,
+    compare_distances,
+    content_key,
+    displacement,
+    load_trace,
+    phase_work,
+    run_race,
+    shared_cache,
+    shared_pool,
+    trace_to_bytes,
+)
+
+if TYPE_CHECKING:
+    from algorithms.profiling import LineProfile
+    from algorithms.profiling.history import HistoryStore
 
 # Add the algorithms directory to the Python path
 project_root = Path(__file__).parent.parent.parent.parent.parent
 sys.path.append(str(project_root))
 
 
+# Steps packed into one client-side animation; seeking past it re-renders
+ANIMATION_WINDOW = 500
+# Arrays above this size render as a downsampled WebGL line, not bars
+DOWNSAMPLE_THRESHOLD = 2000
+PIXEL_WIDTH = 1200
+LABEL_THRESHOLD = 50
+# Synchronized frames in a race animation
+RACE_FRAMES = 200
+# Larger arrays are shown as input and sorted output without a step trace
+TRACE_SIZE_LIMIT = 2000
+# Arrays whose presortedness measures are kept per session
+PRESORTEDNESS_CACHE_SIZE = 8
+# Key counts offered by the string sorting section
+STRING_SIZES = [10, 20, 30, 50, 100, 200]
+# Input sizes offered by the basic performance test; traced quadratic sorts
+# copy the array per step, so they stay small
+PERF_TEST_SIZES = [10, 50, 100, 200]
+# Input sizes offered by the cache simulator; 10,000 elements outgrow L1
+CACHE_SIM_SIZES = [1_000, 10_000, 20_000]
+ARRAY_SIZES = [5, 10, 15, 20, 30, 50, 100, 1_000, 10_000, 100_000, 1_000_000]
+
+
 class AlgorithmVisualizer:
     """Interactive algorithm visualization using Streamlit and Plotly."""
 
     def __init__(self) -> None:
-        self.algorithms = {
-            "bubble_sort": {
-                "func": bubble_sort_with_steps,
-                "name": "Bubble Sort",
-                "time_complexity": "O(n²)",
-                "space_complexity": "O(1)",
-                "stable": True,
-                "description": "Repeatedly compares adjacent elements and swaps them if they are in the wrong order.",
-            },
-            "insertion_sort": {
-                "func": insertion_sort_with_steps,
-                "name": "Insertion Sort",
-                "time_complexity": "O(n²)",
-                "space_complexity": "O(1)",
-                "stable": True,
-                "description": "Builds the final sorted array one item at a time, inserting each element into its correct position.",
-            },
-            "selection_sort": {
-                "func": selection_sort_with_steps,
-                "name": "Selection Sort",
-                "time_complexity": "O(n²)",
-                "space_complexity": "O(1)",
-                "stable": False,
-                "description": "Finds the minimum element from unsorted part and puts it at the beginning.",
-            },
-            "quick_sort": {
-                "func": quick_sort_with_steps,
-                "name": "Quick Sort",
-                "time_complexity": "O(n log n)",
-                "space_complexity": "O(log n)",
-                "stable": False,
-                "description": "Divides the array into partitions around a pivot and recursively sorts the partitions.",
-            },
-            "merge_sort": {
-                "func": merge_sort_with_steps,
-                "name": "Merge Sort",
-                "time_complexity": "O(n log n)",
-                "space_complexity": "O(n)",
-                "stable": True,
-                "description": "Divides the array into halves, sorts them separately, and then merges them back together.",
-            },
-        }
+        # Sort modules are imported when an algorithm first runs
+        self.algorithms: dict[str, AlgorithmInfo] = ALGORITHMS
 
     def generate_data(
-        self, data_type: str, size: int, custom_input: str | None = None
+        self,
+        data_type: str,
+        size: int,
+        custom_input: str | None = None,
+        seed: int | None = None,
     ) -> list[int]:
         """Generate different types of test data."""
         if data_type == "Custom" and custom_input:
             try:
-                return [int(x.strip()) for x in custom_input.split(",")]
+                values: list[int] = parse_text(custom_input.encode()).tolist()
+                return values
             except ValueError:
                 st.error("Invalid custom input. Using random data instead.")
-                return [int(x) for x in np.random.randint(1, 100, size)]
-
-        if data_type == "Random":
-            return [int(x) for x in np.random.randint(1, 100, size)]
-        elif data_type == "Reverse Sorted":
-            return list(range(size, 0, -1))
-        elif data_type == "Nearly Sorted":
-            data = list(range(1, size + 1))
-            # Introduce a few random swaps
-            for _ in range(max(1, size // 10)):
-                i, j = np.random.choice(size, 2, replace=False)
-                data[i], data[j] = data[j], data[i]
-            return data
-        elif data_type == "Many Duplicates":
-            return [int(x) for x in np.random.randint(1, 10, size)]
-        else:
-            return [int(x) for x in np.random.randint(1, 100, size)]
+                return make_dataset("Random", size, seed)
+
+        if data_type in DATASET_NAMES:
+            return make_dataset(data_type, size, seed)
+        return make_dataset("Random", size, seed)
+
+    def presortedness(self, values: list[int]) -> Presortedness:
+        """Measures of ``values``, cached per session by array identity."""
+        cache: dict[int, tuple[list[int], Presortedness]] = st.session_state.setdefault(
+            "presortedness_cache", {}
+        )
+        entry = cache.get(id(values))
+        # Keeping the array in the entry stops its id from being reused
+        if entry is None or entry[0] is not values:
+            if len(cache) >= PRESORTEDNESS_CACHE_SIZE:
+                cache.pop(next(iter(cache)))
+            entry = cache[id(values)] = (values, measure_presortedness(values))
+        return entry[1]
+
+    def presortedness_caption(self, metrics: Presortedness) -> str:
+        """One-line summary of how sorted an array is."""
+        estimate = "≈" if metrics.sampled else ""
+        bound = "≥" if metrics.sampled else ""
+        return (
+            f"Inversions {estimate}{metrics.inversions:,} "
+            f"({metrics.inversion_ratio:.1%}) · Runs {metrics.runs:,} · "
+            f"LIS {bound}{metrics.lis:,}/{metrics.size:,} · "
+            f"Max displacement {metrics.max_displacement:,} · "
+            f"Distinct {metrics.distinct_ratio:.0%}"
+        )
+
+    def rank_steps(self, steps: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Steps over string keys, with every key drawn as its sorted rank."""
+        if not steps:
+            return steps
+        ranks = {key: rank for rank, key in enumerate(sorted(set(steps[0]["array"])))}
+        return [
+            {**step, "array": [ranks[key] + 1 for key in step["array"]]}
+            for step in steps
+        ]
+
+    def highlight_colors(self, highlights: list[int]) -> list[str]:
+        """Colors for each highlighted index, in highlight order."""
+        if len(highlights) > 1:
+            # Bright red and blue for the first two, orange for the rest
+            return ["#FF4444", "#44AAFF"] + ["#FF8800"] * (len(highlights) - 2)
+        return ["#FF8800"] * len(highlights)
+
+    def bar_colors(self, size: int, highlights: list[int]) -> np.ndarray:
+        """Bar colors for an array of ``size`` with the given highlights."""
+        colors = np.full(size, "#666666", dtype=object)  # Dark gray by default
+        if highlights:
+            # Repeated indices keep the last value, so assign in reverse to
+            # let the earliest highlight win
+            colors[highlights[::-1]] = self.highlight_colors(highlights)[::-1]
+        return colors
+
+    def minmax_envelope(
+        self, values: np.ndarray, width: int = PIXEL_WIDTH
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Downsample to ``width`` buckets, keeping each bucket's min and max.
+
+        Returns x/y for a line that draws one vertical min-max segment per
+        bucket, which preserves spikes that plain decimation would drop.
+        """
+        bucket = max(1, -(-len(values) // width))
+        padded = np.pad(values, (0, (-len(values)) % bucket), mode="edge")
+        blocks = padded.reshape(-1, bucket)
+        x = np.repeat(np.arange(len(blocks)) * bucket, 2)
+        y = np.empty(2 * len(blocks), dtype=values.dtype)
+        y[0::2] = blocks.min(axis=1)
+        y[1::2] = blocks.max(axis=1)
+        return x, y
+
+    def array_traces(self, arr: list[int], highlights: list[int]) -> list[Any]:
+        """Plotly traces for one array state, downsampled when large."""
+        hovertemplate = "Index: %{x}<br>Value: %{y}<extra></extra>"
+        if len(arr) > DOWNSAMPLE_THRESHOLD:
+            values = np.asarray(arr)
+            x, y = self.minmax_envelope(values)
+            marked = np.asarray(highlights, dtype=np.int64)
+            return [
+                go.Scattergl(
+                    x=x,
+                    y=y,
+                    mode="lines",
+                    line={"color": "#666666", "width": 1},
+                    hoverinfo="skip",
+                ),
+                go.Scattergl(
+                    x=marked,
+                    y=values[marked],
+                    mode="markers",
+                    marker={"color": self.highlight_colors(highlights), "size": 9},
+                    hovertemplate=hovertemplate,
+                ),
+            ]
+
+        return [
+            go.Bar(
+                x=np.arange(len(arr)),
+                y=arr,
+                marker_color=self.bar_colors(len(arr), highlights),
+                text=[str(x) for x in arr] if len(arr) <= LABEL_THRESHOLD else None,
+                textposition="outside",
+                hovertemplate=hovertemplate,
+            )
+        ]
 
     def create_visualization(
         self, steps: list[dict], step_idx: int, algorithm_name: str
@@ -111,32 +214,8 @@ class AlgorithmVisualizer:
         highlights: list[int] = step_data.get("highlights", [])
         description: str = step_data.get("description", "")
 
-        # Create colors for bars
-        colors = []
-        for i in range(len(arr)):
-            if i in highlights:
-                if len(highlights) > 1 and i == highlights[0]:
-                    colors.append("#FF4444")  # Bright red for first highlight
-                elif len(highlights) > 1 and i == highlights[1]:
-                    colors.append("#44AAFF")  # Bright blue for second highlight
-                else:
-                    colors.append("#FF8800")  # Orange for other highlights
-            else:
-                colors.append("#666666")  # Dark gray for normal elements
-
-        # Create the bar chart
-        fig = go.Figure(
-            data=[
-                go.Bar(
-                    x=list(range(len(arr))),
-                    y=arr,
-                    marker_color=colors,
-                    text=[str(x) for x in arr],
-                    textposition="outside",
-                    hovertemplate="Index: %{x}<br>Value: %{y}<extra></extra>",
-                )
-            ]
-        )
+        # Bar chart, or a WebGL min/max envelope for large arrays
+        fig = go.Figure(data=self.array_traces(arr, highlights))
 
         fig.update_layout(
             title=f"{algorithm_name} - Step {step_idx + 1}/{len(steps)}",
@@ -155,6 +234,323 @@ class AlgorithmVisualizer:
 
         return fig, description
 
+    def create_animation(
+        self,
+        steps: list[dict],
+        start_idx: int,
+        algorithm_name: str,
+        speed: float,
+        window: int = ANIMATION_WINDOW,
+    ) -> go.Figure:
+        """
+        Pack a window of steps into Plotly frames played by the browser.
+
+        Playback, pause and seeking within the window run client-side, so
+        the server is only contacted when the user leaves the window.
+        """
+        fig, _ = self.create_visualization(steps, start_idx, algorithm_name)
+        end_idx = min(len(steps), start_idx + window)
+
+        frames = []
+        for idx in range(start_idx, end_idx):
+            step_data: dict[str, Any] = steps[idx]
+            arr: list[int] = step_data["array"]
+            frames.append(
+                go.Frame(
+                    name=str(idx),
+                    data=self.array_traces(arr, step_data.get("highlights", [])),
+                    layout=go.Layout(
+                        title_text=(
+                            f"{algorithm_name} - Step {idx + 1}/{len(steps)}: "
+                            f"{step_data.get('description', '')}"
+                        )
+                    ),
+                )
+            )
+        fig.frames = frames
+
+        fig.update_layout(
+            **self.playback_layout(
+                [(str(idx), str(idx + 1)) for idx in range(start_idx, end_idx)],
+                speed,
+                prefix="Step ",
+            ),
+            height=600,
+        )
+        return fig
+
+    def playback_layout(
+        self, frames: list[tuple[str, str]], speed: float, prefix: str
+    ) -> dict[str, Any]:
+        """Play/pause buttons and a seek slider over (frame name, label) pairs."""
+        frame_ms = int(1000 / speed)
+        play_args = {
+            "frame": {"duration": frame_ms, "redraw": True},
+            "transition": {"duration": 0},
+            "fromcurrent": True,
+        }
+        seek_args = {
+            "mode": "immediate",
+            "frame": {"duration": 0, "redraw": True},
+            "transition": {"duration": 0},
+        }
+        return {
+            "updatemenus": [
+                {
+                    "type": "buttons",
+                    "direction": "left",
+                    "x": 0,
+                    "y": -0.15,
+                    "xanchor": "left",
+                    "buttons": [
+                        {"label": "▶", "method": "animate", "args": [None, play_args]},
+                        {
+                            "label": "⏸",
+                            "method": "animate",
+                            "args": [[None], seek_args],
+                        },
+                    ],
+                }
+            ],
+            "sliders": [
+                {
+                    "x": 0.1,
+                    "y": -0.1,
+                    "len": 0.9,
+                    "currentvalue": {"prefix": prefix},
+                    "steps": [
+                        {
+                            "label": label,
+                            "method": "animate",
+                            "args": [[name], seek_args],
+                        }
+                        for name, label in frames
+                    ],
+                }
+            ],
+        }
+
+    def create_race(
+        self, race: Race, axis: str, speed: float, frames: int = RACE_FRAMES
+    ) -> go.Figure:
+        """
+        Synchronized subplots, one per lane, played on a common axis.
+
+        Each frame is an evenly spaced point of total operations or elapsed
+        time; every lane shows the step it had reached by then.
+        """
+        from plotly.subplots import make_subplots
+
+        timeline = race.timeline(frames, axis)
+        fig = make_subplots(
+            rows=len(race.lanes),
+            cols=1,
+            shared_xaxes=True,
+            vertical_spacing=0.04,
+            subplot_titles=[lane.name for lane in race.lanes],
+        )
+
+        def lane_traces(frame: int) -> list[Any]:
+            traces = []
+            for lane, step_idx in zip(race.lanes, timeline[:, frame], strict=True):
+                step = lane.steps[int(step_idx)]
+                traces.extend(self.array_traces(step["array"], step["highlights"]))
+            return traces
+
+        first = lane_traces(0)
+        per_lane = len(first) // len(race.lanes)
+        for i, trace in enumerate(first):
+            fig.add_trace(trace, row=i // per_lane + 1, col=1)
+
+        unit = "ops" if axis == "operations" else "s"
+        ends = [
+            lane.total_operations if axis == "operations" else lane.total_time
+            for lane in race.lanes
+        ]
+        points = np.linspace(0.0, max(ends, default=0.0), frames)
+        labels = [
+            f"{point:,.0f} {unit}" if axis == "operations" else f"{point:.3f} {unit}"
+            for point in points
+        ]
+        fig.frames = [
+            go.Frame(name=str(f), data=lane_traces(f), traces=list(range(len(first))))
+            for f in range(frames)
+        ]
+        fig.update_layout(
+            **self.playback_layout(
+                [(str(f), label) for f, label in enumerate(labels)],
+                speed,
+                prefix=f"{axis.capitalize()}: ",
+            ),
+            height=220 * len(race.lanes) + 100,
+            showlegend=False,
+        )
+        return fig
+
+    def create_line_heatmap(self, profile: "LineProfile") -> go.Figure:
+        """Heatmap of time share per source line of a profiled algorithm."""
+        rows = profile.as_rows()
+        labels = [f"{row['Line']:>4}  {row['Source']}" for row in rows]
+        fig = go.Figure(
+            data=[
+                go.Heatmap(
+                    z=[[row["Time %"]] for row in rows],
+                    y=labels,
+                    x=["Time %"],
+                    customdata=[[[row["Hits"], row["Time (ms)"]]] for row in rows],
+                    colorscale="YlOrRd",
+                    hovertemplate=(
+                        "%{y}<br>Hits: %{customdata[0]}"
+                        "<br>Time: %{customdata[1]:.3f} ms"
+                        "<br>Share: %{z:.1f}%<extra></extra>"
+                    ),
+                )
+            ]
+        )
+        fig.update_layout(
+            title=f"Line heatmap - {profile.name}",
+            height=max(300, 18 * len(rows)),
+            yaxis={"autorange": "reversed", "tickfont": {"family": "monospace"}},
+            margin={"l": 20, "r": 20},
+        )
+        return fig
+
+    def create_access_heatmap(self, heatmap: AccessHeatmap, access: str) -> go.Figure:
+        """Accesses per position: totals on top, over the trace below."""
+        from plotly.subplots import make_subplots
+
+        fig = make_subplots(
+            rows=2,
+            cols=1,
+            shared_xaxes=True,
+            row_heights=[0.25, 0.75],
+            vertical_spacing=0.03,
+        )
+        totals = heatmap.totals[access]
+        fig.add_trace(
+            go.Bar(x=np.arange(len(totals)), y=totals, marker_color="#4ECDC4"),
+            row=1,
+            col=1,
+        )
+        fig.add_trace(
+            go.Heatmap(
+                z=heatmap.timeline[access],
+                x=heatmap.position_edges[:-1],
+                y=heatmap.step_edges[:-1],
+                colorscale="YlOrRd",
+                hovertemplate=(
+                    "Positions from %{x}<br>Steps from %{y}"
+                    f"<br>{access.title()}: %{{z}}<extra></extra>"
+                ),
+            ),
+            row=2,
+            col=1,
+        )
+        fig.update_layout(height=520, showlegend=False, margin={"l": 20, "r": 20})
+        fig.update_xaxes(title_text="Position", row=2, col=1)
+        fig.update_yaxes(title_text="Total", row=1, col=1)
+        fig.update_yaxes(title_text="Step", autorange="reversed", row=2, col=1)
+        return fig
+
+    def create_displacement_chart(self, result: Displacement) -> go.Figure:
+        """Mean and max distance from final positions, and where it sits."""
+        from plotly.subplots import make_subplots
+
+        fig = make_subplots(
+            rows=1,
+            cols=2,
+            column_widths=[0.4, 0.6],
+            subplot_titles=["Distance from final position", "Mean by position"],
+        )
+        for values, name in [(result.mean, "Mean"), (result.max, "Max")]:
+            fig.add_trace(
+                go.Scatter(x=result.steps, y=values, mode="lines", name=name),
+                row=1,
+                col=1,
+            )
+        fig.add_trace(
+            go.Heatmap(
+                z=result.by_position,
+                x=result.position_edges[:-1],
+                y=result.steps,
+                colorscale="Viridis",
+                showscale=False,
+                hovertemplate=(
+                    "Positions from %{x}<br>Step %{y}"
+                    "<br>Mean distance: %{z:.1f}<extra></extra>"
+                ),
+            ),
+            row=1,
+            col=2,
+        )
+        fig.update_layout(height=400, margin={"l": 20, "r": 20})
+        fig.update_xaxes(title_text="Step", row=1, col=1)
+        fig.update_xaxes(title_text="Position", row=1, col=2)
+        fig.update_yaxes(title_text="Step", autorange="reversed", row=1, col=2)
+        return fig
+
+
+@st.fragment(run_every=0.5)
+def trace_job_status() -> None:
+    """Poll the session's background trace job without rerunning the page."""
+    job: TraceJob | None = st.session_state.get("trace_job")
+    if job is None:
+        return
+
+    if not job.done:
+        predicted = job.recorder.expected_steps
+        if job.recorder.decimate:
+            progress = f" (decimating ~{predicted:,} predicted steps)"
+        elif predicted:
+            progress = f" of ~{predicted:,} predicted"
+        else:
+            progress = ""
+        st.caption(
+            f"⏳ Generating steps... {len(job.steps):,}{progress} so far "
+            f"({job.elapsed:.1f}s). Rerun the page to play the prefix produced so far."
+        )
+        if st.button("✖️ Cancel", key="cancel_trace_job"):
+            job.cancel()
+        return
+
+    del st.session_state.trace_job
+    if job.completed:
+        shared_cache().put(
+            st.session_state.trace_job_key,
+            job.data,
+            job.steps,
+            max_steps=st.session_state.trace_job_max_steps,
+        )
+        st.session_state.trace_message = (
+            "success",
+            f"Visualization ready! {len(job.steps):,} steps in {job.elapsed:.1f}s",
+        )
+    else:
+        st.session_state.trace_message = (
+            "warning",
+            f"{job.error}. {len(job.steps):,} steps are available for playback.",
+        )
+    # Full rerun so the step slider picks up the final trace length
+    st.rerun()
+
+
+def record_history(write: Callable[["HistoryStore"], int]) -> None:
+    """Save results to the benchmark history and say where they went."""
+    from sqlalchemy.exc import SQLAlchemyError
+
+    from algorithms.profiling.history import HistoryStore
+
+    try:
+        store = HistoryStore()
+        run_id = write(store)
+        store.close()
+    except (OSError, SQLAlchemyError) as exc:
+        st.warning(f"Results not saved to the benchmark history: {exc}")
+        return
+    st.caption(
+        f"Saved as run {run_id} in {store.path}; see the Performance Trends page."
+    )
+
 
 def main() -> None:
     """Main Streamlit application."""
@@ -217,20 +613,21 @@ def main() -> None:
         algorithm_key = st.selectbox(
             "Choose Algorithm",
             list(visualizer.algorithms.keys()),
-            format_func=lambda x: str(visualizer.algorithms[x]["name"]),
+            format_func=lambda x: visualizer.algorithms[x].name,
         )
 
-        algorithm_info: dict[str, Any] = visualizer.algorithms[algorithm_key]
+        algorithm_info = visualizer.algorithms[algorithm_key]
 
         # Display algorithm information
         st.markdown(
             f"""
         <div class="algorithm-info">
-        <h4>{algorithm_info['name']}</h4>
-        <p><strong>Time Complexity:</strong> {algorithm_info['time_complexity']}</p>
-        <p><strong>Space Complexity:</strong> {algorithm_info['space_complexity']}</p>
-        <p><strong>Stable:</strong> {'Yes' if algorithm_info['stable'] else 'No'}</p>
-        <p><strong>Description:</strong> {algorithm_info['description']}</p>
+        <h4>{algorithm_info.name}</h4>
+        <p><strong>Time Complexity:</strong> {algorithm_info.time_complexity}</p>
+        <p><strong>Space Complexity:</strong> {algorithm_info.space_complexity}</p>
+        <p><strong>Stable:</strong> {'Yes' if algorithm_info.stable else 'No'}</p>
+        <p><strong>In Place:</strong> {'Yes' if algorithm_info.in_place else 'No'}</p>
+        <p><strong>Description:</strong> {algorithm_info.description}</p>
         </div>
         """,
             unsafe_allow_html=True,
@@ -243,11 +640,11 @@ def main() -> None:
 
         data_type = st.selectbox(
             "Data Type",
-            ["Random", "Reverse Sorted", "Nearly Sorted", "Many Duplicates", "Custom"],
+            [*DATASET_NAMES, "Custom"],
         )
 
         if data_type != "Custom":
-            array_size = st.slider("Array Size", 5, 50, 15)
+            array_size = st.select_slider("Array Size", options=ARRAY_SIZES, value=15)
             custom_input = ""
         else:
             custom_input = st.text_area(
@@ -255,12 +652,83 @@ def main() -> None:
             )
             array_size = len(custom_input.split(",")) if custom_input else 10
 
+        seed = st.number_input(
+            "Seed (optional)",
+            min_value=0,
+            value=None,
+            step=1,
+            help="Fix the seed to regenerate the same data",
+        )
+
+        st.subheader("⏱️ Trace Limits")
+        time_limit_s = st.number_input("Time limit (seconds)", 1.0, 600.0, 10.0)
+        memory_limit_mb = st.number_input("Memory limit (MB)", 16, 8192, 256)
+        max_steps = st.number_input(
+            "Max steps",
+            100,
+            1_000_000,
+            5_000,
+            step=500,
+            help="Longer traces keep swaps (sampled) and milestones only",
+        )
+
         # Generate data button
         if st.button("🎲 Generate New Data", type="primary", use_container_width=True):
             st.session_state.pop("visualization_data", None)
             st.session_state.pop("steps", None)
             st.session_state.pop("current_step", None)
 
+        with st.expander("🗄️ Trace Cache"):
+            cache = shared_cache()
+            stats = cache.stats
+            st.write(
+                f"{stats.entries} traces, {stats.bytes / 2**20:.1f} of "
+                f"{cache.budget_bytes / 2**20:.0f} MB"
+            )
+            st.write(
+                f"Hits: {stats.hits} · Disk hits: {stats.spill_hits} · "
+                f"Misses: {stats.misses} · Evictions: {stats.evictions}"
+            )
+
+        with st.expander("💾 Save / Load Trace"):
+            steps = st.session_state.get("steps")
+            if steps and "trace_job" not in st.session_state:
+                if st.button("Prepare export"):
+                    st.session_state.trace_export = trace_to_bytes(
+                        steps,
+                        metadata={"algorithm": st.session_state.algorithm_name},
+                    )
+                if "trace_export" in st.session_state:
+                    st.download_button(
+                        "⬇️ Download trace",
+                        st.session_state.trace_export,
+                        file_name="trace.swt",
+                        mime="application/octet-stream",
+                    )
+
+            uploaded = st.file_uploader("Load a trace file", type=["swt"])
+            if uploaded is not None and (
+                st.session_state.get("trace_upload_id") != uploaded.file_id
+            ):
+                try:
+                    trace = load_trace(uploaded.getvalue())
+                except ValueError as e:
+                    st.error(f"Could not read trace: {e}")
+                else:
+                    st.session_state.trace_upload_id = uploaded.file_id
+                    job = st.session_state.pop("trace_job", None)
+                    if job is not None:
+                        job.cancel()
+                    st.session_state.pop("trace_message", None)
+                    # Decoded lazily as the slider moves
+                    st.session_state.steps = trace
+                    st.session_state.current_step = 0
+                    st.session_state.auto_play = False
+                    st.session_state.algorithm_name = trace.metadata.get(
+                        "algorithm", "Loaded trace"
+                    )
+                    st.success(f"Loaded {len(trace):,} steps")
+
     # Main content area
     col1, col2 = st.columns([2, 1])
 
@@ -270,27 +738,78 @@ def main() -> None:
         # Generate or retrieve data
         if "visualization_data" not in st.session_state:
             st.session_state.visualization_data = visualizer.generate_data(
-                data_type, array_size, custom_input
+                data_type, array_size, custom_input, seed
             )
 
         # Display current array
         with col2:
             st.subheader("📋 Current Array")
-            st.code(str(st.session_state.visualization_data))
+            data = st.session_state.visualization_data
+            if len(data) > 100:
+                preview = ", ".join(str(x) for x in data[:20])
+                st.code(f"[{preview}, ..., {data[-1]}]  ({len(data):,} elements)")
+            else:
+                st.code(str(data))
+            st.caption(visualizer.presortedness_caption(visualizer.presortedness(data)))
 
             if st.button(
                 "▶️ Start Visualization", type="primary", use_container_width=True
             ):
-                with st.spinner("Generating visualization steps..."):
-                    try:
-                        st.session_state.steps = algorithm_info["func"](
-                            st.session_state.visualization_data.copy()
-                        )
-                        st.session_state.current_step = 0
-                        st.session_state.algorithm_name = algorithm_info["name"]
-                        st.success("Visualization ready!")
-                    except Exception as e:
-                        st.error(f"Error generating steps: {str(e)}")
+                st.session_state.pop("trace_message", None)
+                st.session_state.pop("trace_export", None)
+                cached = shared_cache().get(
+                    content_key(algorithm_key, data, max_steps=max_steps)
+                )
+                if len(data) > TRACE_SIZE_LIMIT:
+                    st.info(
+                        f"Step tracing is limited to {TRACE_SIZE_LIMIT:,} "
+                        "elements; showing input and sorted output."
+                    )
+                    # Not the chosen algorithm: quadratic sorts of up to 10^6
+                    # elements would hold the script thread for hours
+                    output = np.sort(np.asarray(data, dtype=np.int64)).tolist()
+                    st.session_state.steps = [
+                        {
+                            "array": data,
+                            "highlights": [],
+                            "description": "Input array",
+                            "kind": "start",
+                        },
+                        {
+                            "array": output,
+                            "highlights": [],
+                            "description": "Sorted array",
+                            "kind": "finish",
+                        },
+                    ]
+                elif cached is not None:
+                    # Shared across sessions; the session keeps a reference
+                    st.session_state.steps = cached
+                else:
+                    previous_job = st.session_state.get("trace_job")
+                    if previous_job is not None:
+                        previous_job.cancel()
+                    job = shared_pool().submit(
+                        algorithm_info.steps_func,
+                        data,
+                        time_limit_s=time_limit_s,
+                        memory_limit_bytes=int(memory_limit_mb * 2**20),
+                        max_steps=max_steps,
+                    )
+                    st.session_state.trace_job = job
+                    st.session_state.trace_job_key = algorithm_key
+                    st.session_state.trace_job_max_steps = max_steps
+                    # Live prefix: playback can start before the job finishes
+                    st.session_state.steps = job.steps
+                st.session_state.current_step = 0
+                st.session_state.auto_play = False
+                st.session_state.algorithm_name = algorithm_info.name
+
+            if "trace_job" in st.session_state:
+                trace_job_status()
+            elif "trace_message" in st.session_state:
+                level, message = st.session_state.trace_message
+                getattr(st, level)(message)
 
         # Visualization controls and display
         if "steps" in st.session_state and st.session_state.steps:
@@ -318,14 +837,15 @@ def main() -> None:
                         len(st.session_state.steps) - 1, current_step + 1
                     )
 
-            # Step slider
-            st.session_state.current_step = st.slider(
-                "Step",
-                0,
-                len(st.session_state.steps) - 1,
-                st.session_state.current_step,
-                help=f"Current step: {st.session_state.current_step + 1} of {len(st.session_state.steps)}",
-            )
+            # Step slider (a running job may only have its first step so far)
+            if len(st.session_state.steps) > 1:
+                st.session_state.current_step = st.slider(
+                    "Step",
+                    0,
+                    len(st.session_state.steps) - 1,
+                    st.session_state.current_step,
+                    help=f"Current step: {st.session_state.current_step + 1} of {len(st.session_state.steps)}",
+                )
 
             # Speed control
             speed = st.select_slider(
@@ -335,76 +855,312 @@ def main() -> None:
                 format_func=lambda x: f"{x}x",
             )
 
-            # Create and display visualization
-            fig, description = visualizer.create_visualization(
-                st.session_state.steps,
-                st.session_state.current_step,
-                st.session_state.algorithm_name,
-            )
+            if st.session_state.get("auto_play", False):
+                # The browser plays the frames; no server round trip per step
+                st.plotly_chart(
+                    visualizer.create_animation(
+                        st.session_state.steps,
+                        st.session_state.current_step,
+                        st.session_state.algorithm_name,
+                        speed,
+                    ),
+                    use_container_width=True,
+                )
+                st.caption(
+                    "Use ▶/⏸ and the slider under the chart to play and seek. "
+                    "Move the Step slider to start playback from another step."
+                )
+            else:
+                # Create and display visualization
+                fig, description = visualizer.create_visualization(
+                    st.session_state.steps,
+                    st.session_state.current_step,
+                    st.session_state.algorithm_name,
+                )
 
-            st.plotly_chart(fig, use_container_width=True)
-
-            # Display step description
-            if description:
-                st.markdown(
-                    f"""
-                <div class="step-description">
-                <strong>Step {st.session_state.current_step + 1}:</strong> {description}
-                </div>
-                """,
-                    unsafe_allow_html=True,
+                st.plotly_chart(fig, use_container_width=True)
+
+                # Display step description
+                if description:
+                    st.markdown(
+                        f"""
+                    <div class="step-description">
+                    <strong>Step {st.session_state.current_step + 1}:</strong> {description}
+                    </div>
+                    """,
+                        unsafe_allow_html=True,
+                    )
+                step_array = st.session_state.steps[st.session_state.current_step][
+                    "array"
+                ]
+                st.caption(
+                    visualizer.presortedness_caption(
+                        visualizer.presortedness(step_array)
+                    )
                 )
 
-            # Auto-play functionality
-            if st.session_state.get("auto_play", False):
-                time.sleep(1.0 / speed)
-                if st.session_state.current_step < len(st.session_state.steps) - 1:
-                    st.session_state.current_step += 1
-                    st.rerun()
+    # Trace analytics: aggregates over every step at once
+    steps = st.session_state.get("steps")
+    if steps and len(steps) > 2 and "trace_job" not in st.session_state:
+        st.header("🔬 Trace Analytics")
+        st.write(
+            "Where and when the algorithm touched the array, over the whole "
+            "trace rather than one step at a time."
+        )
+        # Keyed on the trace object: a new run or a loaded file recomputes
+        trace_id = (id(steps), len(steps))
+        analytics = st.session_state.get("trace_analytics")
+        if st.button("🔬 Analyze Trace") or (
+            analytics is not None and analytics[0] != trace_id
+        ):
+            columns = TraceColumns.from_trace(steps)
+            analytics = (
+                trace_id,
+                columns.kind_counts(),
+                access_heatmap(columns),
+                displacement(columns),
+                phase_work(columns),
+                compare_distances(columns),
+            )
+            st.session_state.trace_analytics = analytics
+
+        if analytics is not None:
+            import pandas as pd
+
+            _, kinds, heatmap, moved, phases, distances = analytics
+            st.caption(" · ".join(f"{count:,} {kind}" for kind, count in kinds.items()))
+            heat_tab, moved_tab, phase_tab, distance_tab = st.tabs(
+                ["Access Heatmap", "Displacement", "Work per Phase", "Compare Distance"]
+            )
+            with heat_tab:
+                access = st.radio(
+                    "Access", list(heatmap.totals), horizontal=True, key="heat_access"
+                )
+                st.plotly_chart(
+                    visualizer.create_access_heatmap(heatmap, access),
+                    use_container_width=True,
+                )
+            with moved_tab:
+                st.plotly_chart(
+                    visualizer.create_displacement_chart(moved),
+                    use_container_width=True,
+                )
+            with phase_tab:
+                if len(phases.steps):
+                    phase_df = pd.DataFrame(phases.as_rows())
+                    st.bar_chart(
+                        phase_df.set_index("Phase")[["Compares", "Swaps", "Writes"]]
+                    )
+                    st.dataframe(phase_df, hide_index=True)
                 else:
-                    st.session_state.auto_play = False
+                    st.info("This trace has no milestone events.")
+            with distance_tab:
+                if distances:
+                    st.plotly_chart(
+                        go.Figure(
+                            go.Bar(x=list(distances), y=list(distances.values())),
+                            layout={
+                                "xaxis_title": "Positions apart",
+                                "yaxis_title": "Compares",
+                            },
+                        ),
+                        use_container_width=True,
+                    )
+                else:
+                    st.info("This trace records no compares.")
+
+    # Race mode: several algorithms on the same data, side by side
+    st.header("🏁 Race Mode")
+    st.write(
+        "Run several algorithms on the current array in parallel worker "
+        "processes and play them in lockstep."
+    )
+    race_cols = st.columns([3, 1])
+    with race_cols[0]:
+        racers = st.multiselect(
+            "Algorithms",
+            options=list(visualizer.algorithms.keys()),
+            default=list(visualizer.algorithms.keys()),
+            format_func=lambda x: visualizer.algorithms[x].name,
+        )
+    with race_cols[1]:
+        race_axis = st.radio(
+            "Align on",
+            ["operations", "time"],
+            format_func=str.capitalize,
+            help="Operations are compares plus array writes",
+        )
+
+    race_data = st.session_state.visualization_data
+    if len(race_data) > TRACE_SIZE_LIMIT:
+        st.info(f"Races are limited to {TRACE_SIZE_LIMIT:,} elements.")
+    elif st.button("🏁 Start Race", disabled=not racers):
+        with st.spinner(f"Racing {len(racers)} algorithms..."):
+            st.session_state.race = run_race(
+                {
+                    info.name: info.steps_func
+                    for info in (visualizer.algorithms[key] for key in racers)
+                },
+                race_data,
+                max_steps=max_steps,
+            )
+
+    race: Race | None = st.session_state.get("race")
+    if race is not None:
+        import pandas as pd
+
+        st.plotly_chart(
+            visualizer.create_race(race, race_axis, speed=5.0),
+            use_container_width=True,
+        )
+        st.table(
+            pd.DataFrame(
+                [
+                    {
+                        "Algorithm": lane.name,
+                        "Steps": len(lane.steps),
+                        "Operations": f"{lane.total_operations:,}",
+                        "Trace Time (s)": f"{lane.total_time:.4f}",
+                    }
+                    for lane in race.lanes
+                ]
+            )
+        )
+        st.caption(
+            f"Generated in {race.wall_time:.2f}s wall time across worker processes"
+        )
+
+    # String keys section
+    st.header("🔤 String Keys")
+    st.write(
+        "Radix engines read a prefix shared by many keys once per key, not "
+        "once per comparison. Bar heights are each key's rank in sorted order."
+    )
+    string_cols = st.columns(3)
+    with string_cols[0]:
+        string_key = st.selectbox(
+            "String Algorithm",
+            list(STRING_ALGORITHMS),
+            format_func=lambda key: STRING_ALGORITHMS[key].name,
+        )
+    with string_cols[1]:
+        string_dataset = st.selectbox("Keys", list(STRING_DATASETS))
+    with string_cols[2]:
+        string_size = st.select_slider("Key Count", options=STRING_SIZES, value=30)
+
+    if st.button("🔤 Sort Strings"):
+        string_info = STRING_ALGORITHMS[string_key]
+        keys = make_string_dataset(string_dataset, string_size, seed)
+        string_steps = string_info.steps_func(keys, max_steps=max_steps)
+        st.session_state.string_sort = (
+            string_info.name,
+            keys,
+            visualizer.rank_steps(string_steps),
+        )
+
+    if "string_sort" in st.session_state:
+        import pandas as pd
+
+        string_name, keys, string_steps = st.session_state.string_sort
+        st.plotly_chart(
+            visualizer.create_animation(string_steps, 0, string_name, speed=5.0),
+            use_container_width=True,
+        )
+        st.dataframe(
+            pd.DataFrame({"Input": keys, "Sorted": sorted(keys)}), hide_index=True
+        )
 
     # Performance Analysis Section
     st.header("📊 Performance Analysis")
     st.write("Compare algorithm performance with different input sizes and types.")
 
+    perf_size = st.select_slider(
+        "Test Input Size", options=PERF_TEST_SIZES, value=PERF_TEST_SIZES[1]
+    )
+    # Custom input has no generator; benchmark random data of the same size
+    perf_distribution = data_type if data_type in DATASET_NAMES else "Random"
     if st.button("🏃‍♂️ Run Basic Performance Test", type="secondary"):
         st.subheader("Algorithm Comparison")
 
-        # Simple performance comparison
-        test_data = [64, 34, 25, 12, 22, 11, 90, 45, 78, 23]
+        import pandas as pd
 
-        results = []
-        algo_info: dict[str, Any]
-        for _, algo_info in visualizer.algorithms.items():
-            try:
-                start_time = time.perf_counter()
-                func = cast(
-                    Callable[[list[int]], list[dict[str, Any]]], algo_info["func"]
-                )
-                steps = func(test_data.copy())
-                execution_time = time.perf_counter() - start_time
+        from algorithms.profiling.benchmark import run_benchmark
 
-                results.append(
-                    {
-                        "Algorithm": algo_info["name"],
-                        "Steps": len(steps),
-                        "Time (seconds)": f"{execution_time:.6f}",
-                        "Complexity": algo_info["time_complexity"],
-                    }
-                )
-            except Exception:
-                results.append(
-                    {
-                        "Algorithm": algo_info["name"],
-                        "Steps": "Error",
-                        "Time (seconds)": "Error",
-                        "Complexity": algo_info["time_complexity"],
-                    }
-                )
+        results = run_benchmark(
+            sizes=[perf_size],
+            distributions=[perf_distribution],
+            variants=("plain", "traced"),
+            memory=True,
+            # Without a fixed seed, benchmark the CLI's default inputs
+            seed=0 if seed is None else seed,
+        )
+        df = pd.DataFrame(
+            {
+                **r.as_row(),
+                "Algorithm": visualizer.algorithms[r.algorithm].name,
+                "Complexity": visualizer.algorithms[r.algorithm].time_complexity,
+            }
+            for r in results
+        )
+        st.dataframe(df, hide_index=True)
+        record_history(lambda store: store.record(results, source="app"))
+
+    st.subheader("🧠 Cache Behavior")
+    st.write(
+        "Replays every element access of a traced run through a simulated "
+        "L1/L2/L3 cache: the same Big-O can cost very different memory time."
+    )
+    cache_size = st.select_slider(
+        "Simulated Input Size", options=CACHE_SIM_SIZES, value=CACHE_SIM_SIZES[1]
+    )
+    if st.button("🧠 Simulate Caches", type="secondary"):
+        import pandas as pd
+
+        from algorithms.profiling.cache_sim import run_cache_benchmark
 
-        df = pd.DataFrame(results)
-        st.table(df)
+        with st.spinner("Replaying accesses..."):
+            reports = run_cache_benchmark(
+                sizes=[cache_size],
+                distributions=[perf_distribution],
+                seed=0 if seed is None else seed,
+            )
+        cache_df = pd.DataFrame(
+            {
+                **r.as_row(),
+                "Algorithm": visualizer.algorithms[r.algorithm].name,
+                "Complexity": visualizer.algorithms[r.algorithm].time_complexity,
+            }
+            for r in reports
+        )
+        st.dataframe(cache_df, hide_index=True)
+        st.bar_chart(cache_df.set_index("Algorithm")[["Cycles"]])
+
+    # Hot-path profiling section
+    st.header("🔥 Hot-Path Profiler")
+    st.write(
+        f"Per-line execution counts and time for {algorithm_info.name} "
+        "using sys.monitoring."
+    )
+
+    profile_size = st.select_slider(
+        "Profile Input Size", options=[100, 500, 1000, 2000, 5000], value=1000
+    )
+    if st.button("🔬 Profile Algorithm", type="secondary"):
+        profile_data = visualizer.generate_data(data_type, profile_size, seed=seed)
+        import pandas as pd
+
+        from algorithms.profiling import profile_lines
+
+        _, profile = profile_lines(algorithm_info.sort_func, profile_data)
+        record_history(
+            lambda store: store.record_profile(
+                profile, algorithm_key, profile_size, data_type
+            )
+        )
+        st.plotly_chart(
+            visualizer.create_line_heatmap(profile), use_container_width=True
+        )
+        st.dataframe(pd.DataFrame(profile.as_rows()), hide_index=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,119 @@
+"""
+Performance Trends - benchmark history across runs and commits
+Part of the 24-Week SWE Mastery Journey - Week 1, Day 3
+
+Charts the results the visualizer and ``python -m algorithms.profiling.benchmark
+--record`` store in the benchmark history database.
+"""
+
+from typing import Any
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from algorithms.profiling.history import REGRESSION_THRESHOLD, HistoryStore
+
+
+def pick(label: str, options: list[Any]) -> Any:
+    """Sidebar filter over ``options``; ``None`` means all of them."""
+    choice = st.sidebar.selectbox(label, ["All", *options])
+    return None if choice == "All" else choice
+
+
+def series_labels(df: pd.DataFrame) -> "pd.Series[str]":
+    """One label per configuration, e.g. "quick_sort / plain / 100 / Random"."""
+    columns = ["Algorithm", "Engine", "Size", "Distribution"]
+    labels: pd.Series[str] = df[columns].astype(str).agg(" / ".join, axis=1)
+    return labels
+
+
+def main() -> None:
+    """Performance Trends page."""
+    st.set_page_config(page_title="Performance Trends", page_icon="📈", layout="wide")
+    st.title("📈 Performance Trends")
+
+    store = HistoryStore()
+    facets = store.facets()
+    if not facets["algorithm"]:
+        st.info(
+            f"No results in {store.path} yet. Run the basic performance test on "
+            "the main page, or `python -m algorithms.profiling.benchmark --record`."
+        )
+        return
+
+    st.sidebar.header("🔎 Filters")
+    filters = {
+        "algorithm": pick("Algorithm", facets["algorithm"]),
+        "engine": pick("Engine", facets["engine"]),
+        "size": pick("Input Size", facets["size"]),
+        "distribution": pick("Distribution", facets["distribution"]),
+        # Timings from different hosts are not comparable; default to one
+        "machine": st.sidebar.selectbox("Machine", facets["machine"]),
+    }
+    threshold = st.sidebar.slider(
+        "Regression Threshold", 1.05, 3.0, REGRESSION_THRESHOLD, 0.05
+    )
+
+    st.header("⏱️ Over Time")
+    trend = pd.DataFrame(point.as_row() for point in store.trend(**filters))
+    if trend.empty:
+        st.info("No results match these filters.")
+        return
+    trend["Series"] = series_labels(trend)
+    st.plotly_chart(
+        px.line(
+            trend,
+            x="Recorded",
+            y="Time (seconds)",
+            color="Series",
+            markers=True,
+            log_y=True,
+            hover_data=["Revision", "Steps", "Peak (KB)"],
+        ),
+        use_container_width=True,
+    )
+
+    st.header("🔀 Across Commits")
+    st.write("Best time per commit: the least noisy of the runs on each revision.")
+    revisions = pd.DataFrame(row.as_row() for row in store.by_revision(**filters))
+    revisions["Series"] = series_labels(revisions)
+    st.plotly_chart(
+        px.line(
+            revisions,
+            x="Revision",
+            y="Best Time (seconds)",
+            color="Series",
+            markers=True,
+            log_y=True,
+            hover_data=["Commit", "Committed", "Samples"],
+        ),
+        use_container_width=True,
+    )
+
+    st.header("🐢 Regressions")
+    regressions = store.regressions(threshold, **filters)
+    if regressions:
+        st.dataframe(pd.DataFrame(r.as_row() for r in regressions), hide_index=True)
+    else:
+        st.success(f"No slowdowns above {threshold:.2f}x between commits.")
+
+    if filters["algorithm"] is not None:
+        lines = pd.DataFrame(store.line_history(filters["algorithm"]))
+        if not lines.empty:
+            st.header("🔥 Line Profiles by Commit")
+            st.dataframe(
+                lines.pivot_table(
+                    index=["Line", "Source"],
+                    columns="Revision",
+                    values="Time (ms)",
+                    aggfunc="min",
+                )
+            )
+
+    with st.expander("Raw results"):
+        st.dataframe(trend.drop(columns="Series"), hide_index=True)
+
+
+if __name__ == "__main__":
+    main()